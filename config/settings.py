@@ -57,6 +57,14 @@ _DEFAULT_FEEDS = json.dumps(
 )
 
 RSS_FEEDS: list[dict] = json.loads(os.getenv("RSS_FEEDS_JSON", _DEFAULT_FEEDS))
+# Concurrent feed fetching (Z1): worker threads and per-feed wall-clock deadline.
+# FEED_FETCH_CONCURRENCY=1 reproduces the old one-feed-at-a-time behaviour.
+FEED_FETCH_CONCURRENCY: int = _env_int("FEED_FETCH_CONCURRENCY", 8)
+FEED_FETCH_DEADLINE_SEC: int = _env_int("FEED_FETCH_DEADLINE_SEC", 45)
+
+# Cross-run near-duplicate titles: titles saved within this many days are
+# matched (fuzz.ratio > 85) by dedup_items(). 0 disables the cross-run check.
+DEDUP_TITLE_WINDOW_DAYS: int = _env_int("DEDUP_TITLE_WINDOW_DAYS", 7)
 
 # ---------------------------------------------------------------------------
 # Filters
@@ -138,6 +146,16 @@ LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "none").strip().lower()
 LLM_BASE_URL: str = os.getenv("LLM_BASE_URL", "")
 LLM_API_KEY: str = os.getenv("LLM_API_KEY", "")
 LLM_MODEL: str = os.getenv("LLM_MODEL", "deepseek-chat")
+# Z2 concurrency: items processed in parallel by process_batch (1 = sequential),
+# and a per-provider cap on chat-completion requests per second (0 = no cap).
+LLM_CONCURRENCY: int = _env_int("LLM_CONCURRENCY", 4)
+LLM_RATE_LIMIT_RPS: float = _env_float("LLM_RATE_LIMIT_RPS", 0.0)
+# "separate": one LLM call per chain (A, B, C).  "fused": a single call returns
+# all three schemas; any missing section falls back to that chain's rules.
+LLM_CHAIN_MODE: str = os.getenv("LLM_CHAIN_MODE", "separate").strip().lower()
+# Chain B scoring: items per LLM prompt in process_batch (1 = one call per item).
+# Ignored in fused mode.
+LLM_SCORE_BATCH_SIZE: int = _env_int("LLM_SCORE_BATCH_SIZE", 1)
 
 # ---------------------------------------------------------------------------
 # Optional Sinks
@@ -3,20 +3,26 @@
 Router -> Chain A (extract/summary) -> Chain B (score) -> Chain C (card) -> merge -> gates.
 
 When LLM_PROVIDER=none, uses rule-based fallback for all chains.
+With LLM_CHAIN_MODE=fused, one LLM call returns all three schemas.
 """
 
 from __future__ import annotations
 
 import json
 import re
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
 from config import settings
 from schemas.models import MergedResult, RawItem, SchemaA, SchemaB, SchemaC
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from utils.keyword_matcher import KeywordMatcher
+from utils.llm_cache import get_llm_cache
+from utils.llm_client import chat_text, get_llm_client
 from utils.logger import get_logger
 from utils.text_clean import truncate
+from utils.text_features import text_features
 
 from core.entity_extraction import extract_entities
 
@@ -29,29 +35,78 @@ def _llm_available() -> bool:
     return settings.LLM_PROVIDER != "none" and bool(settings.LLM_BASE_URL) and bool(settings.LLM_API_KEY)
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=30),
-    retry=retry_if_exception_type((requests.RequestException, ConnectionError)),
-    reraise=True,
-)
-def _chat_completion(messages: list[dict], temperature: float = 0.3) -> str:
-    """Call OpenAI-compatible chat completions endpoint."""
+class _RateLimiter:
+    """Thread-safe request spacing: at most *rps* acquisitions per second."""
+
+    def __init__(self, rps: float) -> None:
+        self.interval = 1.0 / rps if rps > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_LIMITERS: dict[tuple[str, str, float], _RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def _provider_limiter() -> _RateLimiter:
+    """One limiter per (provider, endpoint, rate), shared by all worker threads."""
+    key = (settings.LLM_PROVIDER, settings.LLM_BASE_URL, float(settings.LLM_RATE_LIMIT_RPS))
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = _LIMITERS[key] = _RateLimiter(key[2])
+        return limiter
+
+
+def _post_chat_completion(url: str, payload: dict) -> str:
+    """POST via the shared pooled client (utils/llm_client); it retries transient failures."""
+    headers = {"Authorization": f"Bearer {settings.LLM_API_KEY}"}
+    _provider_limiter().acquire()
+    obj = get_llm_client().post_json(url, payload, headers=headers, timeout_s=60)
+    return chat_text(obj)
+
+
+def _chat_completion(
+    messages: list[dict],
+    temperature: float = 0.3,
+    validate: Callable[[str], bool] | None = None,
+) -> str:
+    """Call OpenAI-compatible chat completions endpoint.
+
+    Identical requests are answered from the persistent LLM response cache
+    (utils/llm_cache) when it is enabled.  A fresh reply is stored only when
+    *validate* (if given) accepts it, so replies that do not parse are asked
+    again on the next run instead of being replayed.
+    """
     url = settings.LLM_BASE_URL.rstrip("/") + "/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {settings.LLM_API_KEY}",
-        "Content-Type": "application/json",
-    }
     payload = {
         "model": settings.LLM_MODEL,
         "messages": messages,
         "temperature": temperature,
         "max_tokens": 2048,
     }
-    resp = requests.post(url, headers=headers, json=payload, timeout=60)
-    resp.raise_for_status()
-    data = resp.json()
-    return data["choices"][0]["message"]["content"]
+    cache = get_llm_cache()
+    if cache is None:
+        return _post_chat_completion(url, payload)
+    return cache.get_or_call(
+        lambda: _post_chat_completion(url, payload),
+        url,
+        settings.LLM_MODEL,
+        temperature,
+        messages,
+        validate=validate,
+        max_tokens=payload["max_tokens"],
+    )
 
 
 def _parse_json_from_llm(text: str) -> dict:
@@ -70,6 +125,15 @@ def _parse_json_from_llm(text: str) -> dict:
             return json.loads(match.group(1))
         except json.JSONDecodeError:
             pass
+    # Nested object starting at the first brace (e.g. fused A+B+C sections)
+    start = text.find("{")
+    if start >= 0:
+        try:
+            obj, _ = json.JSONDecoder().raw_decode(text, start)
+            if isinstance(obj, dict):
+                return obj
+        except json.JSONDecodeError:
+            pass
     # Last resort: find first { ... }
     match = re.search(r"\{[^{}]*\}", text, re.DOTALL)
     if match:
@@ -80,6 +144,40 @@ def _parse_json_from_llm(text: str) -> dict:
     return {}
 
 
+def _usable_object(raw: str, required: tuple[str, ...], build: Callable[[dict], object]) -> bool:
+    """Cache check: the reply holds a JSON object with one of *required* that *build* accepts."""
+    d = _parse_json_from_llm(raw)
+    if not any(d.get(k) for k in required):
+        return False
+    try:
+        build(dict(d))
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _parse_json_array_from_llm(text: str) -> list:
+    """Extract the first JSON array from LLM response text.
+
+    Also accepts an object wrapping the array (e.g. ``{"results": [...]}``).
+    Returns [] when nothing parses.
+    """
+    text = text.strip()
+    match = re.search(r"```(?:json)?\s*(.*?)\s*```", text, re.DOTALL)
+    if match:
+        text = match.group(1)
+    starts = [i for i in (text.find("["), text.find("{")) if i >= 0]
+    if not starts:
+        return []
+    try:
+        obj, _ = json.JSONDecoder().raw_decode(text, min(starts))
+    except json.JSONDecodeError:
+        return []
+    if isinstance(obj, dict):
+        obj = next((v for v in obj.values() if isinstance(v, list)), [])
+    return obj if isinstance(obj, list) else []
+
+
 # ---------------------------------------------------------------------------
 # Router (simple source/category mapping)
 # ---------------------------------------------------------------------------
@@ -275,6 +373,7 @@ _CATEGORY_KEYWORDS: dict[str, list[str]] = {
         "收購",
     ],
 }
+_CATEGORY_MATCHER = KeywordMatcher(_CATEGORY_KEYWORDS)
 
 
 def classify_content(title: str, body: str, source_category: str = "") -> tuple[str, float]:
@@ -282,13 +381,8 @@ def classify_content(title: str, body: str, source_category: str = "") -> tuple[
 
     Falls back to source_category mapping if no keyword match.
     """
-    text = (title + " " + body[:1000]).lower()
-
-    scores: dict[str, int] = {}
-    for cat_zh, keywords in _CATEGORY_KEYWORDS.items():
-        hits = sum(1 for kw in keywords if kw in text)
-        if hits > 0:
-            scores[cat_zh] = hits
+    counts = text_features(title + " " + body[:1000]).keyword_counts(_CATEGORY_MATCHER)
+    scores = {cat_zh: hits for cat_zh, hits in counts.items() if hits > 0}
 
     if scores:
         best_cat = max(scores, key=scores.get)  # type: ignore[arg-type]
@@ -339,7 +433,10 @@ def chain_a_llm(item: RawItem) -> SchemaA:
         body=truncate(item.body, 3000),
         item_id=item.item_id,
     )
-    raw = _chat_completion([{"role": "user", "content": prompt}])
+    raw = _chat_completion(
+        [{"role": "user", "content": prompt}],
+        validate=lambda r: _usable_object(r, ("title_zh", "summary_zh"), SchemaA.from_dict),
+    )
     d = _parse_json_from_llm(raw)
     d["item_id"] = item.item_id
     d["source_id"] = item.source_name
@@ -430,8 +527,15 @@ def chain_b_llm(item: RawItem, schema_a: SchemaA) -> SchemaB:
         source=item.source_name,
         item_id=item.item_id,
     )
-    raw = _chat_completion([{"role": "user", "content": prompt}])
+    raw = _chat_completion(
+        [{"role": "user", "content": prompt}],
+        validate=lambda r: _usable_object(r, _B_SCORE_KEYS, lambda d: _schema_b_from_llm(item, d)),
+    )
     d = _parse_json_from_llm(raw)
+    return _schema_b_from_llm(item, d)
+
+
+def _schema_b_from_llm(item: RawItem, d: dict) -> SchemaB:
     d["item_id"] = item.item_id
     # Ensure final_score is computed
     if not d.get("final_score"):
@@ -440,6 +544,114 @@ def chain_b_llm(item: RawItem, schema_a: SchemaA) -> SchemaB:
     return SchemaB.from_dict(d)
 
 
+# ---------------------------------------------------------------------------
+# Chain B – Batched scoring (LLM, several items per call)
+# ---------------------------------------------------------------------------
+
+_CHAIN_B_BATCH_PROMPT = """你是一位新聞品質評分專家。請對以下 {count} 則資訊逐一評分。
+
+{items}
+
+評分維度 (1-10):
+- novelty: 新穎度
+- utility: 實用性
+- heat: 熱度
+- feasibility: 可行性
+
+同時判斷:
+- dup_risk: 重複風險 (0-1)
+- is_ad: 是否為廣告
+- tags: 相關標籤
+
+請以嚴格的 JSON 陣列格式回傳，每則資訊一個物件，item_id 必須與上方完全一致，不要包含其他文字:
+[
+  {{
+    "item_id": "...",
+    "novelty": 0,
+    "utility": 0,
+    "heat": 0,
+    "feasibility": 0,
+    "final_score": 0,
+    "dup_risk": 0,
+    "is_ad": false,
+    "tags": ["tag1"]
+  }}
+]"""
+
+_B_SCORE_KEYS = ("novelty", "utility", "heat", "feasibility", "final_score")
+
+
+def chain_b_llm_batch(pairs: list[tuple[RawItem, SchemaA]]) -> dict[str, SchemaB]:
+    """Chain B for several items in one LLM call.
+
+    Returns a SchemaB per item_id the response scored; items that are missing
+    or malformed in the response are left out.  Transport / HTTP errors
+    propagate.
+    """
+    blocks = [
+        f"[{i}] item_id: {item.item_id}\n"
+        f"標題: {schema_a.title_zh or item.title}\n"
+        f"摘要: {truncate(schema_a.summary_zh, 500)}\n"
+        f"來源: {item.source_name}"
+        for i, (item, schema_a) in enumerate(pairs, 1)
+    ]
+    prompt = _CHAIN_B_BATCH_PROMPT.format(count=len(pairs), items="\n\n".join(blocks))
+    # Only a reply that scores every item is cached; a partial one is retried.
+    raw = _chat_completion(
+        [{"role": "user", "content": prompt}],
+        validate=lambda r: len(_batch_scores(r, pairs)) == len(pairs),
+    )
+    return _batch_scores(raw, pairs)
+
+
+def _batch_scores(raw: str, pairs: list[tuple[RawItem, SchemaA]]) -> dict[str, SchemaB]:
+    """SchemaB per item_id of *pairs* that the batch reply *raw* scored."""
+    wanted = {item.item_id: item for item, _ in pairs}
+    scored: dict[str, SchemaB] = {}
+    for entry in _parse_json_array_from_llm(raw):
+        if not isinstance(entry, dict):
+            continue
+        item = wanted.get(str(entry.get("item_id", "")))
+        if item is None or item.item_id in scored or not any(entry.get(k) for k in _B_SCORE_KEYS):
+            continue
+        try:
+            scored[item.item_id] = _schema_b_from_llm(item, dict(entry))
+        except (TypeError, ValueError):
+            continue
+    return scored
+
+
+def _score_batch(pairs: list[tuple[RawItem, SchemaA]]) -> dict[str, SchemaB]:
+    """chain_b_llm_batch with split-and-retry.
+
+    Items the response did not score are asked again — in two halves when
+    nothing parsed.  A lone leftover item is not scored here: process_item
+    runs the per-item Chain B for it.  A failed call falls back to rules for
+    the whole batch instead of multiplying requests to a failing provider.
+    """
+    if len(pairs) < 2:
+        return {}
+    log = get_logger()
+    try:
+        scored = chain_b_llm_batch(pairs)
+    except Exception as exc:
+        log.warning("Chain B batch LLM failed for %d items, using fallback: %s", len(pairs), exc)
+        return {item.item_id: chain_b_fallback(item, schema_a) for item, schema_a in pairs}
+
+    rest = [pair for pair in pairs if pair[0].item_id not in scored]
+    if not rest:
+        return scored
+    log.warning("Chain B batch: %d of %d items unscored, retrying", len(rest), len(pairs))
+    if len(rest) == len(pairs):
+        mid = len(rest) // 2
+        parts = [rest[:mid], rest[mid:]]
+    else:
+        parts = [rest]
+    for part in parts:
+        scored.update(_score_batch(part))
+    return scored
+
+
 # ---------------------------------------------------------------------------
 # Chain B – Fallback (rule-based scoring heuristics)
 # ---------------------------------------------------------------------------
@@ -460,6 +672,7 @@ _AD_KEYWORDS = {
     "立即购买",
     "exclusive deal",
 }
+_AD_MATCHER = KeywordMatcher(_AD_KEYWORDS)
 
 
 def chain_b_fallback(item: RawItem, schema_a: SchemaA) -> SchemaB:
@@ -467,7 +680,7 @@ def chain_b_fallback(item: RawItem, schema_a: SchemaA) -> SchemaB:
     body_lower = (item.body + " " + item.title).lower()
 
     # Ad detection
-    ad_hits = sum(1 for kw in _AD_KEYWORDS if kw in body_lower)
+    ad_hits = _AD_MATCHER.count(body_lower)
     is_ad = ad_hits >= 2
 
     # Novelty: longer body and more entities = higher novelty
@@ -543,7 +756,10 @@ def chain_c_llm(item: RawItem, schema_a: SchemaA, schema_b: SchemaB) -> SchemaC:
         url=item.url,
         item_id=item.item_id,
     )
-    raw = _chat_completion([{"role": "user", "content": prompt}])
+    raw = _chat_completion(
+        [{"role": "user", "content": prompt}],
+        validate=lambda r: _usable_object(r, ("card_md",), SchemaC.from_dict),
+    )
     d = _parse_json_from_llm(raw)
     d["item_id"] = item.item_id
     d["cta_url"] = item.url
@@ -582,20 +798,152 @@ def chain_c_fallback(item: RawItem, schema_a: SchemaA, schema_b: SchemaB) -> Sch
     )
 
 
+# ---------------------------------------------------------------------------
+# Fused Chain A+B+C (LLM, one call per item)
+# ---------------------------------------------------------------------------
+
+_FUSED_PROMPT = """你是一位專業的資訊分析助手兼新聞品質評分專家。請針對以下新聞一次完成三項任務。
+
+標題: {title}
+來源: {source} ({category})
+連結: {url}
+內容: {body}
+
+任務 a：提取關鍵資訊，生成繁體中文標題與 100-200 字的繁體中文摘要。
+任務 b：依任務 a 的摘要評分 (1-10)：novelty 新穎度、utility 實用性、heat 熱度、feasibility 可行性；
+        並判斷 dup_risk 重複風險 (0-1)、is_ad 是否為廣告、tags 相關標籤。
+任務 c：依任務 a、b 的結果生成飛書卡片訊息的 Markdown 內容。
+
+請以嚴格的 JSON 格式回傳，不要包含其他文字:
+{{
+  "a": {{
+    "title_zh": "繁體中文標題",
+    "summary_zh": "100-200字的繁體中文摘要",
+    "category": "分類",
+    "entities": ["實體1", "實體2"],
+    "key_points": ["要點1", "要點2", "要點3"],
+    "score_seed": 0
+  }},
+  "b": {{
+    "novelty": 0,
+    "utility": 0,
+    "heat": 0,
+    "feasibility": 0,
+    "final_score": 0,
+    "dup_risk": 0,
+    "is_ad": false,
+    "tags": ["tag1"]
+  }},
+  "c": {{
+    "card_md": "飛書 Markdown 格式的卡片內容",
+    "title": "卡片標題",
+    "brief": "30字內簡述"
+  }}
+}}"""
+
+
+def chain_abc_llm(item: RawItem) -> tuple[SchemaA | None, SchemaB | None, SchemaC | None]:
+    """Chains A, B and C in one LLM call.
+
+    Returns one schema per section; a section that is missing, empty or
+    malformed comes back as None so the caller can fall back for that chain
+    only.  Transport / HTTP errors propagate.
+    """
+    prompt = _FUSED_PROMPT.format(
+        title=item.title,
+        source=item.source_name,
+        category=route_item(item),
+        url=item.url,
+        body=truncate(item.body, 3000),
+    )
+    # Only a reply with all three sections is cached; a partial one is retried.
+    raw = _chat_completion(
+        [{"role": "user", "content": prompt}],
+        validate=lambda r: all(sec is not None for sec in _fused_sections(item, r)),
+    )
+    return _fused_sections(item, raw)
+
+
+def _fused_sections(item: RawItem, raw: str) -> tuple[SchemaA | None, SchemaB | None, SchemaC | None]:
+    """Schemas A, B and C parsed from a fused reply; None for a section that is unusable."""
+    d = _parse_json_from_llm(raw)
+
+    def _section(key: str, required: tuple[str, ...]) -> dict | None:
+        sec = d.get(key)
+        if not isinstance(sec, dict) or not any(sec.get(k) for k in required):
+            return None
+        return dict(sec)
+
+    schema_a = schema_b = schema_c = None
+    sec = _section("a", ("title_zh", "summary_zh"))
+    if sec is not None:
+        try:
+            sec["item_id"] = item.item_id
+            sec["source_id"] = item.source_name
+            schema_a = SchemaA.from_dict(sec)
+        except (TypeError, ValueError):
+            schema_a = None
+    sec = _section("b", _B_SCORE_KEYS)
+    if sec is not None:
+        try:
+            schema_b = _schema_b_from_llm(item, sec)
+        except (TypeError, ValueError):
+            schema_b = None
+    sec = _section("c", ("card_md",))
+    if sec is not None:
+        try:
+            sec["item_id"] = item.item_id
+            sec["cta_url"] = item.url
+            schema_c = SchemaC.from_dict(sec)
+        except (TypeError, ValueError):
+            schema_c = None
+    return schema_a, schema_b, schema_c
+
+
+def _fused_chains(item: RawItem) -> tuple[SchemaA | None, SchemaB | None, SchemaC | None]:
+    """chain_abc_llm that never raises; logs which sections need a fallback."""
+    log = get_logger()
+    try:
+        sections = chain_abc_llm(item)
+    except Exception as exc:
+        log.warning("Fused chain LLM failed for %s, using fallback: %s", item.item_id, exc)
+        return None, None, None
+    missing = [name for name, sec in zip("ABC", sections, strict=True) if sec is None]
+    if missing:
+        log.warning("Fused chain LLM missing section(s) %s for %s, using fallback", "/".join(missing), item.item_id)
+    return sections
+
+
 # ---------------------------------------------------------------------------
 # Pipeline: process a single item through A -> B -> C
 # ---------------------------------------------------------------------------
 
 
-def process_item(item: RawItem) -> MergedResult:
-    """Run all three chains on a single item, with LLM or fallback."""
+def process_item(
+    item: RawItem,
+    schema_a: SchemaA | None = None,
+    schema_b: SchemaB | None = None,
+) -> MergedResult:
+    """Run all three chains on a single item, with LLM or fallback.
+
+    *schema_a* / *schema_b*, when given, were already produced by
+    process_batch (batched Chain B scoring) and are used as-is.
+    """
     log = get_logger()
     use_llm = _llm_available()
 
     t0 = time.time()
     try:
+        fused = None
+        if use_llm and settings.LLM_CHAIN_MODE == "fused" and schema_a is None:
+            fused = _fused_chains(item)
+
         # Chain A
-        if use_llm:
+        if schema_a is not None:
+            pass
+        elif fused is not None:
+            schema_a = fused[0] or chain_a_fallback(item)
+        elif use_llm:
             try:
                 schema_a = chain_a_llm(item)
             except Exception as exc:
@@ -605,7 +953,11 @@ def process_item(item: RawItem) -> MergedResult:
             schema_a = chain_a_fallback(item)
 
         # Chain B
-        if use_llm:
+        if schema_b is not None:
+            pass
+        elif fused is not None:
+            schema_b = fused[1] or chain_b_fallback(item, schema_a)
+        elif use_llm:
             try:
                 schema_b = chain_b_llm(item, schema_a)
             except Exception as exc:
@@ -615,7 +967,9 @@ def process_item(item: RawItem) -> MergedResult:
             schema_b = chain_b_fallback(item, schema_a)
 
         # Chain C
-        if use_llm:
+        if fused is not None:
+            schema_c = fused[2] or chain_c_fallback(item, schema_a, schema_b)
+        elif use_llm:
             try:
                 schema_c = chain_c_llm(item, schema_a, schema_b)
             except Exception as exc:
@@ -662,9 +1016,89 @@ def process_item(item: RawItem) -> MergedResult:
         )
 
 
-def process_batch(items: list[RawItem]) -> list[MergedResult]:
-    """Process a batch of items. Per-item failure does not stop the batch."""
-    results: list[MergedResult] = []
-    for item in items:
-        results.append(process_item(item))
+def _batch_chain_a(item: RawItem) -> SchemaA | None:
+    """Chain A for the batched-scoring path; None if even the fallback fails."""
+    log = get_logger()
+    try:
+        try:
+            return chain_a_llm(item)
+        except Exception as exc:
+            log.warning("Chain A LLM failed for %s, using fallback: %s", item.item_id, exc)
+            return chain_a_fallback(item)
+    except Exception as exc:
+        log.error("Chain A failed for %s: %s", item.item_id, exc)
+        return None
+
+
+def _safe_score_batch(pairs: list[tuple[RawItem, SchemaA]]) -> dict[str, SchemaB]:
+    try:
+        return _score_batch(pairs)
+    except Exception as exc:
+        get_logger().error("Chain B batch failed for %d items: %s", len(pairs), exc)
+        return {}
+
+
+def _map(fn, seq: list, workers: int) -> list:
+    if workers == 1:
+        return [fn(x) for x in seq]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="z2-llm") as pool:
+        return list(pool.map(fn, seq))
+
+
+def _process_batch_scored(items: list[RawItem], workers: int, batch_size: int) -> list[MergedResult]:
+    """A for every item, then B on *batch_size* items per call, then C + gates."""
+    log = get_logger()
+    t0 = time.time()
+    schemas_a = _map(_batch_chain_a, items, workers)
+    pairs = [(item, sa) for item, sa in zip(items, schemas_a, strict=True) if sa is not None]
+    chunks = [pairs[i : i + batch_size] for i in range(0, len(pairs), batch_size)]
+    scored: dict[str, SchemaB] = {}
+    for part in _map(_safe_score_batch, chunks, max(1, min(workers, len(chunks)))):
+        scored.update(part)
+
+    def _finish(args: tuple[RawItem, SchemaA | None]) -> MergedResult:
+        item, sa = args
+        return process_item(item, schema_a=sa, schema_b=scored.get(item.item_id) if sa is not None else None)
+
+    results = _map(_finish, list(zip(items, schemas_a, strict=True)), workers)
+    log.info(
+        "Z2 batch: %d items, Chain B batched %d/%d in %d prompt(s) of up to %d, %d LLM workers in %.2fs",
+        len(items),
+        len(scored),
+        len(items),
+        len(chunks),
+        batch_size,
+        workers,
+        time.time() - t0,
+    )
+    return results
+
+
+def process_batch(items: list[RawItem], max_workers: int | None = None) -> list[MergedResult]:
+    """Process a batch of items. Per-item failure does not stop the batch.
+
+    With an LLM configured, items run on a pool of ``LLM_CONCURRENCY`` worker
+    threads, each taking one item through A -> B -> C.  Chains are therefore
+    pipelined across items (item N's Chain B overlaps item N+1's Chain A) while
+    ``LLM_RATE_LIMIT_RPS`` caps requests to the provider.  Results keep input
+    order.  Rule-based runs stay sequential: they are CPU-bound.
+
+    With ``LLM_SCORE_BATCH_SIZE`` > 1 (and separate chains), Chain A runs for
+    every item first, then Chain B scores up to that many items per prompt,
+    then Chain C and the gates run per item.
+    """
+    workers = settings.LLM_CONCURRENCY if max_workers is None else max_workers
+    workers = max(1, min(workers, len(items)))
+    use_llm = _llm_available()
+    batch_size = settings.LLM_SCORE_BATCH_SIZE
+    if use_llm and batch_size > 1 and len(items) > 1 and settings.LLM_CHAIN_MODE != "fused":
+        return _process_batch_scored(items, workers, batch_size)
+    if workers == 1 or not use_llm:
+        return [process_item(item) for item in items]
+
+    log = get_logger()
+    t0 = time.time()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="z2-llm") as pool:
+        results = list(pool.map(process_item, items))
+    log.info("Z2 batch: %d items on %d LLM workers in %.2fs", len(items), workers, time.time() - t0)
     return results
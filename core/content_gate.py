@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 import re
 from typing import Any
 
+from utils.text_features import text_features
+
 DEFAULT_MIN_KEEP_ITEMS = 12
 DEFAULT_MIN_KEEP_SIGNALS = 9
 
@@ -151,21 +153,19 @@ def _normalize(text: str) -> str:
 
 
 def _count_sentences(text: str) -> int:
-    parts = [p.strip() for p in _SENTENCE_SPLIT_RE.split(text) if p.strip()]
-    return len(parts)
+    return len(text_features(text).parts(_SENTENCE_SPLIT_RE))
 
 
 def density_score(text: str) -> int:
     """Score content density (0~100) for soft-pass fallback routing."""
-    content = _normalize(text)
-    if not content:
+    feats = text_features(text).stripped
+    if not feats.text:
         return 0
 
-    lowered = content.lower()
-    numeric_hits = len(_DENSITY_NUMERIC_RE.findall(content))
-    entity_hits = len(_DENSITY_ENTITY_RE.findall(content))
-    model_hint_hits = sum(1 for kw in _DENSITY_MODEL_HINTS if kw in lowered)
-    sentence_count = _count_sentences(content)
+    numeric_hits = feats.count(_DENSITY_NUMERIC_RE)
+    entity_hits = feats.count(_DENSITY_ENTITY_RE)
+    model_hint_hits = feats.keyword_hits(_DENSITY_MODEL_HINTS)
+    sentence_count = len(feats.parts(_SENTENCE_SPLIT_RE))
 
     score = 0
     score += min(40, numeric_hits * 12)
@@ -182,7 +182,7 @@ def _hard_reject_reason(content: str) -> str | None:
     Weak UI keywords: only reject when body is very short (< 300 chars),
     i.e., the page is a login-wall / subscribe-gate, not real content.
     """
-    lowered = content.lower()
+    lowered = text_features(content).lower
     for tok in _HARD_UI_TOKENS:
         if tok in lowered:
             return f"rejected_keyword:{tok}"
@@ -201,7 +201,7 @@ def _is_fragment_placeholder(content: str) -> bool:
     if not stripped:
         return True
 
-    lowered = stripped.lower()
+    lowered = text_features(stripped).lower
 
     if any(term in lowered for term in _FRAGMENT_TERMS):
         return True
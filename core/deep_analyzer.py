@@ -429,7 +429,11 @@ def _analyze_item_llm(r: MergedResult) -> ItemDeepDive:
         key_points="; ".join(a.key_points) if a.key_points else "無",
         mechanisms=", ".join(MECHANISMS),
     )
-    raw = _chat_completion([{"role": "user", "content": prompt}], temperature=0.4)
+    raw = _chat_completion(
+        [{"role": "user", "content": prompt}],
+        temperature=0.4,
+        validate=lambda r: bool(_parse_json_from_llm(r)),
+    )
     d = _parse_json_from_llm(raw)
 
     core_facts = d.get("core_facts", [])
@@ -819,7 +823,11 @@ def _meta_analysis_llm(results: list[MergedResult]) -> dict:
         )
 
     prompt = _META_ANALYSIS_PROMPT.format(items_summary="\n".join(summaries))
-    raw = _chat_completion([{"role": "user", "content": prompt}], temperature=0.4)
+    raw = _chat_completion(
+        [{"role": "user", "content": prompt}],
+        temperature=0.4,
+        validate=lambda r: bool(_parse_json_from_llm(r)),
+    )
     return _parse_json_from_llm(raw)
 
 
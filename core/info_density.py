@@ -7,6 +7,9 @@ from dataclasses import dataclass
 import re
 from typing import Any, Callable, Literal
 
+from utils.keyword_matcher import KeywordMatcher
+from utils.text_features import text_features
+
 try:
     from config import settings as _settings
 except Exception:  # pragma: no cover - fallback for isolated tests
@@ -72,6 +75,7 @@ BOILERPLATE_KEYWORDS = _csv_set(
     getattr(_settings, "INFO_DENSITY_BOILERPLATE_KEYWORDS", None),
     _DEFAULT_BOILERPLATE_KEYWORDS,
 )
+_KEYWORD_MATCHER = KeywordMatcher({"entity": ENTITY_KEYWORDS, "boilerplate": BOILERPLATE_KEYWORDS})
 
 
 @dataclass(frozen=True)
@@ -134,28 +138,27 @@ def _threshold(kind: DensityKind) -> DensityGateThreshold:
 
 
 def _normalize(text: str) -> str:
-    return re.sub(r"\s+", " ", text or "").strip()
+    return text_features(text).collapsed.text
 
 
 def _sentence_parts(text: str) -> list[str]:
-    return [p.strip() for p in _SENTENCE_SPLIT_RE.split(text) if p.strip()]
+    return text_features(text).parts(_SENTENCE_SPLIT_RE)
 
 
 def _entity_hits(text: str) -> int:
-    lowered = text.lower()
-    keyword_hits = sum(1 for kw in ENTITY_KEYWORDS if kw in lowered)
-    token_hits = len(set(_ENTITY_TOKEN_RE.findall(text)))
-    mixed_hits = len(set(_MIXED_PROPER_NOUN_RE.findall(text)))
+    feats = text_features(text)
+    keyword_hits = feats.keyword_counts(_KEYWORD_MATCHER)["entity"]
+    token_hits = len(set(feats.findall(_ENTITY_TOKEN_RE)))
+    mixed_hits = len(set(feats.findall(_MIXED_PROPER_NOUN_RE)))
     return keyword_hits + token_hits + mixed_hits
 
 
 def _numeric_hits(text: str) -> int:
-    return len(_NUMERIC_RE.findall(text))
+    return text_features(text).count(_NUMERIC_RE)
 
 
 def _boilerplate_hits(text: str) -> int:
-    lowered = text.lower()
-    return sum(1 for kw in BOILERPLATE_KEYWORDS if kw in lowered)
+    return text_features(text).keyword_counts(_KEYWORD_MATCHER)["boilerplate"]
 
 
 def _fragment_penalty(text: str, sentences: list[str]) -> int:
@@ -170,8 +173,7 @@ def _fragment_penalty(text: str, sentences: list[str]) -> int:
     return min(penalty, 2)
 
 
-def info_density_breakdown(text: str) -> InfoDensityBreakdown:
-    normalized = _normalize(text)
+def _compute_breakdown(normalized: str) -> InfoDensityBreakdown:
     if not normalized:
         return InfoDensityBreakdown(
             entity_hits=0,
@@ -207,6 +209,13 @@ def info_density_breakdown(text: str) -> InfoDensityBreakdown:
     )
 
 
+def info_density_breakdown(text: str) -> InfoDensityBreakdown:
+    # The breakdown does not depend on the density kind, so it is computed once
+    # per text and shared by the event / signal / corp gates.
+    feats = text_features(text).collapsed
+    return feats.memo("info_density.breakdown", _compute_breakdown)
+
+
 def density_gate_reason(
     breakdown: InfoDensityBreakdown,
     kind: DensityKind,
@@ -6,21 +6,29 @@ Fetch RSS -> clean -> normalize -> dedup -> filter -> batch.
 from __future__ import annotations
 
 import re
+import threading
 import time
 from collections.abc import Generator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from email.utils import parsedate_to_datetime as _rss_parsedate  # Fix-2: stdlib RFC-2822 fallback
+from pathlib import Path
+from urllib.parse import urlparse
 
 import feedparser
 import requests
 from config import settings
 from core.content_gate import apply_split_content_gate
+from core.storage import load_recent_titles
 from langdetect import LangDetectException, detect
-from rapidfuzz import fuzz
+from requests.adapters import HTTPAdapter
 from schemas.models import RawItem
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, stop_after_delay, wait_exponential
+from utils.dedupe import TitleIndex, title_length_window
 from utils.hashing import url_hash
+from utils.http_cache import get_http_cache
+from utils.keyword_matcher import keyword_matcher
 from utils.logger import get_logger
 from utils.text_clean import normalize_whitespace, strip_html
 
@@ -51,21 +59,88 @@ def _is_tier_a_feed(feed_cfg: dict) -> bool:
     return bool(_TIER_A_SOURCE_RE.search(blob) or _TIER_A_URL_RE.search(url))
 
 
+# One keep-alive session per host, shared by every worker thread.  urllib3's
+# connection pool is thread-safe, so concurrent feeds on the same host reuse
+# sockets instead of re-doing the TCP/TLS handshake per request.
+_SESSIONS: dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+# Set on feed worker threads by _fetch_feeds_concurrently.  Once that run has
+# returned, a worker still busy with an abandoned feed must not open sessions:
+# they would be created after close_feed_sessions() and never closed.
+_feed_worker = threading.local()
+
+
+def _session_for(url: str) -> requests.Session:
+    """Return the shared keep-alive session for *url*'s host."""
+    run_over = getattr(_feed_worker, "run_over", None)
+    if run_over is not None and run_over.is_set():
+        raise RuntimeError("feed fetch abandoned after its deadline")
+    host = urlparse(url).netloc.lower()
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(host)
+        if session is None:
+            session = requests.Session()
+            session.headers["User-Agent"] = "AI-Intel-Scraper/1.0"
+            pool = max(1, settings.FEED_FETCH_CONCURRENCY)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSIONS[host] = session
+        return session
+
+
+def close_feed_sessions() -> None:
+    """Close and forget all pooled per-host sessions."""
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+
+_BACKOFF = wait_exponential(multiplier=1, min=2, max=30)
+
+
 @retry(
     stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=30),
+    wait=_BACKOFF,
     retry=retry_if_exception_type((requests.RequestException, ConnectionError)),
     reraise=True,
 )
-def _fetch_feed_text(url: str, timeout: int = 30) -> str:
-    """Download raw RSS/Atom XML with retries."""
-    resp = requests.get(url, timeout=timeout, headers={"User-Agent": "AI-Intel-Scraper/1.0"})
+def _fetch_feed_text(url: str, timeout: float = 30) -> str:
+    """Download raw RSS/Atom XML with retries over the pooled host session.
+
+    Sends conditional-GET validators from the HTTP cache; a 304 reply returns
+    the stored body so the feed is re-parsed without re-downloading it.  If
+    the entry is gone by then, the feed is fetched again without validators.
+    """
+    cache = get_http_cache()
+    headers = cache.conditional_headers(url) if cache else {}
+    resp = _session_for(url).get(url, timeout=timeout, headers=headers)
+    if resp.status_code == 304 and cache:
+        cached = cache.not_modified(url)
+        if cached is not None:
+            return cached.text()
+        resp = _session_for(url).get(url, timeout=timeout)
     resp.raise_for_status()
+    if cache:
+        cache.record_miss()
+        cache.store(
+            url,
+            resp.headers.get("ETag"),
+            resp.headers.get("Last-Modified"),
+            resp.content,
+            charset=resp.encoding or "",
+        )
     return resp.text
 
 
-def fetch_feed(feed_cfg: dict) -> list[RawItem]:
-    """Fetch a single RSS feed and return normalized RawItems."""
+def fetch_feed(feed_cfg: dict, deadline_s: float | None = None) -> list[RawItem]:
+    """Fetch a single RSS feed and return normalized RawItems.
+
+    When *deadline_s* is given, retries stop once that much wall time has been
+    spent on this feed and each request timeout is capped to the deadline.
+    """
     log = get_logger()
     url = feed_cfg["url"]
     name = feed_cfg.get("name", url)
@@ -74,7 +149,21 @@ def fetch_feed(feed_cfg: dict) -> list[RawItem]:
 
     t0 = time.time()
     try:
-        xml = _fetch_feed_text(url)
+        if deadline_s:
+            # Every attempt and back-off sleep fits in what is left of the
+            # deadline, so the worker itself ends on time.
+            ends_at = time.monotonic() + deadline_s
+
+            def _remaining() -> float:
+                return ends_at - time.monotonic()
+
+            retrying = _fetch_feed_text.retry.copy(
+                stop=stop_after_attempt(3) | stop_after_delay(deadline_s),
+                wait=lambda state: max(0.0, min(_BACKOFF(state), _remaining() - 1)),
+            )
+            xml = retrying(lambda: _fetch_feed_text.__wrapped__(url, timeout=max(1.0, min(30.0, _remaining()))))
+        else:
+            xml = _fetch_feed_text(url)
     except Exception as exc:
         log.error("Failed to fetch feed %s: %s", name, exc)
         return []
@@ -135,6 +224,63 @@ def fetch_feed(feed_cfg: dict) -> list[RawItem]:
     return items
 
 
+_DEADLINE_GRACE_S = 2.0
+
+
+def _fetch_feeds_concurrently(feeds: list[dict]) -> list[list[RawItem]]:
+    """Fetch *feeds* on a bounded thread pool; results keep the input order.
+
+    One pool of ``FEED_FETCH_CONCURRENCY`` workers takes feeds from its queue
+    as workers free up.  Each feed is waited on for ``FEED_FETCH_DEADLINE_SEC``
+    (plus a short grace) from the moment it starts, so a slow feed only holds
+    its own worker.  A feed still running at that point is reported as empty
+    (failed); ``fetch_feed`` bounds its own retries by the same deadline, so
+    the straggler ends shortly after.  It is not joined, but once this returns
+    it can no longer open pooled sessions.
+    """
+    log = get_logger()
+    if not feeds:
+        return []
+    workers = max(1, min(settings.FEED_FETCH_CONCURRENCY, len(feeds)))
+    deadline_s = max(1, settings.FEED_FETCH_DEADLINE_SEC)
+    limit_s = deadline_s + _DEADLINE_GRACE_S
+    run_over = threading.Event()
+    started: dict[int, float] = {}
+
+    def _run(idx: int) -> list[RawItem]:
+        _feed_worker.run_over = run_over
+        started[idx] = time.monotonic()
+        return fetch_feed(feeds[idx], deadline_s)
+
+    t0 = time.time()
+    results: list[list[RawItem]] = [[] for _ in feeds]
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="feed")
+    try:
+        futures = {executor.submit(_run, idx): idx for idx in range(len(feeds))}
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            for fut in [f for f in pending if futures[f] in started and not f.done()]:
+                if now - started[futures[fut]] >= limit_s:
+                    pending.discard(fut)
+                    log.error("Feed %s exceeded deadline (%ds)", feeds[futures[fut]].get("name", ""), deadline_s)
+            ends = [started[futures[f]] + limit_s for f in pending if futures[f] in started]
+            timeout = max(0.0, min(ends) - now) if ends else limit_s
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for fut in done:
+                pending.discard(fut)
+                try:
+                    results[futures[fut]] = fut.result()
+                except Exception as exc:
+                    log.error("Feed worker failed for %s: %s", feeds[futures[fut]].get("name", ""), exc)
+    finally:
+        run_over.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    log.info("Fetched %d feeds with %d workers in %.2fs", len(feeds), workers, time.time() - t0)
+    return results
+
+
 def fetch_all_feeds() -> list[RawItem]:
     """Fetch all configured feeds and combine results."""
     from utils.article_fetch import enrich_items_async
@@ -145,15 +291,21 @@ def fetch_all_feeds() -> list[RawItem]:
     rss_failed = 0
     tier_a_feeds = 0
     _feed_source_counts: list[dict] = []
+    _http_cache = get_http_cache()
+    if _http_cache:
+        _http_cache.reset_stats()
     _ordered_feeds = sorted(
         list(settings.RSS_FEEDS),
         key=lambda cfg: (0 if _is_tier_a_feed(cfg) else 1, str(cfg.get("name", "") or "").lower()),
     )
-    for feed_cfg in _ordered_feeds:
+    try:
+        _feed_results = _fetch_feeds_concurrently(_ordered_feeds)
+    finally:
+        close_feed_sessions()
+    for feed_cfg, items in zip(_ordered_feeds, _feed_results, strict=True):
         _tier_a = _is_tier_a_feed(feed_cfg)
         if _tier_a:
             tier_a_feeds += 1
-        items = fetch_feed(feed_cfg)
         rss_items.extend(items)
         _feed_source_counts.append({
             "name": feed_cfg.get("name", ""),
@@ -180,6 +332,7 @@ def fetch_all_feeds() -> list[RawItem]:
                     "total_from_rss": len(rss_items),
                     "tier_a_feeds": tier_a_feeds,
                     "tier_a_ratio": round(tier_a_feeds / max(1, len(_ordered_feeds)), 3),
+                    "http_cache": _http_cache.stats() if _http_cache else {"hits": 0, "misses": 0},
                 },
                 ensure_ascii=False,
                 indent=2,
@@ -223,6 +376,10 @@ def fetch_all_feeds() -> list[RawItem]:
     except Exception as _hydr_exc:
         log = get_logger()
         log.warning("Fulltext hydration batch failed (non-fatal): %s", _hydr_exc)
+    finally:
+        # Enrichment and hydration share one session + response memo; drop both.
+        from utils.http_fetch import release_fetch_layer
+        release_fetch_layer()
 
     return enriched
 
@@ -232,34 +389,54 @@ def fetch_all_feeds() -> list[RawItem]:
 # ---------------------------------------------------------------------------
 
 
-def dedup_items(items: list[RawItem], existing_ids: set[str] | None = None) -> list[RawItem]:
-    """Remove duplicates by URL hash + fuzzy title similarity."""
+def dedup_items(
+    items: list[RawItem],
+    existing_ids: set[str] | None = None,
+    db_path: Path | None = None,
+) -> list[RawItem]:
+    """Remove duplicates by URL hash + fuzzy title similarity.
+
+    Titles go through a length-bucketed ``TitleIndex`` that makes the same
+    ``fuzz.ratio > 85`` decisions as comparing against every kept title.  With
+    *db_path*, titles saved within ``DEDUP_TITLE_WINDOW_DAYS`` are matched too.
+    """
     log = get_logger()
     existing_ids = existing_ids or set()
     seen_ids: set[str] = set(existing_ids)
-    seen_titles: list[str] = []
+    index = TitleIndex(threshold=85.0)
     result: list[RawItem] = []
 
+    history: set[str] = set()
+    if db_path is not None and settings.DEDUP_TITLE_WINDOW_DAYS > 0:
+        lengths: set[int] = set()
+        for item in items:
+            lengths.update(title_length_window(len(item.title)))
+        # Stored titles are seeded first so they match like earlier batch items.
+        for title in load_recent_titles(db_path, lengths, settings.DEDUP_TITLE_WINDOW_DAYS):
+            index.add(title)
+            history.add(title)
+
+    cross_run = 0
     for item in items:
         # Exact URL dedup
         if item.item_id in seen_ids:
             continue
         # Fuzzy title dedup (threshold 85)
-        is_dup = False
-        for prev_title in seen_titles:
-            if fuzz.ratio(item.title, prev_title) > 85:
-                is_dup = True
-                break
-        if is_dup:
+        match = index.find(item.title)
+        if match is not None:
+            if match in history:
+                cross_run += 1
             continue
 
         seen_ids.add(item.item_id)
-        seen_titles.append(item.title)
+        index.add(item.title)
         result.append(item)
 
     removed = len(items) - len(result)
     if removed:
         log.info("Dedup removed %d items, %d remaining", removed, len(result))
+    if cross_run:
+        log.info("Dedup: %d near-duplicate titles matched earlier runs", cross_run)
     return result
 
 
@@ -347,7 +524,7 @@ def filter_items(items: list[RawItem]) -> tuple[list[RawItem], FilterSummary]:
         # Keyword filter (if configured, at least one keyword must appear)
         if settings.KEYWORD_FILTER:
             combined = (item.title + " " + item.body).lower()
-            if not any(kw.lower() in combined for kw in settings.KEYWORD_FILTER):
+            if not keyword_matcher(tuple(kw.lower() for kw in settings.KEYWORD_FILTER)).any(combined):
                 summary.dropped_by_reason["keyword_mismatch"] = summary.dropped_by_reason.get("keyword_mismatch", 0) + 1
                 continue
 
@@ -265,6 +265,7 @@ def fetch_all_news() -> list[RawItem]:
     離線模式下回傳空清單（由呼叫端處理降級邏輯）。
     """
     from utils.article_fetch import enrich_items_async
+    from utils.http_fetch import release_fetch_layer
     from utils.metrics import get_collector
 
     log = get_logger()
@@ -276,4 +277,7 @@ def fetch_all_news() -> list[RawItem]:
     log.info("所有來源合計抓取：%d 筆", len(items))
 
     collector = get_collector()
-    return enrich_items_async(items, stats=collector.enrich_stats)
+    try:
+        return enrich_items_async(items, stats=collector.enrich_stats)
+    finally:
+        release_fetch_layer()
@@ -1,13 +1,20 @@
 """Z3 – SQLite persistence.
 
-Tables: items, ai_results, dedup_cache.
+Tables: items, ai_results, dedup_cache, title_index.
+
+Schema changes after the initial ``_DDL`` live in ``_MIGRATIONS`` and are
+applied by ``init_db`` in order, tracked with ``PRAGMA user_version``.
 """
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import json
 import sqlite3
-from datetime import UTC, datetime
+import threading
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 from schemas.models import MergedResult, RawItem
@@ -46,18 +53,95 @@ CREATE TABLE IF NOT EXISTS dedup_cache (
     url         TEXT,
     seen_at     TEXT NOT NULL
 );
+
+-- Full titles bucketed by length, for cross-run near-duplicate checks
+CREATE TABLE IF NOT EXISTS title_index (
+    item_id     TEXT PRIMARY KEY,
+    title       TEXT NOT NULL,
+    title_len   INTEGER NOT NULL,
+    seen_at     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_title_index_len ON title_index (title_len, seen_at);
+
+-- One-time backfill for databases created before title_index existed
+INSERT OR IGNORE INTO title_index (item_id, title, title_len, seen_at)
+SELECT item_id, title, length(title), created_at FROM items
+WHERE NOT EXISTS (SELECT 1 FROM title_index);
 """
 
 
+# Append-only: entry N upgrades a database from user_version N to N + 1.
+_MIGRATIONS: list[str] = [
+    # 1 — secondary indexes for history queries (query_results / query_items)
+    """
+    CREATE INDEX IF NOT EXISTS idx_ai_results_gate_created ON ai_results (passed_gate, created_at, item_id);
+    CREATE INDEX IF NOT EXISTS idx_ai_results_created ON ai_results (created_at);
+    CREATE INDEX IF NOT EXISTS idx_items_source_published ON items (source_name, published_at);
+    CREATE INDEX IF NOT EXISTS idx_items_category_published ON items (source_category, published_at);
+    CREATE INDEX IF NOT EXISTS idx_items_published ON items (published_at);
+    """,
+]
+
+
 def init_db(db_path: Path) -> None:
-    """Create database tables if they don't exist."""
+    """Create database tables if they don't exist and apply pending migrations."""
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path))
-    try:
+    conn = get_connection(db_path)
+    with _POOL_LOCK:
         conn.executescript(_DDL)
         conn.commit()
-    finally:
-        conn.close()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        for number, script in enumerate(_MIGRATIONS[version:], start=version + 1):
+            conn.executescript(script)
+            conn.execute(f"PRAGMA user_version = {number}")
+            conn.commit()
+
+
+# ---------------------------------------------------------------------------
+# Connection pool
+# ---------------------------------------------------------------------------
+
+# One long-lived connection per database file for the whole run.  Every
+# storage call goes through it, so pragmas are applied once and sqlite3's
+# statement cache keeps the INSERTs prepared across calls.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",  # WAL + NORMAL: durable across app crashes, fsync on checkpoint
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+)
+_POOL: dict[str, sqlite3.Connection] = {}
+_POOL_LOCK = threading.RLock()
+
+
+def get_connection(db_path: Path) -> sqlite3.Connection:
+    """Return the run's pooled SQLite connection for *db_path* (WAL mode).
+
+    The connection is shared; callers must not close it (see
+    ``close_connections``).
+    """
+    key = str(Path(db_path).resolve())
+    with _POOL_LOCK:
+        conn = _POOL.get(key)
+        if conn is None:
+            conn = sqlite3.connect(key, check_same_thread=False, cached_statements=256)
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
+            conn.row_factory = sqlite3.Row
+            _POOL[key] = conn
+        return conn
+
+
+def close_connections() -> None:
+    """Close every pooled connection (end of run / tests)."""
+    with _POOL_LOCK:
+        for conn in _POOL.values():
+            with contextlib.suppress(sqlite3.Error):
+                conn.close()
+        _POOL.clear()
+
+
+atexit.register(close_connections)
 
 
 # ---------------------------------------------------------------------------
@@ -65,129 +149,289 @@ def init_db(db_path: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
+# Bound parameters per IN (...) probe; below SQLite's historical 999 limit.
+_IN_CHUNK = 500
+
+
 def _now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
-def get_connection(db_path: Path) -> sqlite3.Connection:
-    """Get a SQLite connection with WAL mode for concurrency."""
-    conn = sqlite3.connect(str(db_path))
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.row_factory = sqlite3.Row
-    return conn
+def get_existing_item_ids(db_path: Path, candidate_ids: Iterable[str] | None = None) -> set[str]:
+    """Return item_ids already in the database (for dedup).
 
+    With *candidate_ids*, only those IDs are probed (batched primary-key
+    ``IN`` lookups), so memory and latency depend on the batch size rather
+    than on the whole dedup history.  Without it, every stored ID is returned.
+    """
+    conn = get_connection(db_path)
+    with _POOL_LOCK:
+        if candidate_ids is None:
+            rows = conn.execute("SELECT item_id FROM dedup_cache").fetchall()
+            return {r["item_id"] for r in rows}
+        wanted = sorted(set(candidate_ids))
+        found: set[str] = set()
+        for start in range(0, len(wanted), _IN_CHUNK):
+            chunk = wanted[start : start + _IN_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            rows = conn.execute(f"SELECT item_id FROM dedup_cache WHERE item_id IN ({marks})", chunk).fetchall()
+            found.update(r["item_id"] for r in rows)
+        return found
 
-def get_existing_item_ids(db_path: Path) -> set[str]:
-    """Return all item_ids already in the database (for dedup)."""
+
+def load_recent_titles(db_path: Path, lengths: set[int], window_days: int) -> list[str]:
+    """Return titles seen within *window_days* whose length is in *lengths*.
+
+    Only the length buckets a batch can match are read (indexed on title_len),
+    so cross-run near-duplicate checks do not reload every stored title.
+    """
+    if not lengths or not db_path.exists():
+        return []
+    since = (datetime.now(UTC) - timedelta(days=window_days)).isoformat()
+    wanted = sorted(lengths)
+    titles: list[str] = []
     conn = get_connection(db_path)
     try:
-        rows = conn.execute("SELECT item_id FROM dedup_cache").fetchall()
-        return {r["item_id"] for r in rows}
-    finally:
-        conn.close()
+        with _POOL_LOCK:
+            for start in range(0, len(wanted), _IN_CHUNK):
+                chunk = wanted[start : start + _IN_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT title FROM title_index WHERE title_len IN ({marks}) AND seen_at >= ?",
+                    (*chunk, since),
+                ).fetchall()
+                titles.extend(r["title"] for r in rows)
+    except sqlite3.OperationalError:
+        return []
+    return titles
+
+
+_INSERT_ITEM = """INSERT OR IGNORE INTO items
+    (item_id, title, url, body, published_at, source_name, source_category, lang, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_INSERT_DEDUP = """INSERT OR IGNORE INTO dedup_cache (item_id, title_hash, url, seen_at)
+    VALUES (?, ?, ?, ?)"""
+_INSERT_TITLE = """INSERT OR IGNORE INTO title_index (item_id, title, title_len, seen_at)
+    VALUES (?, ?, ?, ?)"""
+_UPSERT_RESULT = """INSERT OR REPLACE INTO ai_results
+    (item_id, schema_a, schema_b, schema_c, passed_gate, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)"""
 
 
 def save_items(db_path: Path, items: list[RawItem]) -> int:
-    """Insert raw items into the items table. Returns count of new inserts."""
+    """Insert raw items into the items table. Returns count of new inserts.
+
+    All rows are written with ``executemany`` in one transaction; items whose
+    item_id is already stored are ignored and not counted.
+    """
     log = get_logger()
     conn = get_connection(db_path)
     now = _now_iso()
-    inserted = 0
-    try:
-        for item in items:
-            try:
-                conn.execute(
-                    """INSERT OR IGNORE INTO items
-                       (item_id, title, url, body, published_at, source_name, source_category, lang, created_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        item.item_id,
-                        item.title,
-                        item.url,
-                        item.body,
-                        item.published_at,
-                        item.source_name,
-                        item.source_category,
-                        item.lang,
-                        now,
-                    ),
-                )
-                # Also update dedup_cache
-                conn.execute(
-                    """INSERT OR IGNORE INTO dedup_cache (item_id, title_hash, url, seen_at)
-                       VALUES (?, ?, ?, ?)""",
-                    (item.item_id, item.title[:100], item.url, now),
-                )
-                inserted += 1
-            except sqlite3.IntegrityError:
-                pass
-        conn.commit()
-    finally:
-        conn.close()
-    log.info("Saved %d raw items to DB", inserted)
+    item_rows = [
+        (
+            item.item_id,
+            item.title,
+            item.url,
+            item.body,
+            item.published_at,
+            item.source_name,
+            item.source_category,
+            item.lang,
+            now,
+        )
+        for item in items
+    ]
+    with _POOL_LOCK, conn:
+        inserted = conn.executemany(_INSERT_ITEM, item_rows).rowcount
+        # Also update dedup_cache + title_index
+        conn.executemany(_INSERT_DEDUP, [(item.item_id, item.title[:100], item.url, now) for item in items])
+        conn.executemany(_INSERT_TITLE, [(item.item_id, item.title, len(item.title), now) for item in items])
+    inserted = max(0, inserted)
+    log.info("Saved %d raw items to DB (%d already stored)", inserted, len(items) - inserted)
     return inserted
 
 
 def save_results(db_path: Path, results: list[MergedResult]) -> int:
-    """Insert AI results into the ai_results table. Returns count."""
+    """Insert AI results into the ai_results table (one transaction). Returns count."""
     log = get_logger()
     conn = get_connection(db_path)
     now = _now_iso()
-    saved = 0
-    try:
-        for r in results:
-            try:
-                conn.execute(
-                    """INSERT OR REPLACE INTO ai_results
-                       (item_id, schema_a, schema_b, schema_c, passed_gate, created_at)
-                       VALUES (?, ?, ?, ?, ?, ?)""",
-                    (
-                        r.item_id,
-                        json.dumps(r.schema_a.to_dict(), ensure_ascii=False),
-                        json.dumps(r.schema_b.to_dict(), ensure_ascii=False),
-                        json.dumps(r.schema_c.to_dict(), ensure_ascii=False),
-                        1 if r.passed_gate else 0,
-                        now,
-                    ),
+    rows = []
+    for r in results:
+        try:
+            rows.append(
+                (
+                    r.item_id,
+                    json.dumps(r.schema_a.to_dict(), ensure_ascii=False),
+                    json.dumps(r.schema_b.to_dict(), ensure_ascii=False),
+                    json.dumps(r.schema_c.to_dict(), ensure_ascii=False),
+                    1 if r.passed_gate else 0,
+                    now,
                 )
-                saved += 1
-            except Exception as exc:
-                log.error("Failed to save result %s: %s", r.item_id, exc)
-        conn.commit()
-    finally:
-        conn.close()
+            )
+        except Exception as exc:
+            log.error("Failed to save result %s: %s", r.item_id, exc)
+    saved = 0
+    if rows:
+        with _POOL_LOCK, conn:
+            conn.executemany(_UPSERT_RESULT, rows)
+        saved = len(rows)
     log.info("Saved %d AI results to DB", saved)
     return saved
 
 
+def _iso(value: datetime | str | None) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).isoformat()
+
+
+def _decode_result_row(row: sqlite3.Row) -> dict:
+    return {
+        "item_id": row["item_id"],
+        "schema_a": json.loads(row["schema_a"]) if row["schema_a"] else {},
+        "schema_b": json.loads(row["schema_b"]) if row["schema_b"] else {},
+        "schema_c": json.loads(row["schema_c"]) if row["schema_c"] else {},
+        "created_at": row["created_at"],
+        "title": row["title"],
+        "url": row["url"],
+        "source_name": row["source_name"],
+        "source_category": row["source_category"],
+        "published_at": row["published_at"],
+        "passed_gate": bool(row["passed_gate"]),
+    }
+
+
+def query_results(
+    db_path: Path,
+    *,
+    since: datetime | str | None = None,
+    until: datetime | str | None = None,
+    source: str | None = None,
+    category: str | None = None,
+    passed_only: bool = True,
+    limit: int | None = 50,
+) -> list[dict]:
+    """Return AI results joined with their items, newest ``created_at`` first.
+
+    ``since`` / ``until`` bound ``ai_results.created_at`` (inclusive /
+    exclusive); datetimes are compared in UTC.  ``source`` / ``category``
+    match ``items.source_name`` / ``items.source_category`` exactly.
+    """
+    where: list[str] = []
+    params: list = []
+    if passed_only:
+        where.append("r.passed_gate = 1")
+    if since is not None:
+        where.append("r.created_at >= ?")
+        params.append(_iso(since))
+    if until is not None:
+        where.append("r.created_at < ?")
+        params.append(_iso(until))
+    if source is not None:
+        where.append("i.source_name = ?")
+        params.append(source)
+    if category is not None:
+        where.append("i.source_category = ?")
+        params.append(category)
+    sql = (
+        "SELECT r.item_id, r.schema_a, r.schema_b, r.schema_c, r.passed_gate, r.created_at,"
+        " i.title, i.url, i.source_name, i.source_category, i.published_at"
+        " FROM ai_results r JOIN items i ON r.item_id = i.item_id"
+    )
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY r.created_at DESC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    conn = get_connection(db_path)
+    with _POOL_LOCK:
+        rows = conn.execute(sql, params).fetchall()
+    return [_decode_result_row(row) for row in rows]
+
+
+def count_results_by_source(
+    db_path: Path,
+    *,
+    since: datetime | str | None = None,
+    until: datetime | str | None = None,
+    passed_only: bool = True,
+) -> dict[str, int]:
+    """Return ``{source_name: result count}`` for results in the time range."""
+    where: list[str] = []
+    params: list = []
+    if passed_only:
+        where.append("r.passed_gate = 1")
+    if since is not None:
+        where.append("r.created_at >= ?")
+        params.append(_iso(since))
+    if until is not None:
+        where.append("r.created_at < ?")
+        params.append(_iso(until))
+    sql = "SELECT i.source_name AS source, COUNT(*) AS n FROM ai_results r JOIN items i ON r.item_id = i.item_id"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " GROUP BY i.source_name ORDER BY n DESC"
+    conn = get_connection(db_path)
+    with _POOL_LOCK:
+        rows = conn.execute(sql, params).fetchall()
+    return {row["source"] or "": row["n"] for row in rows}
+
+
+def query_items(
+    db_path: Path,
+    *,
+    published_since: datetime | str | None = None,
+    published_until: datetime | str | None = None,
+    source: str | None = None,
+    category: str | None = None,
+    limit: int | None = None,
+) -> list[dict]:
+    """Return stored raw items, newest ``published_at`` first."""
+    where: list[str] = []
+    params: list = []
+    if published_since is not None:
+        where.append("published_at >= ?")
+        params.append(_iso(published_since))
+    if published_until is not None:
+        where.append("published_at < ?")
+        params.append(_iso(published_until))
+    if source is not None:
+        where.append("source_name = ?")
+        params.append(source)
+    if category is not None:
+        where.append("source_category = ?")
+        params.append(category)
+    sql = "SELECT * FROM items"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY published_at DESC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    conn = get_connection(db_path)
+    with _POOL_LOCK:
+        rows = conn.execute(sql, params).fetchall()
+    return [dict(row) for row in rows]
+
+
+def load_item_bodies(db_path: Path, item_ids: Iterable[str]) -> dict[str, str]:
+    """Return ``{item_id: body}`` for the given IDs (batched primary-key lookups)."""
+    wanted = sorted({i for i in item_ids if i})
+    bodies: dict[str, str] = {}
+    conn = get_connection(db_path)
+    with _POOL_LOCK:
+        for start in range(0, len(wanted), _IN_CHUNK):
+            chunk = wanted[start : start + _IN_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            for row in conn.execute(f"SELECT item_id, body FROM items WHERE item_id IN ({marks})", chunk):
+                bodies[row["item_id"]] = row["body"] or ""
+    return bodies
+
+
 def load_passed_results(db_path: Path, limit: int = 50) -> list[dict]:
     """Load recent results that passed quality gates."""
-    conn = get_connection(db_path)
-    try:
-        rows = conn.execute(
-            """SELECT r.item_id, r.schema_a, r.schema_b, r.schema_c, r.created_at,
-                      i.title, i.url, i.source_name
-               FROM ai_results r
-               JOIN items i ON r.item_id = i.item_id
-               WHERE r.passed_gate = 1
-               ORDER BY r.created_at DESC
-               LIMIT ?""",
-            (limit,),
-        ).fetchall()
-        results = []
-        for row in rows:
-            results.append(
-                {
-                    "item_id": row["item_id"],
-                    "schema_a": json.loads(row["schema_a"]) if row["schema_a"] else {},
-                    "schema_b": json.loads(row["schema_b"]) if row["schema_b"] else {},
-                    "schema_c": json.loads(row["schema_c"]) if row["schema_c"] else {},
-                    "created_at": row["created_at"],
-                    "title": row["title"],
-                    "url": row["url"],
-                    "source_name": row["source_name"],
-                }
-            )
-        return results
-    finally:
-        conn.close()
+    return query_results(db_path, passed_only=True, limit=limit)
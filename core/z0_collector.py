@@ -6,13 +6,19 @@ Atom feeds, and Google News RSS search queries.  Writes results to:
   <outdir>/latest.jsonl      — UTF-8, one JSON object per line
   <outdir>/latest.meta.json  — summary stats
 
+Frontier scores are computed per feed by ``score_frontier_batch()``; the same
+scorer re-scores an existing ``latest.jsonl`` in place (``--rescore``) after a
+scoring change, without refetching any feed.
+
 Usage:
     python core/z0_collector.py --config config/z0_sources.json --outdir data/raw/z0
+    python core/z0_collector.py --rescore data/raw/z0/latest.jsonl
 """
 
 from __future__ import annotations
 
 import argparse
+import bisect
 import hashlib
 import html
 import json
@@ -23,7 +29,9 @@ import urllib.error
 import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
-from datetime import datetime, timezone
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timezone
 from pathlib import Path
 from typing import Any
 
@@ -35,6 +43,8 @@ _ATOM_NS = "http://www.w3.org/2005/Atom"
 _MEDIA_NS = "http://search.yahoo.com/mrss/"
 _DC_NS = "http://purl.org/dc/elements/1.1/"
 
+_FRONTIER_AUDIT_PATH = Path(__file__).resolve().parent.parent / "outputs" / "z0_frontier_audit.meta.json"
+
 _HIGH_VALUE_PLATFORMS = frozenset({
     "openai", "anthropic", "nvidia", "huggingface", "deepmind",
     "google", "meta", "microsoft", "deepseek", "aws",
@@ -45,16 +55,16 @@ _MED_VALUE_PLATFORMS = frozenset({
 })
 _COMM_PLATFORMS = frozenset({"reddit", "youtube", "huggingface_forum"})
 
-_AI_KW_HIGH = [
+_AI_KW_HIGH = (
     "release", "launch", "model", "agent", "benchmark", "open-source",
     "weights", "gpt", "claude", "gemini", "llm", "inference", "reasoning",
     "multimodal", "rag", "fine-tun", "transformer", "foundation model",
     "large language", "generative", "deepseek", "qwen", "llama",
-]
-_AI_KW_LOW = [
+)
+_AI_KW_LOW = (
     "ai", "machine learning", "deep learning", "neural", "dataset",
     "paper", "research", "algorithm",
-]
+)
 
 # ---------------------------------------------------------------------------
 # Structure-feature regexes for cutting-edge bonus
@@ -374,8 +384,9 @@ def parse_feed(xml_text: str, feed_cfg: dict, max_items: int = 30) -> list[dict]
             },
             "collected_at": collected_at,
         }
-        item["frontier_score"] = compute_frontier_score(item)
         items.append(item)
+    for item, score in zip(items, score_frontier_batch(items, now=now), strict=True):
+        item["frontier_score"] = score
     return items
 
 
@@ -383,129 +394,200 @@ def parse_feed(xml_text: str, feed_cfg: dict, max_items: int = 30) -> list[dict]
 # Frontier score
 # ---------------------------------------------------------------------------
 
-def compute_frontier_score(item: dict) -> int:
+def compute_frontier_score(item: dict, now: datetime | None = None) -> int:
     """0-100 composite: recency(0-50) + platform(0-20) + keywords(0-30) + structure(0-40).
 
     Recency fallback chain: published_at_parsed → published_at → collected_at → default +20.
     Structure bonus rewards arXiv IDs, version tags, benchmark scores, param counts,
-    and explicit release/open-source semantics.
+    and explicit release/open-source semantics.  Single-item form of
+    ``score_frontier_batch()``.
     """
-    score = 0
-    now = datetime.now(timezone.utc)
+    return score_frontier_batch([item], now=now)[0]
 
-    # --- Recency (0-50) ---
-    # Use the most precise available timestamp; fall back to collected_at so items
-    # without a feed-provided date are not penalised relative to NOW.
-    pub_str = (
-        item.get("published_at_parsed")
-        or item.get("published_at")
-        or item.get("collected_at")
-    )
-    if pub_str:
-        try:
-            dt = datetime.fromisoformat(str(pub_str).replace("Z", "+00:00"))
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            age_h = (now - dt).total_seconds() / 3600.0
-            if age_h < 6:
-                score += 50
-            elif age_h < 24:
-                score += 45
-            elif age_h < 48:
-                score += 38
-            elif age_h < 72:
-                score += 30
-            elif age_h < 168:
-                score += 20
-            else:
-                score += 10
-        except Exception:
-            score += 20  # parse-error fallback
-    else:
-        score += 20  # no date at all
 
-    # --- Platform bonus (0-20) ---
-    platform = str(item.get("source", {}).get("platform", "")).lower()
+# Joins item texts for the batch regex passes.  None of the structure / business
+# / product patterns can match NUL, so no match spans two items, and ``\b`` at
+# an item edge behaves exactly as at the start / end of a standalone string.
+_BATCH_SEP = "\x00"
+
+_BATCH_PATTERNS = (
+    _ARXIV_TEXT_RE, _VERSION_TAG_RE, _PARAM_SCALE_RE, _RELEASE_SEMANTICS_RE,
+    _BIGTECH_RE, _BUSINESS_TERM_RE, _MONEY_AMOUNT_RE, _PRODUCT_LAUNCH_RE,
+    _RELEASE_DATE_VER_RE,
+)
+
+
+def _parse_timestamp(raw: str) -> datetime | None:
+    """ISO-8601 string → aware UTC datetime; None when it does not parse."""
+    try:
+        dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except Exception:
+        return None
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=UTC)
+
+
+def _recency_points(age_h: float) -> int:
+    if age_h < 6:
+        return 50
+    if age_h < 24:
+        return 45
+    if age_h < 48:
+        return 38
+    if age_h < 72:
+        return 30
+    if age_h < 168:
+        return 20
+    return 10
+
+
+def _platform_points(platform: str) -> int:
     if platform in _HIGH_VALUE_PLATFORMS:
-        score += 20
-    elif platform in _MED_VALUE_PLATFORMS:
-        score += 12
-    elif platform in _COMM_PLATFORMS:
-        score += 8
-    else:
-        score += 4
-
-    # --- Keyword bonus (0-30) ---
-    text = f"{item.get('title', '')} {item.get('summary', '')}".lower()
-    kw_bonus = 0
-    for kw in _AI_KW_HIGH:
-        if kw in text:
-            kw_bonus += 3
-    for kw in _AI_KW_LOW:
-        if kw in text:
-            kw_bonus += 1
-    score += min(kw_bonus, 30)
-
-    # --- Structure bonus (0-40): cutting-edge structural signals ---
-    url = item.get("url", "")
-    text_full = (
-        f"{item.get('title', '')} "
-        f"{item.get('summary', '')} "
-        f"{item.get('content_text', '')} "
-        f"{url}"
-    )
-    struct = 0
+        return 20
+    if platform in _MED_VALUE_PLATFORMS:
+        return 12
+    if platform in _COMM_PLATFORMS:
+        return 8
+    return 4
+
+
+def _first_match_per_segment(rx: re.Pattern[str], buf: str, starts: list[int]) -> dict[int, re.Match[str]]:
+    """Leftmost match of *rx* in each segment of *buf* that has one.
+
+    After a hit the scan resumes at the next segment, so each item costs at
+    most one search and items without a match are skipped by the C scanner.
+    """
+    found: dict[int, re.Match[str]] = {}
+    pos = 0
+    while True:
+        m = rx.search(buf, pos)
+        if m is None:
+            return found
+        i = bisect.bisect_right(starts, m.start()) - 1
+        found[i] = m
+        if i + 1 >= len(starts):
+            return found
+        pos = starts[i + 1]
+
+
+def score_frontier_batch(items: Sequence[dict], now: datetime | None = None) -> list[int]:
+    """Frontier scores for *items* (see ``compute_frontier_score``), in order.
+
+    One ``now`` is used for the whole batch, each distinct timestamp string is
+    parsed once, and every structure / business / product regex runs over one
+    NUL-joined buffer of the item texts, mapping matches back through segment
+    offsets.  Writes ``_bonus_flags`` into each item like the per-item scorer.
+    """
+    if now is None:
+        now = datetime.now(UTC)
+    if not items:
+        return []
+
+    texts: list[str] = []
+    starts: list[int] = []
+    ends: list[int] = []
+    offset = 0
+    for item in items:
+        text = (
+            f"{item.get('title', '')} "
+            f"{item.get('summary', '')} "
+            f"{item.get('content_text', '')} "
+            f"{item.get('url', '')}"
+        )
+        texts.append(text)
+        starts.append(offset)
+        offset += len(text)
+        ends.append(offset)
+        offset += len(_BATCH_SEP)
+    buf = _BATCH_SEP.join(texts)
+    hits = {rx: _first_match_per_segment(rx, buf, starts) for rx in _BATCH_PATTERNS}
+    bench = _first_match_per_segment(_BENCHMARK_NAME_RE, buf, starts)
+
+    parsed: dict[str, datetime | None] = {}
+    scores: list[int] = []
+    for i, item in enumerate(items):
+        score = 0
+
+        # --- Recency (0-50) ---
+        # Use the most precise available timestamp; fall back to collected_at so items
+        # without a feed-provided date are not penalised relative to NOW.
+        pub_str = (
+            item.get("published_at_parsed")
+            or item.get("published_at")
+            or item.get("collected_at")
+        )
+        if pub_str:
+            key = str(pub_str)
+            if key not in parsed:
+                parsed[key] = _parse_timestamp(key)
+            dt = parsed[key]
+            # parse-error fallback
+            score += _recency_points((now - dt).total_seconds() / 3600.0) if dt else 20
+        else:
+            score += 20  # no date at all
 
-    # 1) arXiv paper (+15): URL contains arxiv.org/abs/ OR text has "arXiv:NNNN.NNNNN"
-    if _ARXIV_URL_SUBSTR in url or _ARXIV_TEXT_RE.search(text_full):
-        struct += 15
+        # --- Platform bonus (0-20) ---
+        score += _platform_points(str(item.get("source", {}).get("platform", "")).lower())
 
-    # 2) Semantic version tag (+10): v1.2.3 / v0.8.1 etc.
-    if _VERSION_TAG_RE.search(text_full):
-        struct += 10
+        # --- Keyword bonus (0-30) ---
+        text = f"{item.get('title', '')} {item.get('summary', '')}".lower()
+        kw_bonus = 3 * sum(1 for kw in _AI_KW_HIGH if kw in text) + sum(1 for kw in _AI_KW_LOW if kw in text)
+        score += min(kw_bonus, 30)
 
-    # 3) Benchmark name + nearby score (+15)
-    bm = _BENCHMARK_NAME_RE.search(text_full)
-    if bm:
-        window = text_full[max(0, bm.start() - 80): bm.end() + 80]
-        if _SCORE_NEAR_RE.search(window):
+        # --- Structure bonus (0-40): cutting-edge structural signals ---
+        url = item.get("url", "")
+        struct = 0
+
+        # 1) arXiv paper (+15): URL contains arxiv.org/abs/ OR text has "arXiv:NNNN.NNNNN"
+        if _ARXIV_URL_SUBSTR in url or i in hits[_ARXIV_TEXT_RE]:
             struct += 15
 
-    # 4) Parameter / model scale (+10): 7B, 70B, MoE, params
-    if _PARAM_SCALE_RE.search(text_full):
-        struct += 10
-
-    # 5) Release / open-source semantics (+15)
-    if _RELEASE_SEMANTICS_RE.search(text_full):
-        struct += 15
-
-    score += min(struct, 40)
-
-    # --- Business signal bonus (0-25): BigTech presence + financial/M&A terms ---
-    # +15 for any BigTech name; +10 for any business/money term; cap 25
-    biz_bigtech = bool(_BIGTECH_RE.search(text_full))
-    biz_term    = bool(_BUSINESS_TERM_RE.search(text_full) or _MONEY_AMOUNT_RE.search(text_full))
-    biz_bonus   = min((15 if biz_bigtech else 0) + (10 if biz_term else 0), 25)
-    score += biz_bonus
-
-    # --- Product release bonus (0-20): launch semantics + date/release version ---
-    # +12 for any product-launch term; +8 for date-based version ("2026.02", "R1"); cap 20
-    prod_launch = bool(_PRODUCT_LAUNCH_RE.search(text_full))
-    prod_ver    = bool(_RELEASE_DATE_VER_RE.search(text_full) or _VERSION_TAG_RE.search(text_full))
-    prod_bonus  = min((12 if prod_launch else 0) + (8 if prod_ver else 0), 20)
-    score += prod_bonus
-
-    # Store bonus flags in item dict for downstream audit (internal key, prefixed _)
-    item["_bonus_flags"] = {
-        "biz_bigtech": biz_bigtech,
-        "biz_term":    biz_term,
-        "biz_bonus":   biz_bonus,
-        "prod_launch": prod_launch,
-        "prod_ver":    prod_ver,
-        "prod_bonus":  prod_bonus,
-    }
+        # 2) Semantic version tag (+10): v1.2.3 / v0.8.1 etc.
+        if i in hits[_VERSION_TAG_RE]:
+            struct += 10
 
-    return min(100, max(0, score))
+        # 3) Benchmark name + nearby score (+15)
+        bm = bench.get(i)
+        if bm:
+            window = buf[max(starts[i], bm.start() - 80): min(ends[i], bm.end() + 80)]
+            if _SCORE_NEAR_RE.search(window):
+                struct += 15
+
+        # 4) Parameter / model scale (+10): 7B, 70B, MoE, params
+        if i in hits[_PARAM_SCALE_RE]:
+            struct += 10
+
+        # 5) Release / open-source semantics (+15)
+        if i in hits[_RELEASE_SEMANTICS_RE]:
+            struct += 15
+
+        score += min(struct, 40)
+
+        # --- Business signal bonus (0-25): BigTech presence + financial/M&A terms ---
+        # +15 for any BigTech name; +10 for any business/money term; cap 25
+        biz_bigtech = i in hits[_BIGTECH_RE]
+        biz_term    = i in hits[_BUSINESS_TERM_RE] or i in hits[_MONEY_AMOUNT_RE]
+        biz_bonus   = min((15 if biz_bigtech else 0) + (10 if biz_term else 0), 25)
+        score += biz_bonus
+
+        # --- Product release bonus (0-20): launch semantics + date/release version ---
+        # +12 for any product-launch term; +8 for date-based version ("2026.02", "R1"); cap 20
+        prod_launch = i in hits[_PRODUCT_LAUNCH_RE]
+        prod_ver    = i in hits[_RELEASE_DATE_VER_RE] or i in hits[_VERSION_TAG_RE]
+        prod_bonus  = min((12 if prod_launch else 0) + (8 if prod_ver else 0), 20)
+        score += prod_bonus
+
+        # Store bonus flags in item dict for downstream audit (internal key, prefixed _)
+        item["_bonus_flags"] = {
+            "biz_bigtech": biz_bigtech,
+            "biz_term":    biz_term,
+            "biz_bonus":   biz_bonus,
+            "prod_launch": prod_launch,
+            "prod_ver":    prod_ver,
+            "prod_bonus":  prod_bonus,
+        }
+
+        scores.append(min(100, max(0, score)))
+    return scores
 
 
 # ---------------------------------------------------------------------------
@@ -547,15 +629,38 @@ def _age_hours(item: dict, now: datetime) -> float | None:
 # HTTP fetch (stdlib urllib only)
 # ---------------------------------------------------------------------------
 
-def _fetch_url(url: str, timeout: int = 15, user_agent: str = "AI-Intel-Z0/1.0") -> str | None:
-    """Fetch URL text with urllib.request.  Returns None on any error."""
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": user_agent,
-            "Accept": "application/rss+xml, application/atom+xml, text/xml, */*",
-        },
-    )
+def _http_cache() -> Any:
+    """Shared HTTP validator cache, or None when ``utils`` is not importable.
+
+    Running ``python core/z0_collector.py`` directly keeps this module
+    stdlib-only; the cache is used when the collector is imported from the
+    pipeline.
+    """
+    try:
+        from utils.http_cache import get_http_cache
+    except ImportError:
+        return None
+    return get_http_cache()
+
+
+def _fetch_url(
+    url: str, timeout: int = 15, user_agent: str = "AI-Intel-Z0/1.0", conditional: bool = True
+) -> str | None:
+    """Fetch URL text with urllib.request.  Returns None on any error.
+
+    Uses the shared HTTP validator cache when available: a 304 reply returns
+    the body stored from the last successful download.  If that entry is gone
+    (pruned or replaced meanwhile), the URL is fetched again without
+    validators.
+    """
+    cache = _http_cache()
+    headers = {
+        "User-Agent": user_agent,
+        "Accept": "application/rss+xml, application/atom+xml, text/xml, */*",
+    }
+    if cache and conditional:
+        headers.update(cache.conditional_headers(url))
+    req = urllib.request.Request(url, headers=headers)
     try:
         with urllib.request.urlopen(req, timeout=timeout) as resp:
             raw = resp.read()
@@ -564,14 +669,98 @@ def _fetch_url(url: str, timeout: int = 15, user_agent: str = "AI-Intel-Z0/1.0")
             m = re.search(r"charset=([^\s;]+)", ct, re.IGNORECASE)
             if m:
                 charset = m.group(1).strip('"').strip("'")
+            if cache:
+                cache.record_miss()
+                cache.store(url, resp.headers.get("ETag"), resp.headers.get("Last-Modified"), raw, charset)
             try:
                 return raw.decode(charset, errors="replace")
             except LookupError:
                 return raw.decode("utf-8", errors="replace")
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304 and cache and conditional:
+            cached = cache.not_modified(url)
+            if cached is not None:
+                return cached.text()
+            return _fetch_url(url, timeout, user_agent, conditional=False)
+        return None
     except Exception:
         return None
 
 
+# ---------------------------------------------------------------------------
+# Per-domain politeness scheduler
+# ---------------------------------------------------------------------------
+
+def _politeness_key(url: str) -> str:
+    """Host used for politeness spacing (``www.`` prefix ignored)."""
+    try:
+        host = urllib.parse.urlparse(url).netloc.lower()
+    except Exception:
+        return ""
+    return host[4:] if host.startswith("www.") else host
+
+
+class _HostQueue:
+    """Requests to one host, made one at a time with ``delay_s`` between them.
+
+    The delay runs from the end of one request to the start of the next, so a
+    host never sees overlapping requests from this collector.
+    """
+
+    def __init__(self, delay_s: float) -> None:
+        self._delay_s = max(0.0, delay_s)
+        self._last_end: float | None = None
+
+    def fetch(self, url: str, timeout: int, user_agent: str) -> str | None:
+        if self._last_end is not None and self._delay_s > 0:
+            pause = self._last_end + self._delay_s - time.monotonic()
+            if pause > 0:
+                time.sleep(pause)
+        try:
+            return _fetch_url(url, timeout=timeout, user_agent=user_agent)
+        finally:
+            self._last_end = time.monotonic()
+
+
+def _fetch_jobs(
+    jobs: list[tuple[dict, str]],
+    timeout: int,
+    user_agent: str,
+    delay_ms: int,
+    max_workers: int,
+) -> list[str | None]:
+    """Fetch every (feed_cfg, url) job; returns bodies in job order.
+
+    Jobs are grouped per host (``www.`` ignored).  With ``max_workers > 1``
+    each host's queue runs on one pool worker, longest queue first, so hosts
+    are fetched in parallel while every host still sees serial requests
+    spaced by ``polite_delay_ms``.  A long queue (e.g. many github.com feeds)
+    holds one worker, never the whole pool.
+    """
+    delay_s = delay_ms / 1000.0
+    bodies: list[str | None] = [None] * len(jobs)
+    by_host: dict[str, list[int]] = {}
+    for idx, (_cfg, url) in enumerate(jobs):
+        by_host.setdefault(_politeness_key(url), []).append(idx)
+
+    if max_workers <= 1 or len(by_host) <= 1:
+        queues: dict[str, _HostQueue] = {}
+        for idx, (_cfg, url) in enumerate(jobs):
+            queue = queues.setdefault(_politeness_key(url), _HostQueue(delay_s))
+            bodies[idx] = queue.fetch(url, timeout, user_agent)
+        return bodies
+
+    def _drain(indices: list[int]) -> None:
+        queue = _HostQueue(delay_s)
+        for idx in indices:
+            bodies[idx] = queue.fetch(jobs[idx][1], timeout, user_agent)
+
+    ordered = sorted(by_host.values(), key=len, reverse=True)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(ordered)), thread_name_prefix="z0") as pool:
+        list(pool.map(_drain, ordered))
+    return bodies
+
+
 # ---------------------------------------------------------------------------
 # GitHub Atom feed builders
 # ---------------------------------------------------------------------------
@@ -602,8 +791,13 @@ def _gnews_url(query: str, locale: dict) -> str:
 # Main collection logic
 # ---------------------------------------------------------------------------
 
-def collect_all(config_path: Path, outdir: Path) -> dict:
-    """Run full Z0 collection.  Returns meta dict.  Never raises."""
+def collect_all(config_path: Path, outdir: Path, max_workers: int | None = None) -> dict:
+    """Run full Z0 collection.  Returns meta dict.  Never raises.
+
+    Feeds are fetched by ``collector.max_workers`` threads (``max_workers``
+    overrides it; 1 = serial) and parsed in config order afterwards, so the
+    JSONL / meta / audit outputs do not depend on network completion order.
+    """
     outdir.mkdir(parents=True, exist_ok=True)
 
     try:
@@ -619,6 +813,7 @@ def collect_all(config_path: Path, outdir: Path) -> dict:
     max_per_feed = int(coll_cfg.get("max_items_per_feed", 30))
     user_agent = str(coll_cfg.get("user_agent", "AI-Intel-Z0/1.0"))
     locale = coll_cfg.get("locale", {"hl": "en-US", "gl": "US", "ceid": "US:en"})
+    workers = int(max_workers if max_workers is not None else coll_cfg.get("max_workers", 1))
 
     all_items: list[dict] = []
     seen_ids: set[str] = set()
@@ -635,20 +830,15 @@ def collect_all(config_path: Path, outdir: Path) -> dict:
                 added += 1
         return added
 
-    def _fetch_and_add(feed_cfg: dict, url: str) -> None:
-        time.sleep(delay_ms / 1000.0)
-        xml_text = _fetch_url(url, timeout=timeout, user_agent=user_agent)
-        n = _process_feed(feed_cfg, xml_text)
-        status = "ok" if xml_text else "err"
-        print(f"[Z0] {status:3s} +{n:3d}  {feed_cfg.get('name', url)[:60]}")
+    jobs: list[tuple[dict, str]] = []
 
     # Official feeds
     for feed_cfg in config.get("official_feeds", []):
-        _fetch_and_add(feed_cfg, feed_cfg["url"])
+        jobs.append((feed_cfg, feed_cfg["url"]))
 
     # Community feeds
     for feed_cfg in config.get("community_feeds", []):
-        _fetch_and_add(feed_cfg, feed_cfg["url"])
+        jobs.append((feed_cfg, feed_cfg["url"]))
 
     # GitHub Atom feeds
     gh_watch = config.get("github_watch", {})
@@ -667,7 +857,7 @@ def collect_all(config_path: Path, outdir: Path) -> dict:
                 "platform": platform,
                 "tag": f"github_{ft}",
             }
-            _fetch_and_add(feed_cfg, url)
+            jobs.append((feed_cfg, url))
 
     # Google News queries
     for q_cfg in config.get("google_news_queries", []):
@@ -681,10 +871,52 @@ def collect_all(config_path: Path, outdir: Path) -> dict:
             "platform": "google_news",
             "tag": q_cfg.get("tag", "gnews"),
         }
-        _fetch_and_add(feed_cfg, url)
+        jobs.append((feed_cfg, url))
+
+    t0 = time.monotonic()
+    http_cache = _http_cache()
+    if http_cache:
+        http_cache.reset_stats()
+    bodies = _fetch_jobs(jobs, timeout, user_agent, delay_ms, workers)
+    for (feed_cfg, url), xml_text in zip(jobs, bodies, strict=True):
+        n = _process_feed(feed_cfg, xml_text)
+        status = "ok" if xml_text else "err"
+        print(f"[Z0] {status:3s} +{n:3d}  {feed_cfg.get('name', url)[:60]}")
+    print(f"[Z0] Fetched {len(jobs)} feeds with {max(1, workers)} workers in {time.monotonic() - t0:.1f}s")
+    if http_cache:
+        _hc = http_cache.stats()
+        print(f"[Z0] HTTP cache: {_hc['hits']} not-modified, {_hc['misses']} downloaded")
 
-    # Build meta
     now_utc = datetime.now(timezone.utc)
+    meta = _build_meta(all_items, now_utc)
+    frontier_ge_70_total = meta["frontier_ge_70_total"]
+    frontier_ge_85_total = meta["frontier_ge_85_total"]
+    frontier_ge_85_72h = meta["frontier_ge_85_72h"]
+
+    # Write JSONL
+    jsonl_path = outdir / "latest.jsonl"
+    with jsonl_path.open("w", encoding="utf-8") as fh:
+        for item in all_items:
+            fh.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    # Write meta
+    meta_path = outdir / "latest.meta.json"
+    meta_path.write_text(json.dumps(meta, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    _write_frontier_audit(all_items, now_utc)
+
+    print(
+        f"[Z0] Done. total={len(all_items)}"
+        f" frontier_ge_70={frontier_ge_70_total}"
+        f" frontier_ge_85={frontier_ge_85_total}"
+        f" frontier_ge_85_72h={frontier_ge_85_72h}"
+    )
+    print(f"[Z0] Output: {jsonl_path}")
+    return meta
+
+
+def _build_meta(all_items: list[dict], now_utc: datetime) -> dict:
+    """latest.meta.json summary for *all_items* (frontier stats relative to *now_utc*)."""
     now_iso = now_utc.isoformat()
     by_platform: dict[str, int] = {}
     by_feed: dict[str, int] = {}
@@ -746,24 +978,19 @@ def collect_all(config_path: Path, outdir: Path) -> dict:
         "frontier_ge_85_fallback_count": f85_fallback_count,
         "frontier_ge_85_fallback_ratio": f85_fallback_ratio,
     }
+    return meta
 
-    # Write JSONL
-    jsonl_path = outdir / "latest.jsonl"
-    with jsonl_path.open("w", encoding="utf-8") as fh:
-        for item in all_items:
-            fh.write(json.dumps(item, ensure_ascii=False) + "\n")
 
-    # Write meta
-    meta_path = outdir / "latest.meta.json"
-    meta_path.write_text(json.dumps(meta, indent=2, ensure_ascii=False), encoding="utf-8")
+def _write_frontier_audit(
+    all_items: list[dict], now_utc: datetime, audit_path: Path = _FRONTIER_AUDIT_PATH
+) -> None:
+    """Write *audit_path* (default outputs/z0_frontier_audit.meta.json).
 
-    # -----------------------------------------------------------------------
-    # Write frontier audit meta (outputs/z0_frontier_audit.meta.json)
-    # Histogram + top samples + bonus counts — lets you see "why only N hits"
-    # -----------------------------------------------------------------------
+    Histogram + top samples + bonus counts — lets you see "why only N hits".
+    """
+    now_iso = now_utc.isoformat()
     try:
-        _repo_root = Path(__file__).resolve().parent.parent
-        _audit_path = _repo_root / "outputs" / "z0_frontier_audit.meta.json"
+        _audit_path = audit_path
         _audit_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Histogram buckets
@@ -822,13 +1049,63 @@ def collect_all(config_path: Path, outdir: Path) -> dict:
     except Exception as _exc:
         print(f"[Z0] WARN: frontier audit write failed: {_exc}")
 
+
+# ---------------------------------------------------------------------------
+# Re-scoring
+# ---------------------------------------------------------------------------
+
+def rescore_file(jsonl_path: Path, now: datetime | None = None, audit_path: Path | None = None) -> dict:
+    """Recompute ``frontier_score`` / ``_bonus_flags`` of a collected JSONL in place.
+
+    Lets ``latest.jsonl`` pick up scoring changes without refetching.  All
+    items are scored as one batch against *now* (default: current time).
+    The sibling ``<stem>.meta.json`` and the frontier audit are rewritten;
+    the meta keeps the original ``collected_at`` and gains ``rescored_at``.
+    The audit goes to *audit_path* (default: ``z0_frontier_audit.meta.json``
+    next to the JSONL; the ``--rescore`` CLI writes the outputs/ one).
+    Lines that are not JSON objects are kept verbatim.
+    """
+    now_utc = now or datetime.now(UTC)
+    lines = jsonl_path.read_text(encoding="utf-8").splitlines()
+    records: list[dict | str] = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            rec = json.loads(line)
+        except ValueError:
+            rec = None
+        records.append(rec if isinstance(rec, dict) else line)
+    items = [rec for rec in records if isinstance(rec, dict)]
+
+    before = [it.get("frontier_score") for it in items]
+    for item, score in zip(items, score_frontier_batch(items, now=now_utc), strict=True):
+        item["frontier_score"] = score
+    changed = sum(1 for old, it in zip(before, items, strict=True) if old != it["frontier_score"])
+
+    tmp_path = jsonl_path.with_name(jsonl_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as fh:
+        for rec in records:
+            fh.write((json.dumps(rec, ensure_ascii=False) if isinstance(rec, dict) else rec) + "\n")
+    tmp_path.replace(jsonl_path)
+
+    meta_path = jsonl_path.with_name(f"{jsonl_path.stem}.meta.json")
+    try:
+        collected_at = json.loads(meta_path.read_text(encoding="utf-8")).get("collected_at")
+    except Exception:
+        collected_at = None
+    meta = _build_meta(items, now_utc)
+    if collected_at:
+        meta["collected_at"] = collected_at
+    meta["rescored_at"] = now_utc.isoformat()
+    meta_path.write_text(json.dumps(meta, indent=2, ensure_ascii=False), encoding="utf-8")
+    _write_frontier_audit(items, now_utc, audit_path or jsonl_path.with_name(_FRONTIER_AUDIT_PATH.name))
+
     print(
-        f"[Z0] Done. total={len(all_items)}"
-        f" frontier_ge_70={frontier_ge_70_total}"
-        f" frontier_ge_85={frontier_ge_85_total}"
-        f" frontier_ge_85_72h={frontier_ge_85_72h}"
+        f"[Z0] Rescored {len(items)} items ({changed} changed)"
+        f" frontier_ge_70={meta['frontier_ge_70_total']}"
+        f" frontier_ge_85={meta['frontier_ge_85_total']}"
     )
-    print(f"[Z0] Output: {jsonl_path}")
     return meta
 
 
@@ -865,10 +1142,35 @@ def _write_empty_output(outdir: Path) -> dict:
 
 def _main() -> None:
     parser = argparse.ArgumentParser(description="Z0 AI-news collector (stdlib only)")
-    parser.add_argument("--config", required=True, help="Path to z0_sources.json")
-    parser.add_argument("--outdir", required=True, help="Output directory for JSONL + meta")
+    parser.add_argument("--config", help="Path to z0_sources.json")
+    parser.add_argument("--outdir", help="Output directory for JSONL + meta")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Concurrent fetch workers (default: collector.max_workers; 1 = serial)",
+    )
+    parser.add_argument(
+        "--rescore", metavar="JSONL",
+        help="Re-score an existing latest.jsonl in place instead of collecting",
+    )
+    parser.add_argument(
+        "--now", default=None,
+        help="ISO-8601 reference time for --rescore recency (default: current time)",
+    )
     args = parser.parse_args()
 
+    if args.rescore:
+        jsonl_path = Path(args.rescore)
+        if not jsonl_path.exists():
+            print(f"[Z0] ERROR: JSONL not found: {jsonl_path}", file=sys.stderr)
+            sys.exit(1)
+        now = _parse_timestamp(args.now) if args.now else None
+        if args.now and now is None:
+            parser.error(f"--now is not an ISO-8601 timestamp: {args.now}")
+        rescore_file(jsonl_path, now=now, audit_path=_FRONTIER_AUDIT_PATH)
+        return
+    if not args.config or not args.outdir:
+        parser.error("--config and --outdir are required unless --rescore is given")
+
     config_path = Path(args.config)
     outdir = Path(args.outdir)
 
@@ -876,7 +1178,7 @@ def _main() -> None:
         print(f"[Z0] ERROR: config not found: {config_path}", file=sys.stderr)
         sys.exit(1)
 
-    meta = collect_all(config_path, outdir)
+    meta = collect_all(config_path, outdir, max_workers=args.workers)
     if meta.get("error"):
         sys.exit(1)
 
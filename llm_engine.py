@@ -2,19 +2,20 @@ from __future__ import annotations
 
 import atexit
 import asyncio
-import json
+import contextlib
 import logging
 import os
 import re
-import socket
 import subprocess
 import sys
 import time
-import urllib.error
 import urllib.request
 from dataclasses import dataclass
 from typing import Optional, Tuple, List
 
+from utils.llm_cache import cache_key, get_llm_cache
+from utils.llm_client import LLMClientError, chat_text, get_llm_client
+
 logger = logging.getLogger(__name__)
 
 LLAMA_SERVER_EXE = (
@@ -34,6 +35,17 @@ HTTP_TIMEOUT_S = 120
 SERVER_READY_TIMEOUT_S = 120
 SERVER_HEALTH_POLL_S = 2
 
+# llama-server parallel slots (-np) and context per slot; the server is
+# launched with -c LLAMA_CTX_PER_SLOT * LLAMA_PARALLEL so each slot keeps the
+# context a single-slot server had, and continuous batching interleaves them.
+LLAMA_PARALLEL = max(1, int(os.getenv("LLAMA_PARALLEL", "1")))
+LLAMA_CTX_PER_SLOT = int(os.getenv("LLAMA_CTX_PER_SLOT", "2048"))
+
+# Stream completions and abort as soon as the partial output breaks a cheap
+# rule (see _early_violation), issuing the repair request without waiting
+# for the remaining tokens.
+STREAM_VALIDATE = os.getenv("LLAMA_STREAM_VALIDATE", "0") == "1"
+
 _RE_ELLIPSIS = re.compile(r"\.\.\.|…|\u2026")
 _RE_ANY_BRACES = re.compile(r"[{}]")
 _RE_QUOTES = re.compile(r"「([^」]{1,240})」")
@@ -192,28 +204,101 @@ def _check_health() -> bool:
         return False
 
 
-def _sync_post(payload: dict) -> dict:
-    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-    req = urllib.request.Request(
-        API_URL,
-        data=data,
-        headers={"Content-Type": "application/json; charset=utf-8"},
-        method="POST",
-    )
-    with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT_S) as resp:
-        raw = resp.read().decode("utf-8", errors="replace")
-        obj = json.loads(raw)
-    # Safety guard: ensure the expected structure exists so callers get a
-    # retriable ValueError instead of an unhandled KeyError/IndexError/TypeError.
-    try:
-        content = obj["choices"][0]["message"]["content"]
-    except (KeyError, IndexError, TypeError) as exc:
-        raise ValueError(f"Unexpected llama-server response structure: {exc!r}") from exc
-    if not isinstance(content, str):
-        raise ValueError(f"llama-server 'content' is not a string: {type(content)}")
+_prompt_stats = {"prompt_tokens_evaluated": 0, "prompt_tokens_reused": 0}
+
+
+def _record_prompt_timings(obj: dict) -> None:
+    """Count prompt tokens llama-server evaluated vs reused from its KV cache.
+
+    ``timings.prompt_n`` is the evaluated part; the reused part is
+    ``timings.cache_n`` when reported, else ``usage.prompt_tokens - prompt_n``.
+    """
+    timings = obj.get("timings")
+    if not isinstance(timings, dict) or "prompt_n" not in timings:
+        return
+    evaluated = int(timings.get("prompt_n") or 0)
+    if "cache_n" in timings:
+        reused = int(timings.get("cache_n") or 0)
+    else:
+        total = int((obj.get("usage") or {}).get("prompt_tokens") or 0)
+        reused = max(0, total - evaluated)
+    _prompt_stats["prompt_tokens_evaluated"] += evaluated
+    _prompt_stats["prompt_tokens_reused"] += reused
+
+
+def prompt_cache_stats() -> dict:
+    """Prompt tokens evaluated vs reused from llama-server's KV cache so far."""
+    return dict(_prompt_stats)
+
+
+async def _post_chat(payload: dict) -> dict:
+    """POST *payload* through the shared pooled client (utils/llm_client).
+
+    Timeouts and 5xx replies are retried there; a reply without
+    ``choices[0].message.content`` raises LLMClientError.
+    """
+    obj = await get_llm_client().apost_json(API_URL, payload, timeout_s=HTTP_TIMEOUT_S)
+    chat_text(obj)
+    _record_prompt_timings(obj)
     return obj
 
 
+def _payload_cache_key(payload: dict) -> str:
+    """LLM response cache key of a chat payload (utils/llm_cache)."""
+    return cache_key(
+        API_URL, payload["model"], payload["temperature"], payload["messages"], max_tokens=payload["max_tokens"]
+    )
+
+
+async def _completion_text(payload: dict) -> str:
+    """POST *payload* and return the reply text."""
+    return chat_text(await _post_chat(payload)).strip()
+
+
+_BLOCK_ORDER = ("Q1:", "Q2:", "Q3:", "Proof:")
+_RE_BLOCK_LABEL = re.compile(r"^(Q1:|Q2:|Q3:|Proof:)", re.M)
+
+
+def _early_violation(partial: str) -> str | None:
+    """First rule a partial completion already breaks, or None.
+
+    Only checks that cannot be fixed by later tokens: forbidden ellipsis,
+    braces and generic phrases, and the Q1/Q2/Q3/Proof block order.  The
+    reason names match _validate_output so repair prompts read the same.
+    """
+    if _RE_ELLIPSIS.search(partial):
+        return "ellipsis_forbidden"
+    if _RE_ANY_BRACES.search(partial):
+        return "braces_forbidden"
+    for gp in _GENERIC_PHRASES:
+        if gp in partial:
+            return f"generic_phrase_hit:{gp}"
+    head = partial.lstrip()
+    if len(head) >= 3 and not head.startswith("Q1:"):
+        return "format_parse_failed"
+    labels = _RE_BLOCK_LABEL.findall(head)
+    if tuple(labels) != _BLOCK_ORDER[: len(labels)]:
+        return "format_parse_failed"
+    return None
+
+
+async def _stream_completion_text(payload: dict) -> tuple[str, str | None]:
+    """Stream *payload* and return ``(text, abort_reason)``.
+
+    Reading stops at the first _early_violation and the partial text is
+    returned with the reason.
+    """
+    text = ""
+    stream = get_llm_client().astream_chat(API_URL, payload, timeout_s=HTTP_TIMEOUT_S)
+    async with contextlib.aclosing(stream):
+        async for delta in stream:
+            text += delta
+            reason = _early_violation(text)
+            if reason is not None:
+                return text.strip(), reason
+    return text.strip(), None
+
+
 def _normalize_claude(text: str) -> str:
     if not text:
         return text
@@ -399,13 +484,16 @@ def _build_user_content(raw_text: str, source: str, date_yyyy_mm_dd: str) -> str
 
 
 def _build_repair_user_content(
-    raw_text: str,
     source: str,
     date_yyyy_mm_dd: str,
-    prev_output: str,
     reasons: List[str],
 ) -> str:
-    truncated = (raw_text or "")[:MAX_INPUT_CHARS]
+    """Repair instruction sent after the previous attempt's assistant turn.
+
+    The article and the rejected output are already in the conversation, so
+    only the violations are repeated here; the system + article prefix stays
+    byte-identical across attempts and llama-server reuses its KV cache.
+    """
     reason_str = ", ".join(reasons[:10])
     return (
         f"你上一版輸出違規（{reason_str}），必須完全重做。\n"
@@ -414,18 +502,30 @@ def _build_repair_user_content(
         f"token 必須是 rich quote（>=20字、含空格或多詞、非純數字）；"
         f"Q3 必須三條且每條>=12字；"
         f"Proof 必須完全等於：證據：來源：{source}（{date_yyyy_mm_dd}）。\n\n"
-        f"來源：{source}\n日期：{date_yyyy_mm_dd}\n\n"
-        f"【原文開始】\n{truncated}\n【原文結束】\n\n"
-        f"【你上一版輸出（僅供對照）】\n{prev_output}\n\n"
-        f"現在請重新輸出（只允許四段格式，不得多字）。"
+        f"現在請依上方原文重新輸出（只允許四段格式，不得多字）。"
     )
 
 
 class LlamaCppServer:
-    def __init__(self) -> None:
+    def __init__(self, parallel: int = LLAMA_PARALLEL, ctx_per_slot: int = LLAMA_CTX_PER_SLOT) -> None:
+        self.parallel = max(1, parallel)
+        self.ctx_per_slot = ctx_per_slot
         self._proc: Optional[subprocess.Popen] = None
         atexit.register(self.stop)
 
+    def command(self) -> list[str]:
+        cmd = [
+            LLAMA_SERVER_EXE,
+            "-m", MODEL_GGUF,
+            "-c", str(self.ctx_per_slot * self.parallel),
+            "-ngl", "33",
+            "--port", "8080",
+            "--host", "127.0.0.1",
+        ]
+        if self.parallel > 1:
+            cmd += ["-np", str(self.parallel), "-cb"]
+        return cmd
+
     async def start(self) -> None:
         if await asyncio.to_thread(_check_health):
             logger.info("llama-server already healthy on port 8080; reusing.")
@@ -436,18 +536,11 @@ class LlamaCppServer:
         if not os.path.exists(MODEL_GGUF):
             raise FileNotFoundError(f"Model gguf not found: {MODEL_GGUF}")
 
-        cmd = [
-            LLAMA_SERVER_EXE,
-            "-m", MODEL_GGUF,
-            "-c", "2048",
-            "-ngl", "33",
-            "--port", "8080",
-            "--host", "127.0.0.1",
-        ]
+        cmd = self.command()
         creationflags = (
             getattr(subprocess, "CREATE_NO_WINDOW", 0) if sys.platform == "win32" else 0
         )
-        logger.info("Launching llama-server...")
+        logger.info("Launching llama-server (%d slot(s))...", self.parallel)
         self._proc = subprocess.Popen(
             cmd,
             stdout=subprocess.DEVNULL,
@@ -480,74 +573,109 @@ class LlamaCppServer:
             self._proc = None
 
 
-async def generate_bbc_news(raw_text: str, source: str, date_yyyy_mm_dd: str) -> str:
+async def generate_bbc_news(
+    raw_text: str,
+    source: str,
+    date_yyyy_mm_dd: str,
+    slot: int | None = None,
+    stream: bool | None = None,
+) -> str:
+    """Generate the Q1/Q2/Q3/Proof summary, repairing invalid output up to twice.
+
+    Every attempt starts with the same system prompt and article message;
+    repairs append the rejected output and a short instruction, so with
+    ``cache_prompt`` llama-server only evaluates the new tail.  *slot* pins
+    all attempts to one llama-server slot (``id_slot``) so that prefix is
+    still in that slot's KV cache.
+
+    With *stream* (default ``STREAM_VALIDATE``) tokens are checked as they
+    arrive and a broken attempt is cut off and repaired immediately.
+
+    Identical payloads (first attempts and repair prompts alike) are answered
+    from the persistent LLM response cache (utils/llm_cache) when enabled.
+    A reply is stored only after it passes _validate_output, so rejected
+    outputs are never replayed.
+    """
+    if stream is None:
+        stream = STREAM_VALIDATE
+    cache = get_llm_cache()
     raw_text = raw_text or ""
     # Task B: normalize inputs at entry point to prevent CRLF/whitespace pollution
     source = _norm_id(source or "unknown")
     date_yyyy_mm_dd = _norm_id(date_yyyy_mm_dd or "1970-01-01")
 
-    base_payload = {"model": "qwen", "temperature": 0.0, "max_tokens": 800, "stream": False}
+    base_payload = {
+        "model": "qwen",
+        "temperature": 0.0,
+        "max_tokens": 800,
+        "stream": False,
+        "cache_prompt": True,
+    }
+    if slot is not None:
+        base_payload["id_slot"] = slot
+    prefix = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": _build_user_content(raw_text, source, date_yyyy_mm_dd)},
+    ]
     prev_output = ""
-    last_exc: Optional[Exception] = None
+    prev_reasons: list[str] = []
+    last_exc: Exception | None = None
 
     for attempt in range(3):
         try:
-            if attempt == 0:
-                user_content = _build_user_content(raw_text, source, date_yyyy_mm_dd)
-            else:
-                _, reasons_prev = _validate_output(
-                    prev_output, raw_text, source, date_yyyy_mm_dd
-                )
-                user_content = _build_repair_user_content(
-                    raw_text, source, date_yyyy_mm_dd, prev_output, reasons_prev
-                )
-
             payload = dict(base_payload)
-            payload["messages"] = [
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": user_content},
-            ]
-
-            result = await asyncio.to_thread(_sync_post, payload)
-            content = (
-                result.get("choices", [{}])[0]
-                .get("message", {})
-                .get("content", "") or ""
-            ).strip()
+            if attempt == 0 or not prev_output:
+                payload["messages"] = prefix
+            else:
+                payload["messages"] = [
+                    *prefix,
+                    {"role": "assistant", "content": prev_output},
+                    {
+                        "role": "user",
+                        "content": _build_repair_user_content(
+                            source, date_yyyy_mm_dd, prev_reasons
+                        ),
+                    },
+                ]
+
+            key = _payload_cache_key(payload) if cache is not None else ""
+            cached = cache.get(key) if cache is not None else None
+            if cached is not None:
+                content, abort_reason = cached, None
+            elif stream:
+                content, abort_reason = await _stream_completion_text(payload)
+            else:
+                content, abort_reason = await _completion_text(payload), None
             content = _normalize_claude(content)
 
+            if abort_reason is not None:
+                prev_output, prev_reasons = content, [abort_reason]
+                logger.warning(
+                    "LLM output aborted mid-stream (attempt %d/3): %s", attempt + 1, abort_reason
+                )
+                continue
+
             ok, reasons = _validate_output(content, raw_text, source, date_yyyy_mm_dd)
             if ok:
+                if cache is not None and cached is None:
+                    cache.put(key, content, API_URL, str(payload["model"]))
                 return content
 
-            prev_output = content
+            prev_output, prev_reasons = content, reasons
             logger.warning(
                 "LLM output invalid (attempt %d/3): %s", attempt + 1, ", ".join(reasons)
             )
             await asyncio.sleep(1.5 + attempt)
 
-        except urllib.error.HTTPError as exc:
-            last_exc = exc
-            if exc.code >= 500 and attempt < 2:
-                logger.warning("LLM HTTP %s on attempt %d/3; retrying.", exc.code, attempt + 1)
-                await asyncio.sleep(2.5 + attempt)
-                continue
-            raise
-        except urllib.error.URLError as exc:
+        except LLMClientError as exc:
+            # Non-streaming HTTP / transport failures were already retried by
+            # utils/llm_client; streams are not, so transient ones retry here.
             last_exc = exc
-            reason = getattr(exc, "reason", None)
-            if isinstance(reason, (socket.timeout, TimeoutError)) and attempt < 2:
-                logger.warning("LLM timeout on attempt %d/3; retrying.", attempt + 1)
-                await asyncio.sleep(2.5 + attempt)
-                continue
-            raise
-        except (socket.timeout, TimeoutError) as exc:
-            last_exc = exc
-            if attempt < 2:
-                logger.warning("LLM timeout on attempt %d/3; retrying.", attempt + 1)
-                await asyncio.sleep(2.5 + attempt)
-                continue
-            raise
+            retry_here = exc.retryable if stream else (exc.status is None and not exc.retryable)
+            if not retry_here or attempt >= 2:
+                raise
+            logger.warning("LLM error on attempt %d/3: %s; retrying.", attempt + 1, exc)
+            await asyncio.sleep(2.0 + attempt)
         except Exception as exc:
             last_exc = exc
             if attempt < 2:
@@ -559,9 +687,8 @@ async def generate_bbc_news(raw_text: str, source: str, date_yyyy_mm_dd: str) ->
             break
 
     if prev_output:
-        _, reasons = _validate_output(prev_output, raw_text, source, date_yyyy_mm_dd)
         raise RuntimeError(
-            f"generate_bbc_news failed strict validation after retries: {reasons}"
+            f"generate_bbc_news failed strict validation after retries: {prev_reasons}"
         )
     if last_exc is not None:
         raise RuntimeError(
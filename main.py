@@ -5,7 +5,7 @@ import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 
-from llm_engine import LlamaCppServer, generate_bbc_news
+from llm_engine import LlamaCppServer, generate_bbc_news, prompt_cache_stats
 from scraper import scrape_all
 
 logging.basicConfig(
@@ -66,28 +66,64 @@ async def main() -> None:
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         today = datetime.now().strftime("%Y%m%d")
         report_path = OUTPUT_DIR / f"report_{today}.md"
+        default_date = today[:4] + "-" + today[4:6] + "-" + today[6:]
 
-        report_lines = [f"# AI Intel Report — {today}\n"]
+        # One in-flight item per llama-server slot, pinned to that slot so its
+        # repair attempts reuse the slot's KV cache; results are saved and
+        # appended to the report in completion order.
+        free_slots: asyncio.Queue[int] = asyncio.Queue()
+        for slot_id in range(server.parallel):
+            free_slots.put_nowait(slot_id)
 
-        for idx, item in enumerate(filtered, 1):
+        async def _generate(idx: int, item: dict) -> tuple[str, str, str] | None:
             source = item["source"]
-            raw_text = item["raw_text"]
-            published_at = item.get("published_at") or item.get("collected_at", today[:4] + "-" + today[4:6] + "-" + today[6:])
-            logger.info(
-                "[%d/%d] Generating LLM summary for: %s (%s)",
-                idx, len(filtered), source, published_at,
-            )
+            published_at = item.get("published_at") or item.get("collected_at", default_date)
+            slot_id = await free_slots.get()
             try:
-                summary = await generate_bbc_news(raw_text, source, published_at)
-                _save_record(conn, source, summary)
-                report_lines.append(f"## {source}  ({published_at})\n")
-                report_lines.append(f"{summary}\n")
-                report_lines.append("---\n")
+                logger.info(
+                    "[%d/%d] Generating LLM summary for: %s (%s)",
+                    idx, len(filtered), source, published_at,
+                )
+                summary = await generate_bbc_news(
+                    item["raw_text"], source, published_at, slot=slot_id
+                )
             except Exception as exc:
                 logger.error("LLM failed for source '%s': %s", source, exc)
-
-        report_path.write_text("\n".join(report_lines), encoding="utf-8")
-        logger.info("Report written to: %s", report_path)
+                return None
+            finally:
+                free_slots.put_nowait(slot_id)
+            return source, published_at, summary
+
+        tasks = [asyncio.create_task(_generate(idx, item)) for idx, item in enumerate(filtered, 1)]
+        done = 0
+        try:
+            with report_path.open("w", encoding="utf-8") as report:
+                report.write(f"# AI Intel Report — {today}\n")
+                for fut in asyncio.as_completed(tasks):
+                    result = await fut
+                    if result is None:
+                        continue
+                    source, published_at, summary = result
+                    try:
+                        _save_record(conn, source, summary)
+                    except Exception as exc:
+                        logger.error("Saving summary for source '%s' failed: %s", source, exc)
+                        continue
+                    report.write(f"\n## {source}  ({published_at})\n\n{summary}\n\n---\n")
+                    report.flush()
+                    done += 1
+        finally:
+            # Don't leave generations running if the report could not be written.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        logger.info("Report written to: %s (%d/%d items)", report_path, done, len(filtered))
+        stats = prompt_cache_stats()
+        logger.info(
+            "Prompt tokens: %d evaluated, %d reused from llama-server KV cache.",
+            stats["prompt_tokens_evaluated"], stats["prompt_tokens_reused"],
+        )
 
     finally:
         if conn is not None:
@@ -11,6 +11,8 @@ import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from utils.http_cache import get_http_cache
+
 logger = logging.getLogger(__name__)
 
 GLOBAL_TIMEOUT = 120
@@ -89,13 +91,31 @@ _NOW_DATE = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
 # ── 底層 fetch ────────────────────────────────────────────
 
-def _sync_fetch(url: str, extra_headers: Optional[Dict[str, str]] = None) -> bytes:
+def _sync_fetch(url: str, extra_headers: Optional[Dict[str, str]] = None,
+                conditional: bool = True) -> bytes:
+    cache = get_http_cache()
     h = dict(HEADERS)
     if extra_headers:
         h.update(extra_headers)
+    if cache and conditional:
+        h.update(cache.conditional_headers(url))
     req = urllib.request.Request(url, headers=h)
-    with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as resp:
-        return resp.read()
+    try:
+        with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as resp:
+            data = resp.read()
+            if cache:
+                cache.record_miss()
+                cache.store(url, resp.headers.get("ETag"), resp.headers.get("Last-Modified"), data)
+            return data
+    except urllib.error.HTTPError as exc:
+        if not (cache and conditional and exc.code == 304):
+            raise
+        # 304 Not Modified: reuse the body stored from the last full download,
+        # or download again if that entry has been dropped in the meantime
+        cached = cache.not_modified(url)
+        if cached is None:
+            return _sync_fetch(url, extra_headers, conditional=False)
+        return cached.body
 
 
 async def _fetch(url: str, extra_headers: Optional[Dict[str, str]] = None) -> bytes:
@@ -15,7 +15,7 @@ def main() -> None:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     init_db(DB_PATH)
     print("Database initialized successfully.")
-    print("  Tables: items, ai_results, dedup_cache")
+    print("  Tables: items, ai_results, dedup_cache, title_index")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,14 @@
 """Run the full pipeline once: Ingest -> Process -> Store -> Deliver."""
 
+import contextlib
 import hashlib
 import os
 import re
 import shutil
 import sys
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
 
@@ -41,6 +44,7 @@ from schemas.models import RawItem
 from utils.entity_cleaner import clean_entities
 from utils.logger import setup_logger
 from utils.metrics import get_collector, reset_collector
+from utils.topic_router import channel_cache_stats, reset_channel_cache
 from utils.evidence_pack import (
     AI_KEYWORDS,
     compute_ai_relevance,
@@ -1941,8 +1945,8 @@ def _brief_translate_fact_sentence_to_bullet(
     else:
         # Attempt 2: local Qwen translation (llama-server must be running)
         try:
-            from utils.llama_openai_client import chat as _llama_chat, is_available as _llama_ok
-            if _llama_ok(timeout=3):
+            from utils.llama_openai_client import chat as _llama_chat
+            if _llama_available_cached(timeout=3):
                 _role_hint = {
                     "what": "該事件發生了什麼（忠實翻譯，保留所有專有名詞與數字）",
                     "key": "關鍵細節與數據（忠實翻譯，保留所有數字與模型名稱）",
@@ -2035,32 +2039,34 @@ def _brief_translate_fact_sentence_to_bullet(
 # (C) Batch Qwen translation — one call per event → [WHAT][KEY][WHY] sections
 # ---------------------------------------------------------------------------
 
-def _brief_batch_translate_event(
+# Raw [WHAT][KEY][WHY] replies of this run keyed by fact-pack hash; an event
+# revisited by the DBE fallback rebuild is not sent to Qwen again.
+_brief_batch_cache: dict[str, str] = {}
+
+
+def _brief_batch_translate_raw(
     *,
     title: str,
     actor: str,
     anchors: list[str],
     fact_pack_sentences: list[str],
-    n_what: int = 5,
-    n_key: int = 4,
-    n_why: int = 4,
-) -> tuple[list[str], list[str], list[str]]:
-    """Single Qwen call per event → all three bullet sections.
+) -> str:
+    """Single Qwen call for one event; returns the raw sectioned reply ("" on failure).
 
-    Returns (what_bullets, key_bullets, why_bullets) — all empty on failure/unavailable.
-    Falls back to empty so caller can use per-sentence rule-based path.
+    Touches no module stats, so _prepare_brief_final_cards can run several
+    events' calls on worker threads.
     """
     if not fact_pack_sentences:
-        return [], [], []
+        return ""
     # TRANSLATION ENGINE HARDLOCK (Iteration 19/20): require translation engine
     if not _is_translation_engine_ready():
-        return [], [], []
+        return ""
     try:
-        from utils.llama_openai_client import chat as _llama_chat, is_available as _llama_ok
-        if not _llama_ok(timeout=4):
-            return [], [], []
+        from utils.llama_openai_client import chat as _llama_chat
+        if not _llama_available_cached(timeout=4):
+            return ""
     except Exception:
-        return [], [], []
+        return ""
 
     anchor = _brief_pick_primary_anchor(actor, anchors) or _normalize_ws(actor) or "該事件"
     anchors_display = ", ".join(
@@ -2095,6 +2101,11 @@ def _brief_batch_translate_event(
         "請直接輸出三個section："
     )
 
+    _fp_key = hashlib.sha256(f"{_sys}\x00{_usr}".encode()).hexdigest()
+    cached = _brief_batch_cache.get(_fp_key)
+    if cached is not None:
+        return cached
+
     try:
         _ok, _txt = _llama_chat(
             [{"role": "system", "content": _sys}, {"role": "user", "content": _usr}],
@@ -2104,10 +2115,27 @@ def _brief_batch_translate_event(
             max_retries=0,
         )
     except Exception:
-        return [], [], []
+        return ""
 
     if not _ok or not _txt:
+        return ""
+    _brief_batch_cache[_fp_key] = _txt
+    return _txt
+
+
+def _brief_batch_parse_event(
+    text: str,
+    *,
+    actor: str,
+    anchors: list[str],
+    n_what: int = 5,
+    n_key: int = 4,
+    n_why: int = 4,
+) -> tuple[list[str], list[str], list[str]]:
+    """Parse and validate a _brief_batch_translate_raw reply into the three sections."""
+    if not text:
         return [], [], []
+    anchor = _brief_pick_primary_anchor(actor, anchors) or _normalize_ws(actor) or "該事件"
 
     # Parse [WHAT][KEY][WHY] sections
     what_raw: list[str] = []
@@ -2115,7 +2143,7 @@ def _brief_batch_translate_event(
     why_raw: list[str] = []
     current_bucket: list[str] | None = None
 
-    for line in _txt.split("\n"):
+    for line in text.split("\n"):
         stripped = _normalize_ws(line)
         if not stripped:
             continue
@@ -2161,6 +2189,32 @@ def _brief_batch_translate_event(
     return what_out, key_out, why_out
 
 
+def _brief_batch_translate_event(
+    *,
+    title: str,
+    actor: str,
+    anchors: list[str],
+    fact_pack_sentences: list[str],
+    n_what: int = 5,
+    n_key: int = 4,
+    n_why: int = 4,
+) -> tuple[list[str], list[str], list[str]]:
+    """Single Qwen call per event → all three bullet sections.
+
+    Returns (what_bullets, key_bullets, why_bullets) — all empty on failure/unavailable.
+    Falls back to empty so caller can use per-sentence rule-based path.
+    """
+    text = _brief_batch_translate_raw(
+        title=title,
+        actor=actor,
+        anchors=anchors,
+        fact_pack_sentences=fact_pack_sentences,
+    )
+    return _brief_batch_parse_event(
+        text, actor=actor, anchors=anchors, n_what=n_what, n_key=n_key, n_why=n_why
+    )
+
+
 def _brief_build_bullet_sections(
     title: str,
     actor: str,
@@ -2444,9 +2498,21 @@ def _brief_parse_digest_supplements(
         return []
 
 
+def _brief_translation_slots() -> int:
+    """Events whose batch Qwen call may run at once: llama-server's slot count, else 1."""
+    if not _is_translation_engine_ready():
+        return 1
+    try:
+        from utils.llama_openai_client import server_slots
+        return max(1, server_slots())
+    except Exception:
+        return 1
+
+
 def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) -> tuple[list[dict], dict]:
     prepared: list[dict] = []
     accepted_signature_sets: list[dict] = []
+    dropped_events: list[dict] = []
     diag = {
         "input_total": len(final_cards or []),
         "drop_non_ai": 0,
@@ -2461,11 +2527,13 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
         "tierA_candidates": 0,
         "tierA_used": 0,
         "content_miner_events": [],
-        "dropped_events": [],
+        "dropped_events": dropped_events,
     }
+    # Drop records land in the buffer of the event being worked on; the driver
+    # flushes the buffers in priority order, so prefetching keeps serial order.
+    drop_buf: list[list[dict]] = [dropped_events]
+
     def _record_drop(reason: str, title_text: str, extra: dict | None = None) -> None:
-        if len(diag.get("dropped_events", [])) >= 40:
-            return
         payload = {
             "reason": _normalize_ws(reason),
             "title": _normalize_ws(title_text)[:140],
@@ -2473,9 +2541,17 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
         if isinstance(extra, dict):
             for k, v in extra.items():
                 payload[str(k)] = v
-        diag["dropped_events"].append(payload)
+        drop_buf[0].append(payload)
 
-    for fc in sorted(final_cards or [], key=_brief_candidate_priority, reverse=True):
+    def _flush_drops(buf: list[dict]) -> None:
+        room = 40 - len(dropped_events)
+        dropped_events.extend(buf[: max(0, room)])
+
+    # One event per generator: it runs up to the batch Qwen translation, yields
+    # the request, and finishes (appending to `prepared` or dropping) with the
+    # raw reply sent back in.  The driver below keeps up to one event per
+    # llama-server slot in flight while still finishing events in priority order.
+    def _event_steps(fc: dict):
         _fc_src = _normalize_ws(str(fc.get("source_name", "") or ""))
         _fc_url = _normalize_ws(str(fc.get("final_url", "") or fc.get("source_url", "") or ""))
         _fc_ttl = _normalize_ws(str(fc.get("title", "") or ""))
@@ -2484,13 +2560,13 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
         if not bool(fc.get("ai_relevance", False)):
             diag["drop_non_ai"] += 1
             _record_drop("non_ai", _fc_ttl)
-            continue
+            return
 
         actor = _normalize_ws(str(fc.get("actor_primary", "") or fc.get("actor", "") or ""))
         if (not actor) or _is_actor_numeric(actor) or _brief_is_garbage_actor(actor):
             diag["drop_actor_invalid"] += 1
             _record_drop("actor_invalid", _fc_ttl, {"actor": actor})
-            continue
+            return
 
         title = _normalize_ws(str(fc.get("title", "") or ""))
         source_blob = _normalize_ws(
@@ -2500,7 +2576,7 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
         if fulltext_len < 200:
             diag["drop_quote_relevance"] += 1
             _record_drop("fulltext_too_short", title, {"fulltext_len": fulltext_len})
-            continue
+            return
 
         anchors_raw = [
             _normalize_ws(str(a or ""))
@@ -2511,7 +2587,7 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
         if not anchor:
             diag["drop_anchor_missing"] += 1
             _record_drop("anchor_missing", title, {"actor": actor})
-            continue
+            return
         anchors_all = [anchor] + anchors_raw
 
         miner_diag: dict = {}
@@ -2663,7 +2739,7 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
                     "fact_span_policy_used": str(miner_diag.get("fact_span_policy_used", "")),
                 },
             )
-            continue
+            return
 
         _sorted_by_score = sorted(
             fact_pack,
@@ -2699,7 +2775,7 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
                     "fact_pack_total": len(fact_pack_sentences),
                 },
             )
-            continue
+            return
         if len(quote_1) < 80 or len(quote_2) < 80:
             diag["drop_quote_too_short"] += 1
             _record_drop(
@@ -2707,11 +2783,11 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
                 title,
                 {"q1_len": len(quote_1), "q2_len": len(quote_2)},
             )
-            continue
+            return
         if _brief_quote_is_cta(quote_1) or _brief_quote_is_cta(quote_2):
             diag["drop_quote_relevance"] += 1
             _record_drop("quote_cta_hit", title, {"q1_cta": _brief_quote_is_cta(quote_1), "q2_cta": _brief_quote_is_cta(quote_2)})
-            continue
+            return
 
         _final_url = _normalize_ws(str(fc.get("final_url", "") or ""))
         category = _normalize_ws(str(fc.get("category", "") or ""))
@@ -2731,6 +2807,15 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
             or bool(c.get("has_model"))
         ] or _sorted_by_score
 
+        # (C) Try batch Qwen translation first (one call → three sections);
+        # the driver runs the call and sends back the raw reply.
+        _batch_reply = yield {
+            "title": title,
+            "actor": actor,
+            "anchors": anchors_all,
+            "fact_pack_sentences": fact_pack_sentences,
+        }
+
         # Reset translation stats for this event
         _brief_trans_stats["attempts"] = 0
         _brief_trans_stats["rule_success"] = 0
@@ -2738,12 +2823,10 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
         _brief_trans_stats["empty"] = 0
         _brief_trans_stats["error"] = 0
 
-        # (C) Try batch Qwen translation first (one call → three sections)
-        _batch_what, _batch_key, _batch_why = _brief_batch_translate_event(
-            title=title,
+        _batch_what, _batch_key, _batch_why = _brief_batch_parse_event(
+            _batch_reply,
             actor=actor,
             anchors=anchors_all,
-            fact_pack_sentences=fact_pack_sentences,
             n_what=_BRIEF_TARGET_WHAT_BULLETS,
             n_key=_BRIEF_TARGET_KEY_BULLETS,
             n_why=_BRIEF_TARGET_WHY_BULLETS_DEFAULT,
@@ -2934,15 +3017,15 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
         if _generic_hits:
             diag["drop_generic_narrative"] += 1
             _record_drop("generic_narrative", title, {"sample_hit_pattern": str(_generic_hits[0].get("hit_pattern", "") or "")})
-            continue
+            return
         if _brief_contains_boilerplate(summary_zh, what, why):
             diag["drop_boilerplate"] += 1
             _record_drop("boilerplate", title)
-            continue
+            return
         if (not _brief_has_anchor_token(what, [anchor])) or (not _brief_has_anchor_token(why, [anchor])):
             diag["drop_anchor_missing"] += 1
             _record_drop("anchor_missing_in_sections", title, {"anchor": anchor})
-            continue
+            return
 
         _all_bullets = what_bullets + key_details_bullets + why_bullets
         _bullet_cjk_ok = all(_brief_count_cjk_chars(_b) >= _BRIEF_MIN_BULLET_CJK_CHARS for _b in _all_bullets)
@@ -2970,7 +3053,7 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
                     "anchor_or_number_hits": int(_bullet_hit_count),
                 },
             )
-            continue
+            return
 
         _sig_set = _brief_collect_frame_signatures(
             summary_zh=summary_zh,
@@ -2989,7 +3072,7 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
         if _dup_hit is not None:
             diag["drop_duplicate_frames"] += 1
             _record_drop("duplicate_frames", title, {"sample_hit_pattern": str(_dup_hit[0] if _dup_hit else "")})
-            continue
+            return
 
         anchors_out = [anchor] + [a for a in anchors_raw if a.lower() != anchor.lower()]
         out = dict(fc)
@@ -3093,8 +3176,46 @@ def _prepare_brief_final_cards(final_cards: list[dict], max_events: int = 10) ->
             }
         )
 
-        if len(prepared) >= max(1, int(max_events)):
-            break
+    candidates = iter(sorted(final_cards or [], key=_brief_candidate_priority, reverse=True))
+    slots = _brief_translation_slots()
+    in_flight: deque = deque()
+    limit = max(1, int(max_events))
+
+    def busy() -> int:
+        return sum(1 for steps, _, _ in in_flight if steps is not None)
+
+    with ThreadPoolExecutor(max_workers=slots) as pool:
+
+        def _fill() -> None:
+            # Stop once every open slot towards max_events is taken, so only
+            # candidates the serial loop would reach are started.
+            while busy() < slots and len(prepared) + busy() < limit:
+                fc = next(candidates, None)
+                if fc is None:
+                    return
+                steps = _event_steps(fc)
+                drop_buf[0] = []
+                try:
+                    request = next(steps)
+                except StopIteration:
+                    in_flight.append((None, None, drop_buf[0]))  # dropped before translation
+                    continue
+                in_flight.append((steps, pool.submit(_brief_batch_translate_raw, **request), drop_buf[0]))
+
+        _fill()
+        while in_flight:
+            steps, fut, drop_buf[0] = in_flight.popleft()
+            if steps is not None:
+                try:
+                    raw_reply = fut.result()
+                except Exception:
+                    raw_reply = ""
+                with contextlib.suppress(StopIteration):
+                    steps.send(raw_reply)
+            _flush_drops(drop_buf[0])
+            if len(prepared) >= limit:
+                break
+            _fill()
 
     diag["kept_total"] = len(prepared)
     return prepared, diag
@@ -3119,18 +3240,24 @@ def _build_brief_extended_pool_candidates(
         return out, stats
 
     try:
-        from core.storage import load_passed_results
+        from core.storage import query_results
         from utils.fulltext_hydrator import hydrate_fulltext
         from utils.topic_router import is_relevant_ai as _is_relevant_ai_brief
     except Exception:
         return out, stats
 
+    now_utc = datetime.now(timezone.utc)
     try:
-        rows = load_passed_results(settings.DB_PATH, limit=300)
+        # 48h-168h backfill window, served by the (passed_gate, created_at) index
+        rows = query_results(
+            settings.DB_PATH,
+            since=now_utc - timedelta(hours=168),
+            until=now_utc - timedelta(hours=48),
+            limit=300,
+        )
     except Exception:
         return out, stats
 
-    now_utc = datetime.now(timezone.utc)
     window_rows: list[dict] = []
     for row in rows:
         created_at = _parse_iso_utc(str(row.get("created_at", "") or ""))
@@ -3921,6 +4048,29 @@ def _generate_brief_md(prepared: list[dict], run_id: str, mode: str, report_mode
 # Priority: BRIEF_TRANSLATION_READY env var (set by verify_online.ps1) →
 #           direct llama-server probe (desktop button / run_pipeline.ps1 path).
 # ---------------------------------------------------------------------------
+_LLAMA_PROBE_TTL_S = 120.0
+_llama_probe: dict = {"checked_at": 0.0, "ok": False}
+
+
+def _llama_available_cached(timeout: int = 4) -> bool:
+    """llama_openai_client.is_available(), remembered for _LLAMA_PROBE_TTL_S.
+
+    The brief stage used to probe llama-server before every event and every
+    fallback sentence; one probe per couple of minutes is enough for a run.
+    """
+    now = time.monotonic()
+    if _llama_probe["checked_at"] and now - _llama_probe["checked_at"] < _LLAMA_PROBE_TTL_S:
+        return bool(_llama_probe["ok"])
+    try:
+        from utils.llama_openai_client import is_available as _qw_is_avail
+        ok = bool(_qw_is_avail(timeout=timeout))
+    except Exception:
+        ok = False
+    _llama_probe["checked_at"] = now
+    _llama_probe["ok"] = ok
+    return ok
+
+
 def _is_translation_engine_ready() -> bool:
     """Return True if Qwen llama-server is reachable for translation.
 
@@ -3936,11 +4086,7 @@ def _is_translation_engine_ready() -> bool:
     if _tr_env == "0":
         return False
     # Not explicitly set → probe Qwen directly (desktop button path)
-    try:
-        from utils.llama_openai_client import is_available as _qw_is_avail
-        return _qw_is_avail(timeout=5)
-    except Exception:
-        return False
+    return _llama_available_cached(timeout=5)
 
 
 # ---------------------------------------------------------------------------
@@ -3953,6 +4099,8 @@ def _translate_md_to_zh(md_text: str) -> tuple[bool, str]:
     Returns (True, translated_zh_text) on success.
     Returns (False, fail_reason_str) on failure.
     Code blocks and URLs are passed through unchanged (placeholders).
+    Paragraphs found in the translation memory are reused; the rest are
+    translated in chunks, as many at once as llama-server has slots.
     Output is validated against a banlist of template/audit-speak phrases.
     """
     import re as _tr_re
@@ -3976,6 +4124,8 @@ def _translate_md_to_zh(md_text: str) -> tuple[bool, str]:
     # only compound template phrases are banned in translation output.
     _BANLIST = re.compile(r"近日|備受矚目|備受關注|可核對|原文提到|本文指出|總結來說")
     _MAX_CHUNK = 1000
+    _QW_MODEL = "qwen2.5-7b-instruct"
+    _TM_NS = f"{_QW_MODEL}\x00{_SYS}"  # translation memory namespace: model + system prompt
 
     try:
         from utils.llama_openai_client import chat as _qw
@@ -3994,54 +4144,93 @@ def _translate_md_to_zh(md_text: str) -> tuple[bool, str]:
     # 2. Split into paragraph blocks at blank lines
     blocks = text_no_code.split("\n\n")
 
-    # 3. Group blocks into chunks of max _MAX_CHUNK chars
-    chunks: list[str] = []
-    cur: list[str] = []
-    cur_len = 0
+    # 3. Serve unchanged paragraphs from the translation memory
+    #    (utils/translation_memory, keyed by normalized source + _TM_NS).
+    #    None marks a block still to translate; placeholder-only / blank
+    #    blocks pass through.
+    from utils.translation_memory import get_translation_memory
 
+    _tm = get_translation_memory()
+    out_blocks: list[str | None] = []
     for block in blocks:
+        if not _tr_re.sub(r"\x00CB\d+\x00", "", block).strip():
+            out_blocks.append(block)
+        else:
+            out_blocks.append(_tm.get(block, _TM_NS) if _tm is not None else None)
+
+    # 4. Group runs of untranslated blocks into chunks of max _MAX_CHUNK chars
+    chunks: list[list[int]] = []
+    cur: list[int] = []
+    cur_len = 0
+
+    for bi, block in enumerate(blocks):
+        if out_blocks[bi] is not None:
+            if cur:
+                chunks.append(cur)
+                cur, cur_len = [], 0
+            continue
         blen = len(block) + 2
         # Force new chunk at H1/H2/H3 to keep sections together
         _is_heading = bool(_tr_re.match(r"^#{1,3} ", block.lstrip()))
         if (_is_heading or cur_len + blen > _MAX_CHUNK) and cur:
-            chunks.append("\n\n".join(cur))
-            cur = [block]
+            chunks.append(cur)
+            cur = [bi]
             cur_len = blen
         else:
-            cur.append(block)
+            cur.append(bi)
             cur_len += blen
     if cur:
-        chunks.append("\n\n".join(cur))
-
-    # 4. Translate each chunk
-    translated: list[str] = []
-    for i, chunk in enumerate(chunks):
-        # Check if chunk has non-placeholder, non-whitespace content
-        clean = _tr_re.sub(r"\x00CB\d+\x00", "", chunk)
-        if not clean.strip():
-            translated.append(chunk)
-            continue
+        chunks.append(cur)
+
+    # 5. Translate chunks concurrently, one request per llama-server slot
+    merged: set[int] = set()  # blocks whose translation is folded into their chunk's first block
 
-        ok, resp = _qw(
+    def _translate_chunk(chunk: str) -> tuple[bool, str]:
+        if _tm is not None:
+            cached = _tm.get(chunk, _TM_NS)
+            if cached is not None:
+                return True, cached
+        return _qw(
             messages=[
                 {"role": "system", "content": _SYS},
                 {"role": "user", "content": chunk},
             ],
+            model=_QW_MODEL,
             temperature=0.1,
             max_tokens=400,
             timeout=240,
             max_retries=0,
         )
-        if not ok:
-            return False, f"TRANSLATION_FAILED: chunk {i}: {resp[:200]}"
-        translated.append(resp.strip())
 
-    # 5. Restore code blocks
+    if chunks:
+        from utils.llama_openai_client import server_slots
+
+        chunk_texts = ["\n\n".join(blocks[bi] for bi in idxs) for idxs in chunks]
+        with ThreadPoolExecutor(max_workers=max(1, min(len(chunks), server_slots()))) as pool:
+            futures = [pool.submit(_translate_chunk, text) for text in chunk_texts]
+            for i, (idxs, text, fut) in enumerate(zip(chunks, chunk_texts, futures, strict=True)):
+                ok, resp = fut.result()
+                if not ok:
+                    for pending in futures:
+                        pending.cancel()
+                    return False, f"TRANSLATION_FAILED: chunk {i}: {resp[:200]}"
+                resp = resp.strip()
+                out_blocks[idxs[0]] = resp
+                merged.update(idxs[1:])
+                # Stored under the chunk's own source: a one-paragraph chunk is
+                # remembered per paragraph, a longer one only as a whole, since
+                # the reply's paragraph breaks need not match the source's.
+                if _tm is not None and not _BANLIST.search(resp):
+                    _tm.put(text, resp, _TM_NS)
+
+    translated = [b or "" for bi, b in enumerate(out_blocks) if bi not in merged]
+
+    # 6. Restore code blocks
     result = "\n\n".join(translated)
     for idx, cb in enumerate(_code_store):
         result = result.replace(f"\x00CB{idx}\x00", cb)
 
-    # 6. Banlist check
+    # 7. Banlist check
     hits = _BANLIST.findall(result)
     if hits:
         return False, f"TRANSLATION_FAILED_BANLIST: {hits[:5]}"
@@ -4439,6 +4628,7 @@ def _sync_exec_selection_meta(final_cards: list[dict]) -> None:
         _data["final_selected_events"] = _total
         _data["events_by_bucket"] = _counts
         _data["events"] = _events
+        _data["channel_cache"] = channel_cache_stats()
         _meta_path.write_text(
             _esm_json.dumps(_data, ensure_ascii=False, indent=2),
             encoding="utf-8",
@@ -5482,6 +5672,7 @@ def run_pipeline() -> None:
     # Initialize metrics collector
     collector = reset_collector()
     collector.start()
+    reset_channel_cache()
 
     # Ensure DB exists
     init_db(settings.DB_PATH)
@@ -5508,6 +5699,9 @@ def run_pipeline() -> None:
             log.info("Z0 fulltext hydration complete (%d items)", len(raw_items))
         except Exception as _z0_hydr_exc:
             log.warning("Z0 fulltext hydration failed (non-fatal): %s", _z0_hydr_exc)
+        finally:
+            from utils.http_fetch import release_fetch_layer
+            release_fetch_layer()
     else:
         raw_items = fetch_all_feeds()
 
@@ -5595,9 +5789,9 @@ def run_pipeline() -> None:
         return
 
     # Dedup against DB + within batch
-    existing_ids = get_existing_item_ids(settings.DB_PATH)
-    log.info("Existing items in DB: %d", len(existing_ids))
-    deduped = dedup_items(raw_items, existing_ids)
+    existing_ids = get_existing_item_ids(settings.DB_PATH, (it.item_id for it in raw_items))
+    log.info("Existing items in DB: %d of %d fetched", len(existing_ids), len(raw_items))
+    deduped = dedup_items(raw_items, existing_ids, db_path=settings.DB_PATH)
     collector.deduped_total = len(deduped)
     log.info("INGEST_COUNTS deduped_total=%d", collector.deduped_total)
 
@@ -5927,6 +6121,7 @@ def run_pipeline() -> None:
             "z0_inject_selected_total": _z0_inject_selected_total,
             "z0_inject_dropped_by_channel_gate": _z0_inject_dropped_by_channel_gate,
             "z0_inject_channel_gate_threshold": _z0_exec_min_channel,
+            "channel_cache": channel_cache_stats(),
         }
         _z0_inj_path = Path(settings.PROJECT_ROOT) / "outputs" / "z0_injection.meta.json"
         _z0_inj_path.parent.mkdir(parents=True, exist_ok=True)
@@ -6396,27 +6591,12 @@ def run_pipeline() -> None:
                         _dbe_rows = _dbe_load_pr(settings.DB_PATH, limit=500)
                         _dbe_body_by_id: dict[str, str] = {}
                         try:
-                            import sqlite3 as _dbe_sqlite3
+                            from core.storage import load_item_bodies as _dbe_load_bodies
 
-                            _dbe_ids = [
-                                str(_r.get("item_id", "") or "")
-                                for _r in _dbe_rows
-                                if str(_r.get("item_id", "") or "")
-                            ]
-                            _dbe_conn = _dbe_sqlite3.connect(str(settings.DB_PATH))
-                            _dbe_conn.row_factory = _dbe_sqlite3.Row
-                            try:
-                                for _ofs in range(0, len(_dbe_ids), 200):
-                                    _chunk = _dbe_ids[_ofs:_ofs + 200]
-                                    if not _chunk:
-                                        continue
-                                    _ph = ",".join("?" for _ in _chunk)
-                                    _sql = f"SELECT item_id, body FROM items WHERE item_id IN ({_ph})"
-                                    for _row in _dbe_conn.execute(_sql, _chunk):
-                                        _iid = str(_row["item_id"] or "")
-                                        _dbe_body_by_id[_iid] = str(_row["body"] or "")
-                            finally:
-                                _dbe_conn.close()
+                            _dbe_body_by_id = _dbe_load_bodies(
+                                settings.DB_PATH,
+                                (str(_r.get("item_id", "") or "") for _r in _dbe_rows),
+                            )
                         except Exception as _dbe_body_exc:
                             log.warning("DEMO_EXTENDED_POOL body preload failed (non-fatal): %s", _dbe_body_exc)
 
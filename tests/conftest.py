@@ -0,0 +1,26 @@
+"""Shared pytest setup.
+
+Persistent run-to-run caches are switched off so tests that mock the network
+never see entries written by a previous test (or a real pipeline run).  Cache
+tests construct their own instances on ``tmp_path``.
+
+Pooled SQLite connections are closed after every test so each test's
+``tmp_path`` database is released.
+"""
+
+import os
+
+import pytest
+
+os.environ["HTTP_CACHE_ENABLED"] = "0"
+os.environ["FULLTEXT_CACHE_ENABLED"] = "0"
+os.environ["LLM_CACHE_ENABLED"] = "0"
+os.environ["TRANSLATION_MEMORY_ENABLED"] = "0"
+
+
+@pytest.fixture(autouse=True)
+def _close_pooled_sqlite():
+    yield
+    from core.storage import close_connections
+
+    close_connections()
@@ -0,0 +1,137 @@
+"""Tests for batched Chain B scoring in core/ai_core.process_batch."""
+
+from __future__ import annotations
+
+import json
+import re
+from unittest.mock import patch
+
+from config import settings
+from core import ai_core
+from schemas.models import RawItem, SchemaA, SchemaC
+
+_ID_RE = re.compile(r"item_id: (\S+)")
+
+
+def _item(i: int) -> RawItem:
+    return RawItem(
+        item_id=f"id-{i}",
+        title=f"Headline {i}",
+        url=f"https://example.com/{i}",
+        body="Some body text about a model release. " * 10,
+        published_at="2026-01-01T00:00:00+00:00",
+        source_name="src",
+        source_category="tech",
+        lang="en",
+    )
+
+
+def _scores(ids: list[str]) -> list[dict]:
+    return [{"item_id": i, "novelty": 9, "utility": 9, "heat": 9, "feasibility": 9, "tags": ["llm"]} for i in ids]
+
+
+class _FakeProvider:
+    """Answers batched scoring prompts; *reply* maps the prompt's ids to response text."""
+
+    def __init__(self, reply=None) -> None:
+        self.reply = reply or (lambda ids: json.dumps(_scores(ids)))
+        self.batches: list[list[str]] = []
+
+    def __call__(self, messages, temperature=0.3, validate=None):
+        ids = _ID_RE.findall(messages[0]["content"])
+        self.batches.append(ids)
+        return self.reply(ids)
+
+
+def _run(items, provider, batch_size: int = 10, concurrency: int = 1):
+    with (
+        patch.object(settings, "LLM_PROVIDER", "deepseek"),
+        patch.object(settings, "LLM_BASE_URL", "https://llm.example.com/v1"),
+        patch.object(settings, "LLM_API_KEY", "k"),
+        patch.object(settings, "LLM_CONCURRENCY", concurrency),
+        patch.object(settings, "LLM_SCORE_BATCH_SIZE", batch_size),
+        patch.object(settings, "LLM_CHAIN_MODE", "separate"),
+        patch.object(ai_core, "chain_a_llm", side_effect=lambda it: SchemaA(item_id=it.item_id, title_zh="t")),
+        patch.object(ai_core, "chain_c_llm", side_effect=lambda it, a, b: SchemaC(item_id=it.item_id, card_md="c")),
+        patch.object(ai_core, "chain_b_llm", side_effect=RuntimeError("per-item call")) as single,
+        patch.object(ai_core, "_chat_completion", side_effect=provider),
+    ):
+        return ai_core.process_batch(items), single
+
+
+class TestBatchedScoring:
+    def test_hundred_items_in_a_handful_of_calls(self):
+        items = [_item(i) for i in range(100)]
+        provider = _FakeProvider()
+        results, single = _run(items, provider, batch_size=20, concurrency=4)
+        assert len(provider.batches) == 5
+        assert single.call_count == 0
+        assert [r.item_id for r in results] == [i.item_id for i in items]
+        assert all(r.schema_b.final_score == 9.0 and r.passed_gate for r in results)
+
+    def test_response_order_does_not_matter(self):
+        items = [_item(i) for i in range(4)]
+        provider = _FakeProvider(lambda ids: json.dumps(list(reversed(_scores(ids)))))
+        results, _ = _run(items, provider)
+        assert [r.schema_b.item_id for r in results] == [i.item_id for i in items]
+
+    def test_unparseable_reply_splits_and_retries(self):
+        def reply(ids):
+            return "sorry, too many items" if len(ids) > 2 else "```json\n" + json.dumps(_scores(ids)) + "\n```"
+
+        items = [_item(i) for i in range(8)]
+        provider = _FakeProvider(reply)
+        results, single = _run(items, provider)
+        assert [len(b) for b in provider.batches] == [8, 4, 2, 2, 4, 2, 2]
+        assert single.call_count == 0
+        assert all(r.schema_b.final_score == 9.0 for r in results)
+
+    def test_missing_items_are_asked_again(self):
+        def reply(ids):
+            return json.dumps(_scores(ids[:-1]) if len(ids) == 5 else _scores(ids))
+
+        items = [_item(i) for i in range(5)]
+        provider = _FakeProvider(reply)
+        results, single = _run(items, provider)
+        # the lone leftover goes through the per-item Chain B (which fails -> rules)
+        assert provider.batches == [[f"id-{i}" for i in range(5)]]
+        assert single.call_count == 1
+        assert results[4].schema_b.tags != ["llm"]
+        assert all(r.schema_b.final_score == 9.0 for r in results[:4])
+
+    def test_transport_failure_falls_back_without_retry(self):
+        def reply(ids):
+            raise RuntimeError("provider 503")
+
+        items = [_item(i) for i in range(6)]
+        provider = _FakeProvider(reply)
+        results, single = _run(items, provider)
+        assert len(provider.batches) == 1
+        assert single.call_count == 0
+        assert [r.item_id for r in results] == [i.item_id for i in items]
+        assert all(r.schema_b.tags != ["llm"] for r in results)
+
+    def test_unknown_ids_ignored(self):
+        items = [_item(i) for i in range(3)]
+        provider = _FakeProvider(lambda ids: json.dumps(_scores(ids) + _scores(["id-999"])))
+        results, _ = _run(items, provider)
+        assert len(provider.batches) == 1
+        assert {r.item_id for r in results} == {"id-0", "id-1", "id-2"}
+
+    def test_batch_size_one_keeps_per_item_path(self):
+        items = [_item(i) for i in range(3)]
+        provider = _FakeProvider()
+        _results, single = _run(items, provider, batch_size=1)
+        assert provider.batches == []
+        assert single.call_count == 3
+
+
+class TestParseJsonArray:
+    def test_wrapped_array(self):
+        assert ai_core._parse_json_array_from_llm('{"results": [{"item_id": "a"}]}') == [{"item_id": "a"}]
+
+    def test_prose_around_array(self):
+        assert ai_core._parse_json_array_from_llm('Scores: [{"item_id": "a"}] hope this helps') == [{"item_id": "a"}]
+
+    def test_garbage(self):
+        assert ai_core._parse_json_array_from_llm("no json here") == []
@@ -0,0 +1,160 @@
+"""Tests for concurrent Z2 processing in core/ai_core.process_batch."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import patch
+
+from config import settings
+from core import ai_core
+from schemas.models import RawItem, SchemaA, SchemaB, SchemaC
+
+
+def _item(i: int) -> RawItem:
+    return RawItem(
+        item_id=f"id-{i}",
+        title=f"Headline {i}",
+        url=f"https://example.com/{i}",
+        body="Some body text about a model release. " * 10,
+        published_at="2026-01-01T00:00:00+00:00",
+        source_name="src",
+        source_category="tech",
+        lang="en",
+    )
+
+
+def _llm_settings(concurrency: int = 4, rps: float = 0.0):
+    return (
+        patch.object(settings, "LLM_PROVIDER", "deepseek"),
+        patch.object(settings, "LLM_BASE_URL", "https://llm.example.com/v1"),
+        patch.object(settings, "LLM_API_KEY", "k"),
+        patch.object(settings, "LLM_CONCURRENCY", concurrency),
+        patch.object(settings, "LLM_RATE_LIMIT_RPS", rps),
+    )
+
+
+class _FakeChains:
+    """Chain stubs that sleep like an HTTP round trip and track overlap."""
+
+    def __init__(self, delay: float = 0.05, fail_b_for: str = "") -> None:
+        self.delay = delay
+        self.fail_b_for = fail_b_for
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _call(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+
+    def a(self, item):
+        self._call()
+        return SchemaA(item_id=item.item_id, title_zh=f"T{item.item_id}", summary_zh="s")
+
+    def b(self, item, schema_a):
+        self._call()
+        if item.item_id == self.fail_b_for:
+            raise RuntimeError("provider 500")
+        return SchemaB(item_id=item.item_id, final_score=9.0)
+
+    def c(self, item, schema_a, schema_b):
+        self._call()
+        return SchemaC(item_id=item.item_id, title=schema_a.title_zh)
+
+    def patches(self):
+        return (
+            patch.object(ai_core, "chain_a_llm", side_effect=self.a),
+            patch.object(ai_core, "chain_b_llm", side_effect=self.b),
+            patch.object(ai_core, "chain_c_llm", side_effect=self.c),
+        )
+
+
+def _run(items, chains: _FakeChains, concurrency: int = 4):
+    s1, s2, s3, s4, s5 = _llm_settings(concurrency)
+    c1, c2, c3 = chains.patches()
+    with s1, s2, s3, s4, s5, c1, c2, c3:
+        return ai_core.process_batch(items)
+
+
+class TestConcurrentBatch:
+    def test_order_preserved_and_faster_than_serial(self):
+        items = [_item(i) for i in range(8)]
+        chains = _FakeChains(delay=0.05)
+        t0 = time.time()
+        results = _run(items, chains, concurrency=4)
+        elapsed = time.time() - t0
+        assert [r.item_id for r in results] == [i.item_id for i in items]
+        assert all(r.schema_c.title == f"T{r.item_id}" for r in results)
+        # serial would be 8 items x 3 chains x 50ms = 1.2s
+        assert elapsed < 0.8
+        assert 1 < chains.peak <= 4
+
+    def test_per_item_fallback_preserved(self):
+        items = [_item(i) for i in range(4)]
+        chains = _FakeChains(delay=0.0, fail_b_for="id-2")
+        results = _run(items, chains)
+        by_id = {r.item_id: r for r in results}
+        assert by_id["id-1"].schema_b.final_score == 9.0
+        # Chain B fell back to rules for id-2 only; A and C still came from the LLM
+        assert by_id["id-2"].schema_b.final_score != 9.0
+        assert by_id["id-2"].schema_c.title == "Tid-2"
+
+    def test_concurrency_one_is_sequential(self):
+        chains = _FakeChains(delay=0.01)
+        _run([_item(i) for i in range(3)], chains, concurrency=1)
+        assert chains.peak == 1
+
+    def test_rule_based_runs_sequential_without_pool(self):
+        with (
+            patch.object(settings, "LLM_PROVIDER", "none"),
+            patch.object(ai_core, "ThreadPoolExecutor") as pool,
+        ):
+            results = ai_core.process_batch([_item(i) for i in range(3)])
+        assert len(results) == 3
+        pool.assert_not_called()
+
+
+class TestRateLimiter:
+    def test_spacing(self):
+        limiter = ai_core._RateLimiter(20.0)
+        stamps = []
+        for _ in range(3):
+            limiter.acquire()
+            stamps.append(time.monotonic())
+        assert stamps[1] - stamps[0] >= 0.045
+        assert stamps[2] - stamps[1] >= 0.045
+
+    def test_spacing_across_threads(self):
+        limiter = ai_core._RateLimiter(20.0)
+        stamps: list[float] = []
+        lock = threading.Lock()
+
+        def hit():
+            limiter.acquire()
+            with lock:
+                stamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=hit) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stamps.sort()
+        assert stamps[-1] - stamps[0] >= 3 * 0.045
+
+    def test_limiter_shared_per_provider(self):
+        s1, s2, s3, s4, s5 = _llm_settings(rps=5.0)
+        with s1, s2, s3, s4, s5:
+            assert ai_core._provider_limiter() is ai_core._provider_limiter()
+
+    def test_zero_rate_is_unlimited(self):
+        limiter = ai_core._RateLimiter(0.0)
+        t0 = time.monotonic()
+        for _ in range(100):
+            limiter.acquire()
+        assert time.monotonic() - t0 < 0.05
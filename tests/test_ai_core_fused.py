@@ -0,0 +1,101 @@
+"""Tests for the fused single-call Chain A+B+C mode in core/ai_core."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from config import settings
+from core import ai_core
+from schemas.models import RawItem
+
+
+def _item() -> RawItem:
+    return RawItem(
+        item_id="id-1",
+        title="Nvidia unveils Blackwell Ultra GPU",
+        url="https://example.com/nvidia",
+        body="Nvidia announced the Blackwell Ultra GPU for AI data centers with higher memory bandwidth. " * 5,
+        published_at="2026-01-01T00:00:00+00:00",
+        source_name="TechCrunch",
+        source_category="tech",
+        lang="en",
+    )
+
+
+_FULL = {
+    "a": {"title_zh": "輝達發表 Blackwell Ultra", "summary_zh": "輝達推出新 GPU。", "entities": ["Nvidia"]},
+    "b": {"novelty": 8, "utility": 8, "heat": 9, "feasibility": 7, "dup_risk": 0.1, "is_ad": False, "tags": ["GPU"]},
+    "c": {"card_md": "**輝達發表 Blackwell Ultra**", "title": "輝達新 GPU", "brief": "新 GPU"},
+}
+
+
+def _run(response: str | Exception):
+    kwargs = {"side_effect": response} if isinstance(response, Exception) else {"return_value": response}
+    with (
+        patch.object(settings, "LLM_PROVIDER", "deepseek"),
+        patch.object(settings, "LLM_BASE_URL", "https://llm.example.com/v1"),
+        patch.object(settings, "LLM_API_KEY", "k"),
+        patch.object(settings, "LLM_CHAIN_MODE", "fused"),
+        patch.object(ai_core, "_chat_completion", **kwargs) as chat,
+    ):
+        result = ai_core.process_item(_item())
+    return result, chat
+
+
+class TestFusedMode:
+    def test_single_call_fills_all_schemas(self):
+        result, chat = _run(json.dumps(_FULL, ensure_ascii=False))
+        assert chat.call_count == 1
+        assert result.schema_a.title_zh == "輝達發表 Blackwell Ultra"
+        assert result.schema_a.source_id == "TechCrunch"
+        assert result.schema_b.final_score == 8.0  # computed from the four dimensions
+        assert result.schema_b.tags == ["GPU"]
+        assert result.schema_c.card_md.startswith("**輝達")
+        assert result.schema_c.cta_url == "https://example.com/nvidia"
+        assert {result.schema_a.item_id, result.schema_b.item_id, result.schema_c.item_id} == {"id-1"}
+
+    def test_fenced_response_parsed(self):
+        raw = "Here you go:\n```json\n" + json.dumps(_FULL, ensure_ascii=False) + "\n```"
+        result, _ = _run(raw)
+        assert result.schema_c.title == "輝達新 GPU"
+
+    def test_missing_section_falls_back_for_that_chain_only(self):
+        partial = {"a": _FULL["a"], "c": _FULL["c"]}
+        result, chat = _run(json.dumps(partial, ensure_ascii=False))
+        assert chat.call_count == 1
+        assert result.schema_a.title_zh == "輝達發表 Blackwell Ultra"
+        assert result.schema_b.tags != ["GPU"]  # rule-based scoring
+        assert result.schema_b.item_id == "id-1"
+        assert result.schema_c.card_md.startswith("**輝達")
+
+    def test_malformed_section_falls_back(self):
+        bad = dict(_FULL, b={"novelty": "very", "utility": 1})
+        result, _ = _run(json.dumps(bad, ensure_ascii=False))
+        assert result.schema_b.tags != ["GPU"]
+        assert result.schema_a.title_zh
+
+    def test_call_failure_uses_rules_for_all_chains(self):
+        result, chat = _run(RuntimeError("503"))
+        assert chat.call_count == 1
+        assert result.schema_a.item_id == "id-1"
+        assert result.schema_c.card_md  # rule-based card
+
+    def test_separate_mode_unchanged(self):
+        with (
+            patch.object(settings, "LLM_PROVIDER", "deepseek"),
+            patch.object(settings, "LLM_BASE_URL", "https://llm.example.com/v1"),
+            patch.object(settings, "LLM_API_KEY", "k"),
+            patch.object(settings, "LLM_CHAIN_MODE", "separate"),
+            patch.object(ai_core, "_chat_completion", return_value="{}") as chat,
+        ):
+            ai_core.process_item(_item())
+        assert chat.call_count == 3
+
+
+class TestParseJson:
+    def test_nested_object_returned_whole(self):
+        assert ai_core._parse_json_from_llm('noise {"a": {"x": 1}, "b": 2} tail') == {"a": {"x": 1}, "b": 2}
+
+    def test_flat_object_unchanged(self):
+        assert ai_core._parse_json_from_llm('Result: {"final_score": 7} done') == {"final_score": 7}
@@ -10,6 +10,7 @@ from utils.article_fetch import (
     ERR_BLOCKED,
     ERR_EXTRACT_EMPTY,
     ERR_EXTRACT_LOW_QUALITY,
+    ERR_RATE_LIMITED,
     _check_quality,
     enrich_items,
     fetch_article_text,
@@ -65,14 +66,14 @@ class TestRetryStrategy:
         assert mock_get.call_count == 1
 
     @patch("utils.article_fetch.requests.get")
-    def test_429_returns_blocked(self, mock_get):
-        """429 response → blocked error code."""
+    def test_429_returns_rate_limited(self, mock_get):
+        """429 response → transient rate_limited error code, not blocked."""
         resp = MagicMock()
         resp.status_code = 429
         mock_get.return_value = resp
 
         _text, err = fetch_article_text("https://example.com/article")
-        assert err == ERR_BLOCKED
+        assert err == ERR_RATE_LIMITED
 
 
 class TestFallbackExtractor:
@@ -126,7 +127,7 @@ class TestStatsTracking:
     @patch("utils.article_fetch.time.sleep")
     @patch("utils.article_fetch.fetch_article_text")
     def test_blocked_counted_correctly(self, mock_fetch, mock_sleep):
-        """403/429 blocked errors are counted in stats."""
+        """403 blocked errors are counted in stats."""
         items = [_make_item(item_id=f"item_{i}", url=f"https://ex.com/{i}") for i in range(3)]
         stats = EnrichStats()
 
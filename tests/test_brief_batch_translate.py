@@ -0,0 +1,163 @@
+"""Tests for the concurrent batch Qwen translation of brief events in run_once (no server)."""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from scripts import run_once
+
+_BODY = (
+    "NVIDIA announced the Blackwell B200 GPU on March 18, 2025, delivering 20 petaflops of FP4 compute "
+    "and 192GB of HBM3e memory. The company said Microsoft, Google and Amazon Web Services will deploy "
+    "B200 systems in 2025, with prices estimated at $30,000 to $40,000 per unit. NVIDIA CEO Jensen Huang "
+    "said the GB200 NVL72 rack connects 72 Blackwell GPUs and 36 Grace CPUs, offering 30x faster LLM "
+    "inference than H100. Analysts at Morgan Stanley expect data center revenue to grow 45% year over "
+    "year to $120 billion in fiscal 2026. OpenAI and Meta confirmed they will train next-generation "
+    "models on Blackwell clusters starting in the fourth quarter of 2025. "
+)
+
+_REPLY = (
+    "[WHAT]\n"
+    "NVIDIA 正式發布新一代 Blackwell B200 圖形處理器，提供 20 petaflops 的運算能力與大容量記憶體配置\n"
+    "NVIDIA 表示微軟與谷歌等雲端業者將於 2025 年開始部署 B200 系統以擴充雲端運算能力\n"
+    "NVIDIA 執行長黃仁勳指出新款機櫃可連接 72 顆 Blackwell 處理器並大幅提升整體推論效能\n"
+    "OpenAI 與 Meta 確認將於 2025 年第四季在 Blackwell 叢集上訓練新一代大型語言模型\n"
+    "亞馬遜雲端服務將在 2025 年導入 B200 系統並提供企業客戶以租用方式使用相關算力\n"
+    "[KEY]\n"
+    "每顆 B200 的價格預估介於 30,000 至 40,000 美元之間，明顯高於前代 H100 的定價水準\n"
+    "摩根士丹利預期資料中心營收將年增 45% 並達到 1200 億美元的規模水準與市場高點\n"
+    "新款機櫃同時搭載 36 顆中央處理器，推論效能較前代 H100 產品快上 30 倍之多\n"
+    "B200 單卡配備 192GB 高頻寬記憶體並提供 20 petaflops 的低精度浮點運算能力\n"
+    "[WHY]\n"
+    "新款機櫃推論速度較 H100 快 30 倍，將改變資料中心的成本結構與採購決策方向\n"
+    "微軟與谷歌在 2025 年部署 B200 將加速大型模型訓練與推論服務的商業化進程\n"
+    "資料中心營收成長 45% 顯示 NVIDIA 在人工智慧晶片市場的定價能力持續強化\n"
+    "OpenAI 與 Meta 採用 Blackwell 叢集將推動下一代模型能力提升與成本競爭加劇\n"
+)
+
+
+def _card(i: int) -> dict:
+    return {
+        "title": f"NVIDIA Blackwell B200 GPU launch number {i} with 20 petaflops",
+        "actor_primary": "NVIDIA",
+        "ai_relevance": True,
+        "full_text": _BODY * 2 + f" Extra detail {i}: revenue rose {10 + i}% to ${i}.5 billion.",
+        "anchors": ["NVIDIA", "Blackwell", "B200", "H100"],
+        "final_url": f"https://example.com/{i}",
+        "category": "tech",
+        "source_name": "Reuters",
+    }
+
+
+class _FakeQwen:
+    def __init__(self, garble: str = "") -> None:
+        self.garble = garble  # requests containing this text get an unusable reply
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, messages, **kwargs):
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        if self.garble and self.garble in str(messages):
+            return True, "garbage"
+        return True, _REPLY
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state(monkeypatch):
+    monkeypatch.setenv("BRIEF_TRANSLATION_READY", "1")
+    run_once._brief_batch_cache.clear()
+    monkeypatch.setitem(run_once._llama_probe, "checked_at", 0.0)
+    yield
+    run_once._brief_batch_cache.clear()
+
+
+def _prepare(qwen: _FakeQwen, slots: int, cards: list[dict], max_events: int = 4):
+    with (
+        patch("utils.llama_openai_client.chat", qwen),
+        patch("utils.llama_openai_client.is_available", return_value=True),
+        patch("utils.llama_openai_client.server_slots", return_value=slots),
+    ):
+        return run_once._prepare_brief_final_cards(copy.deepcopy(cards), max_events=max_events)
+
+
+class TestPrepareBriefConcurrent:
+    def test_slots_bound_in_flight_calls_and_keep_output(self):
+        cards = [_card(i) for i in range(6)]
+        serial_qwen = _FakeQwen()
+        serial, serial_diag = _prepare(serial_qwen, 1, cards)
+        run_once._brief_batch_cache.clear()
+        parallel_qwen = _FakeQwen()
+        parallel, parallel_diag = _prepare(parallel_qwen, 3, cards)
+
+        assert len(serial) == 4
+        assert serial_qwen.peak == 1
+        assert serial_qwen.calls == 4
+        assert parallel_qwen.peak == 3
+        assert parallel == serial
+        assert parallel_diag == serial_diag
+
+    def test_prefetch_stops_at_max_events(self):
+        non_ai = dict(_card(1), ai_relevance=False)
+        cards = [_card(0), non_ai, _card(2)]
+        serial_qwen = _FakeQwen()
+        serial, serial_diag = _prepare(serial_qwen, 1, cards, max_events=1)
+        run_once._brief_batch_cache.clear()
+        parallel_qwen = _FakeQwen()
+        parallel, parallel_diag = _prepare(parallel_qwen, 3, cards, max_events=1)
+
+        assert serial_qwen.calls == parallel_qwen.calls == 1
+        assert serial_diag["drop_non_ai"] == 0
+        assert parallel == serial
+        assert parallel_diag == serial_diag
+
+    def test_drops_recorded_in_serial_order(self):
+        # Event 0 is dropped after translation, event 1 before it.
+        cards = [dict(_card(i), actor_primary="") if i % 2 else _card(i) for i in range(7)]
+        serial, serial_diag = _prepare(_FakeQwen(garble="number 0"), 1, cards)
+        run_once._brief_batch_cache.clear()
+        parallel, parallel_diag = _prepare(_FakeQwen(garble="number 0"), 3, cards)
+
+        assert [e["reason"] for e in serial_diag["dropped_events"][:2]] == [
+            "density_target_not_met",
+            "actor_invalid",
+        ]
+        assert parallel == serial
+        assert parallel_diag == serial_diag
+
+    def test_fact_pack_cache_skips_repeat_calls(self):
+        cards = [_card(i) for i in range(3)]
+        qwen = _FakeQwen()
+        first, _ = _prepare(qwen, 2, cards, max_events=3)
+        calls = qwen.calls
+        second, _ = _prepare(qwen, 2, cards, max_events=3)
+        assert qwen.calls == calls
+        assert second == first
+
+
+class TestAvailabilityProbe:
+    def test_probe_cached_for_the_run(self, monkeypatch):
+        monkeypatch.delenv("BRIEF_TRANSLATION_READY", raising=False)
+        with patch("utils.llama_openai_client.is_available", return_value=True) as probe:
+            assert run_once._is_translation_engine_ready()
+            assert run_once._llama_available_cached(timeout=4)
+            assert run_once._is_translation_engine_ready()
+        assert probe.call_count == 1
+
+    def test_probe_refreshed_after_ttl(self, monkeypatch):
+        monkeypatch.setattr(run_once, "_LLAMA_PROBE_TTL_S", 0.0)
+        with patch("utils.llama_openai_client.is_available", return_value=False) as probe:
+            assert not run_once._llama_available_cached()
+            assert not run_once._llama_available_cached()
+        assert probe.call_count == 2
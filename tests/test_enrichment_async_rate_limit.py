@@ -35,7 +35,7 @@ class TestSemaphoreConcurrency:
         current_concurrent = 0
         lock = asyncio.Lock()
 
-        async def mock_fetch(url, sem, domain_locks, domain_lock):
+        async def mock_fetch(url, sem, layer):
             nonlocal max_concurrent, current_concurrent
             async with sem:
                 async with lock:
@@ -49,7 +49,10 @@ class TestSemaphoreConcurrency:
         items = [_make_hn_item(f"item_{i}", f"https://site{i}.com/article") for i in range(6)]
         stats = EnrichStats()
 
-        with patch("utils.article_fetch._async_fetch_one", side_effect=mock_fetch):
+        with (
+            patch("utils.article_fetch._async_fetch_one", side_effect=mock_fetch),
+            patch("utils.article_fetch.get_fetch_layer", return_value=object()),
+        ):
             loop = asyncio.new_event_loop()
             try:
                 loop.run_until_complete(_enrich_items_async_impl(items, stats))
@@ -65,7 +68,7 @@ class TestPerDomainPoliteness:
         """Requests to the same domain should be spaced by ≥ politeness delay."""
         domain_timestamps: list[float] = []
 
-        async def mock_fetch(url, sem, domain_locks, domain_lock):
+        async def mock_fetch(url, sem, layer):
             domain_timestamps.append(time.time())
             return "Content " * 100, "", 0.01
 
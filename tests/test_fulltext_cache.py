@@ -0,0 +1,136 @@
+"""Tests for utils/fulltext_cache.py and its use by hydration / enrichment (no network)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from schemas.models import RawItem
+from utils.fulltext_cache import FulltextCache
+from utils.metrics import EnrichStats
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    c = FulltextCache(tmp_path / "fulltext_cache.db")
+    yield c
+    c.close()
+
+
+def _ok_result(url: str) -> dict:
+    text = "Full article paragraph. " * 30
+    return {
+        "final_url": url,
+        "status": "ok",
+        "full_text": text,
+        "fulltext_len": len(text),
+        "reason": "ok",
+        "fidelity": {"extract_method": "article_ps", "cleaned_text_len": len(text)},
+    }
+
+
+class TestFulltextCache:
+    def test_roundtrip_keyed_by_normalized_url(self, cache: FulltextCache):
+        cache.put("hydrate", "https://e.com/a?utm_source=x", _ok_result("https://e.com/a"), "ok")
+        got = cache.get("hydrate", "https://e.com/a/")
+        assert got is not None
+        assert got["fidelity"]["extract_method"] == "article_ps"
+
+    def test_final_url_is_also_a_key(self, cache: FulltextCache):
+        cache.put(
+            "hydrate",
+            "https://news.google.com/rss/articles/X",
+            _ok_result("https://pub.com/s"),
+            "ok",
+            final_url="https://pub.com/s",
+        )
+        assert cache.get("hydrate", "https://pub.com/s") is not None
+
+    def test_kinds_are_separate(self, cache: FulltextCache):
+        cache.put("hydrate", "https://e.com/a", _ok_result("https://e.com/a"), "ok")
+        assert cache.get("enrich", "https://e.com/a") is None
+
+    def test_negative_reasons_cached_transient_not(self, cache: FulltextCache):
+        assert cache.put("hydrate", "https://e.com/403", {"status": "fail", "reason": "http_403"}, "http_403")
+        assert not cache.put("hydrate", "https://e.com/slow", {"status": "fail", "reason": "timeout"}, "timeout")
+        hit = cache.get("hydrate", "https://e.com/403")
+        assert hit is not None and hit["reason"] == "http_403"
+        assert cache.get("hydrate", "https://e.com/slow") is None
+
+    def test_expired_entries_ignored(self, tmp_path: Path):
+        c = FulltextCache(tmp_path / "ttl.db", ttl_s=-1, neg_ttl_s=-1)
+        try:
+            c.put("hydrate", "https://e.com/a", _ok_result("https://e.com/a"), "ok")
+            assert c.get("hydrate", "https://e.com/a") is None
+            assert c.prune() == 1
+        finally:
+            c.close()
+
+
+class TestHydratorUsesCache:
+    def test_second_batch_skips_network(self, cache: FulltextCache, tmp_path: Path):
+        from utils import fulltext_hydrator
+
+        items = [RawItem("1", "t", "https://e.com/a", "body", "", "s", "tech", "en")]
+        calls: list[str] = []
+
+        def fake_hydrate(url, timeout_s=8):
+            calls.append(url)
+            return _ok_result(url)
+
+        with (
+            patch.object(fulltext_hydrator, "_get_fulltext_cache", return_value=cache),
+            patch.object(fulltext_hydrator, "hydrate_fulltext", side_effect=fake_hydrate),
+            patch.object(fulltext_hydrator, "_write_hydrator_meta"),
+            patch.object(fulltext_hydrator, "_write_fidelity_meta"),
+        ):
+            fulltext_hydrator.hydrate_items_batch(items)
+            again = [RawItem("1", "t", "https://e.com/a", "body", "", "s", "tech", "en")]
+            fulltext_hydrator.hydrate_items_batch(again)
+
+        assert calls == ["https://e.com/a"]
+        assert getattr(again[0], "fulltext_status", "") == "ok"
+        assert getattr(again[0], "fulltext_fidelity", {})["extract_method"] == "article_ps"
+
+
+class TestEnrichmentUsesCache:
+    def test_cached_result_applied_without_fetch(self, cache: FulltextCache):
+        from utils import article_fetch
+
+        text = "Recovered article text. " * 40
+        cache.put("enrich", "https://hn.example.com/post", {"text": text, "error": ""}, "")
+        item = RawItem("1", "HN Post", "https://hn.example.com/post", "HN Post", "", "HackerNews", "tech", "en")
+        stats = EnrichStats()
+
+        with (
+            patch("utils.fulltext_cache.get_fulltext_cache", return_value=cache),
+            patch.object(article_fetch, "_async_fetch_one") as fetch_one,
+        ):
+            article_fetch.enrich_items_async([item], stats=stats)
+
+        fetch_one.assert_not_called()
+        assert item.body == text
+        assert stats.cache_hits == 1
+        assert stats.attempted == 0
+
+    def test_rate_limited_result_not_cached(self, cache: FulltextCache):
+        from utils import article_fetch
+        from utils.http_fetch import FetchResult
+
+        url = "https://hn.example.com/post"
+
+        class _Layer:
+            async def fetch(self, url, timeout_s=None, refresh=False):
+                return FetchResult(url, final_url=url, status=429)
+
+        item = RawItem("1", "HN Post", url, "HN Post", "", "HackerNews", "tech", "en")
+        stats = EnrichStats()
+        with (
+            patch("utils.fulltext_cache.get_fulltext_cache", return_value=cache),
+            patch.object(article_fetch, "get_fetch_layer", return_value=_Layer()),
+        ):
+            article_fetch.enrich_items_async([item], stats=stats)
+
+        assert stats.fail_reasons == {"rate_limited": 1}
+        assert cache.get("enrich", url) is None
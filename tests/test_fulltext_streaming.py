@@ -0,0 +1,100 @@
+"""Tests for incremental (streaming) extraction in utils/fulltext_hydrator.py."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from utils import fulltext_hydrator as fh
+
+_PARA = "Researchers released a new open model that beats prior results on reasoning benchmarks — café {n}."
+
+
+def _page(n_article: int, trailing: int = 0, wrapper: str = "article") -> str:
+    body = "".join(f"<p>  {_PARA.format(n=i)}\n   </p>" for i in range(n_article))
+    tail = "".join(f"<p>Related story number {i} that is long enough to qualify as text.</p>" for i in range(trailing))
+    return (
+        "<html><head><title>t</title><script>var x = '<p>no</p>';</script></head><body>"
+        f"<nav><p>Menu entry that should never be extracted at all, ever.</p></nav>"
+        f"<{wrapper}>{body}</{wrapper}>"
+        f"<div>{tail}</div></body></html>"
+    )
+
+
+def _fake_stream(html: str, chunk_size: int, consumed: list[int], closed: list[bool]):
+    raw = html.encode("utf-8")
+
+    def _open(url, timeout_s):
+        def _chunks():
+            for i in range(0, len(raw), chunk_size):
+                consumed.append(i)
+                yield raw[i : i + chunk_size]
+
+        return url, "utf-8", _chunks(), lambda: closed.append(True)
+
+    return _open
+
+
+def _stream(html: str, chunk_size: int = 7):
+    consumed: list[int] = []
+    closed: list[bool] = []
+    with patch.object(fh, "_open_html_stream", side_effect=_fake_stream(html, chunk_size, consumed, closed)):
+        parser, _final_url, head, kept = fh._stream_page("https://example.com/a", 5)
+    return parser, head, kept, len(consumed), closed
+
+
+class TestStreamingExtraction:
+    def test_matches_whole_document_extraction(self):
+        """Tiny chunks (splitting tags and multibyte chars) give the same result."""
+        html = _page(12)
+        parser, _head, _kept, _n, closed = _stream(html)
+        assert fh._finish_extraction(parser) == fh._extract_text(html)
+        assert closed == [True]
+
+    def test_stops_when_article_closes(self):
+        html = _page(5, trailing=2000)
+        parser, _head, kept, consumed, _closed = _stream(html, chunk_size=1024)
+        total_chunks = -(-len(html.encode("utf-8")) // 1024)
+        assert parser.done
+        assert consumed < total_chunks / 10
+        assert kept == ""  # body is not retained for publisher pages
+        text, fidelity = fh._finish_extraction(parser)
+        assert fidelity["raw_paragraph_count"] == 5
+        assert "Related story" not in text
+
+    def test_keeps_reading_main_around_article(self):
+        html = (
+            _page(3)
+            .replace("<article>", "<main><article>")
+            .replace("</article>", "</article><p>Closing paragraph of the main region, long enough to keep.</p></main>")
+        )
+        parser, _head, _kept, _n, _closed = _stream(html, chunk_size=64)
+        assert parser._article_ps[-1].startswith("Closing paragraph")
+        assert fh._finish_extraction(parser) == fh._extract_text(html)
+
+    def test_stops_after_paragraph_cap(self):
+        html = _page(500, wrapper="main")
+        parser, _head, _kept, consumed, _closed = _stream(html, chunk_size=1024)
+        assert parser.done
+        assert len(parser._article_ps) >= fh.MAX_PARAGRAPHS
+        assert consumed < 10
+        _text, fidelity = fh._finish_extraction(parser)
+        assert fidelity["raw_paragraph_count"] == fh.MAX_PARAGRAPHS
+
+    def test_paragraphs_normalized_once_in_parser(self):
+        parser, _head, _kept, _n, _closed = _stream(_page(3))
+        assert all("  " not in p and "\n" not in p for p in parser._article_ps)
+
+    def test_head_kept_for_js_detection(self):
+        html = "<html><body><noscript>Please enable JavaScript to continue.</noscript></body></html>"
+        _parser, head, _kept, _n, _closed = _stream(html)
+        assert head == html
+
+    def test_hydrate_fulltext_uses_stream(self):
+        html = _page(8)
+        consumed: list[int] = []
+        closed: list[bool] = []
+        with patch.object(fh, "_open_html_stream", side_effect=_fake_stream(html, 64, consumed, closed)):
+            result = fh.hydrate_fulltext("https://example.com/a", timeout_s=5)
+        assert result["status"] == "ok"
+        assert result["fidelity"]["cleaned_paragraph_count"] == 8
+        assert closed == [True]
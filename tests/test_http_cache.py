@@ -0,0 +1,126 @@
+"""Tests for utils/http_cache.py and conditional GET in feed fetchers (no network)."""
+
+from __future__ import annotations
+
+import email.message
+import io
+import urllib.error
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from utils.http_cache import HttpValidatorCache
+
+_XML = b"<rss><channel><item><title>T</title><link>https://e.com/a</link></item></channel></rss>"
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    c = HttpValidatorCache(tmp_path / "http_cache.db")
+    yield c
+    c.close()
+
+
+class TestValidatorCache:
+    def test_no_headers_for_unknown_url(self, cache: HttpValidatorCache):
+        assert cache.conditional_headers("https://e.com/feed") == {}
+
+    def test_store_and_conditional_headers(self, cache: HttpValidatorCache):
+        cache.store("https://e.com/feed", '"abc"', "Wed, 19 Feb 2026 09:00:00 GMT", _XML, "utf-8")
+        assert cache.conditional_headers("https://e.com/feed") == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 19 Feb 2026 09:00:00 GMT",
+        }
+
+    def test_response_without_validators_not_stored(self, cache: HttpValidatorCache):
+        cache.store("https://e.com/feed", None, None, _XML)
+        assert cache.lookup("https://e.com/feed") is None
+
+    def test_not_modified_returns_body_and_counts_hit(self, cache: HttpValidatorCache):
+        cache.store("https://e.com/feed", '"abc"', None, _XML, "utf-8")
+        cached = cache.not_modified("https://e.com/feed")
+        assert cached is not None
+        assert cached.text() == _XML.decode()
+        assert cache.stats() == {"hits": 1, "misses": 0}
+
+    def test_persists_across_instances(self, tmp_path: Path):
+        path = tmp_path / "c.db"
+        first = HttpValidatorCache(path)
+        first.store("https://e.com/feed", '"v1"', None, _XML)
+        first.close()
+        second = HttpValidatorCache(path)
+        try:
+            assert second.conditional_headers("https://e.com/feed") == {"If-None-Match": '"v1"'}
+        finally:
+            second.close()
+
+    def test_prune_drops_stale_entries(self, cache: HttpValidatorCache):
+        cache.store("https://e.com/feed", '"abc"', None, _XML)
+        assert cache.prune(max_age_days=-1) == 1
+        assert cache.lookup("https://e.com/feed") is None
+
+
+class TestIngestionConditionalGet:
+    def test_304_reuses_stored_body(self, cache: HttpValidatorCache):
+        from core import ingestion
+
+        first = MagicMock(status_code=200, headers={"ETag": '"abc"'}, content=_XML, encoding="utf-8")
+        first.text = _XML.decode()
+        second = MagicMock(status_code=304, headers={}, content=b"", encoding=None)
+        session = MagicMock()
+        session.get.side_effect = [first, second]
+
+        with (
+            patch.object(ingestion, "get_http_cache", return_value=cache),
+            patch.object(ingestion, "_session_for", return_value=session),
+        ):
+            assert ingestion._fetch_feed_text("https://e.com/feed") == _XML.decode()
+            assert ingestion._fetch_feed_text("https://e.com/feed") == _XML.decode()
+
+        assert session.get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"abc"'}
+        assert cache.stats() == {"hits": 1, "misses": 1}
+
+    def test_304_without_stored_entry_refetches(self, cache: HttpValidatorCache):
+        from core import ingestion
+
+        cache.store("https://e.com/feed", '"abc"', None, _XML)
+        not_modified = MagicMock(status_code=304, headers={}, content=b"", encoding=None)
+        full = MagicMock(status_code=200, headers={"ETag": '"def"'}, content=_XML, encoding="utf-8")
+        full.text = _XML.decode()
+        session = MagicMock()
+
+        def _get(url, timeout, headers=None):
+            cache.prune(max_age_days=-1)  # entry dropped while the request was in flight
+            return not_modified if headers else full
+
+        session.get.side_effect = _get
+        with (
+            patch.object(ingestion, "get_http_cache", return_value=cache),
+            patch.object(ingestion, "_session_for", return_value=session),
+        ):
+            assert ingestion._fetch_feed_text("https://e.com/feed") == _XML.decode()
+
+        assert session.get.call_count == 2
+        assert "headers" not in session.get.call_args.kwargs
+        stored = cache.lookup("https://e.com/feed")
+        assert stored is not None and stored.body == _XML
+
+
+class TestZ0ConditionalGet:
+    def test_304_http_error_reuses_stored_body(self, cache: HttpValidatorCache):
+        from core import z0_collector
+
+        cache.store("https://e.com/feed", '"abc"', None, _XML, "utf-8")
+        not_modified = urllib.error.HTTPError(
+            "https://e.com/feed", 304, "Not Modified", email.message.Message(), io.BytesIO(b"")
+        )
+
+        with (
+            patch.object(z0_collector, "_http_cache", return_value=cache),
+            patch("urllib.request.urlopen", side_effect=not_modified) as urlopen,
+        ):
+            assert z0_collector._fetch_url("https://e.com/feed") == _XML.decode()
+
+        sent = urlopen.call_args.args[0]
+        assert sent.get_header("If-none-match") == '"abc"'
+        assert cache.stats()["hits"] == 1
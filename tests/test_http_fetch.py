@@ -0,0 +1,166 @@
+"""Tests for utils/http_fetch.py — shared session, memo, byte cap, token buckets."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from utils.http_fetch import ERR_CONNECTION, FetchLayer, _TokenBucket
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits: dict[str, int] = {}  # noqa: RUF012
+
+    def do_GET(self):
+        _Handler.hits[self.path] = _Handler.hits.get(self.path, 0) + 1
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/article")
+            self.end_headers()
+            return
+        if self.path == "/big":
+            body = b"x" * 50_000
+        elif self.path == "/missing":
+            self.send_response(404)
+            self.end_headers()
+            return
+        else:
+            body = "<html><body>café</body></html>".encode("latin-1")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=iso-8859-1")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    _Handler.hits = {}
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture()
+def layer():
+    fl = FetchLayer(domain_rate=0, max_bytes=10_000, timeout_s=5)
+    try:
+        yield fl
+    finally:
+        fl.close()
+
+
+class TestFetchLayer:
+    def test_redirect_tracked_and_charset_decoded(self, server, layer):
+        res = layer.fetch_sync(f"{server}/redirect")
+        assert res.ok
+        assert res.final_url.endswith("/article")
+        assert res.redirects == 1
+        assert "café" in res.text()
+
+    def test_each_url_downloaded_once_per_run(self, server, layer):
+        url = f"{server}/article"
+        first = layer.fetch_sync(url)
+        second = asyncio.run(layer.fetch(url))
+        assert first is second
+        assert _Handler.hits["/article"] == 1
+        assert layer.stats() == {"downloads": 1, "memo_hits": 1}
+
+    def test_concurrent_callers_share_inflight_download(self, server, layer):
+        url = f"{server}/article"
+        results = layer.fetch_many_sync([url, url, url])
+        assert len(results) == 1
+        assert _Handler.hits["/article"] == 1
+
+    def test_body_capped(self, server, layer):
+        res = layer.fetch_sync(f"{server}/big")
+        assert len(res.body) == 10_000
+        assert res.truncated
+
+    def test_http_error_is_status_not_error(self, server, layer):
+        res = layer.fetch_sync(f"{server}/missing")
+        assert res.status == 404
+        assert not res.error
+        assert not res.ok
+
+    def test_memo_bounded_by_bytes(self, server):
+        fl = FetchLayer(domain_rate=0, max_bytes=10_000, timeout_s=5, memo_max_bytes=10_050)
+        try:
+            big = fl.fetch_sync(f"{server}/big")
+            article = fl.fetch_sync(f"{server}/article")
+            assert fl.cached(f"{server}/big") is big
+            fl.fetch_sync(f"{server}/redirect")  # 30 more bytes push /big out
+            assert fl.cached(f"{server}/big") is None
+            assert fl.cached(f"{server}/article") is article
+        finally:
+            fl.close()
+
+    def test_connection_error_not_memoized(self, layer):
+        url = "http://127.0.0.1:9/unreachable"
+        res = layer.fetch_sync(url, timeout_s=2)
+        assert res.error == ERR_CONNECTION
+        assert layer.cached(url) is None
+
+
+class TestTokenBucket:
+    def test_same_domain_spaced_after_burst(self):
+        async def run() -> list[float]:
+            bucket = _TokenBucket(rate=20.0, burst=1)
+            stamps = []
+            for _ in range(3):
+                await bucket.acquire()
+                stamps.append(time.monotonic())
+            return stamps
+
+        stamps = asyncio.run(run())
+        assert stamps[1] - stamps[0] >= 0.04
+        assert stamps[2] - stamps[1] >= 0.04
+
+    def test_other_domains_do_not_wait(self):
+        async def run() -> float:
+            slow = _TokenBucket(rate=1.0, burst=1)
+            fast = _TokenBucket(rate=1.0, burst=1)
+            await slow.acquire()
+            waiter = asyncio.ensure_future(slow.acquire())
+            t0 = time.monotonic()
+            await fast.acquire()
+            elapsed = time.monotonic() - t0
+            waiter.cancel()
+            return elapsed
+
+        assert asyncio.run(run()) < 0.1
+
+
+class TestOpenStream:
+    def test_stream_yields_capped_chunks(self, server, layer):
+        with layer.open_stream(f"{server}/big", max_bytes=5_000) as stream:
+            assert stream.head.ok
+            body = b"".join(stream)
+        assert len(body) == 5_000
+
+    def test_stream_replays_memoized_body(self, server, layer):
+        url = f"{server}/article"
+        layer.fetch_sync(url)
+        with layer.open_stream(url) as stream:
+            body = b"".join(stream)
+        assert body == layer.cached(url).body
+        assert _Handler.hits["/article"] == 1
+
+    def test_stream_error_status_has_no_body(self, server, layer):
+        stream = layer.open_stream(f"{server}/missing")
+        assert stream.head.status == 404
+        assert list(stream) == []
@@ -30,6 +30,15 @@ T6  test_big_ai_company_no_gloss
 
 T7  test_non_big_proper_noun_still_glossed
     — Benchmark / tool names in glossary (e.g. SWE-bench) still get ZH annotation.
+
+T8  test_single_scan_matches_term_by_term
+    — the compiled single-scan annotator gives the same text and `seen` set as
+      annotating term by term (longest first, nested / overlapping terms).
+
+T9  test_glossary_compiled_once
+    — equal glossaries share one compiled form; annotations nesting a shorter
+      term (GPT-4o → "GPT-4 全模態版") keep the term-by-term result without
+      leaving the single scan.
 """
 from __future__ import annotations
 
@@ -38,6 +47,7 @@ import pytest
 from utils.hybrid_glossing import (
     NO_GLOSS_TERMS,
     apply_glossary,
+    compile_glossary,
     ensure_not_all_english,
     extract_proper_nouns,
     get_gloss_stats,
@@ -258,3 +268,67 @@ def test_non_big_proper_noun_still_glossed(term: str, zh: str):
     assert f"{term}（{zh}）" in result, (
         f"Expected '{term}（{zh}）' in output, got: {result!r}"
     )
+
+
+# ---------------------------------------------------------------------------
+# T8
+# ---------------------------------------------------------------------------
+
+_OVERLAP_GLOSSARY = {
+    "Google DeepMind": "谷歌深度心智",
+    "DeepMind": "深度心智",
+    "DeepMind Lab": "深度心智實驗室",
+    "Meta AI": "Meta 人工智慧",
+    "AI Studio": "AI 工作室",
+    "Studio": "工作室",
+    "LLaMA": "大型語言模型元素",
+    "Llama": "大型語言模型",
+}
+
+
+@pytest.mark.parametrize("text,seen_in,expected", [
+    # Suffix term ending where a longer term was annotated counts as annotated.
+    ("Google DeepMind and DeepMind labs", set(),
+     "Google DeepMind（谷歌深度心智） and DeepMind labs"),
+    # An annotation splitting a shorter term's occurrence moves it to the next one.
+    ("Google DeepMind Lab; DeepMind Lab later", set(),
+     "Google DeepMind（谷歌深度心智） Lab; DeepMind Lab（深度心智實驗室） later"),
+    # Case-insensitive match, first of two same-key entries wins.
+    ("llama weights", set(), "llama（大型語言模型元素） weights"),
+    # Already annotated in the input.
+    ("Studio（工作室） tools", set(), "Studio（工作室） tools"),
+    # Caller-provided seen set is honoured.
+    ("DeepMind research", {"deepmind"}, "DeepMind research"),
+])
+def test_single_scan_matches_term_by_term(text: str, seen_in: set, expected: str):
+    """T8: Single-scan annotation reproduces the term-by-term result."""
+    seen = set(seen_in)
+    result = apply_glossary(text, _OVERLAP_GLOSSARY, seen)
+    assert result == expected
+
+
+# ---------------------------------------------------------------------------
+# T9
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("text,seen_in,expected", [
+    ("GPT-4o ships today.", set(),
+     "GPT-4o（GPT-4（第四代生成式預訓練模型） 全模態版） ships today."),
+    # An earlier GPT-4 in the text is annotated instead of the nested one.
+    ("GPT-4 and GPT-4o", set(),
+     "GPT-4（第四代生成式預訓練模型） and GPT-4o（GPT-4 全模態版）"),
+    ("GPT-4o after GPT-4", set(),
+     "GPT-4o（GPT-4（第四代生成式預訓練模型） 全模態版） after GPT-4"),
+    ("GPT-4o ships today.", {"gpt-4"}, "GPT-4o（GPT-4 全模態版） ships today."),
+])
+def test_glossary_compiled_once(monkeypatch, text: str, seen_in: set, expected: str):
+    """T9: Equal glossaries share one compiled form; nested annotations stay in one scan."""
+    assert compile_glossary(dict(_GLOSSARY)) is compile_glossary(dict(_GLOSSARY))
+
+    nested = {"GPT-4o": "GPT-4 全模態版", "GPT-4": "第四代生成式預訓練模型"}
+    compiled = compile_glossary(nested)
+    monkeypatch.setattr(compiled, "_apply_sequential", None)
+    seen = set(seen_in)
+    assert apply_glossary(text, nested, seen) == expected
+    assert seen == {"gpt-4o", "gpt-4"}
@@ -0,0 +1,174 @@
+"""Tests for concurrent Z1 feed fetching in core/ingestion.fetch_all_feeds."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from config import settings
+from core import ingestion
+from schemas.models import RawItem
+
+
+def _item(name: str) -> RawItem:
+    return RawItem(
+        item_id=f"id-{name}",
+        title=f"{name} headline",
+        url=f"https://{name}.example.com/a",
+        body="body",
+        published_at="2026-01-01T00:00:00+00:00",
+        source_name=name,
+        source_category="tech",
+        lang="en",
+    )
+
+
+_FEEDS = [
+    {"name": "zeta", "url": "https://zeta.example.com/rss", "lang": "en"},
+    {"name": "OpenAI", "url": "https://openai.com/blog/rss.xml", "lang": "en"},
+    {"name": "alpha", "url": "https://alpha.example.com/rss", "lang": "en"},
+    {"name": "slow", "url": "https://slow.example.com/rss", "lang": "en"},
+]
+
+
+def _run_fetch_all(tmp_path: Path, fake_fetch, concurrency: int = 4, deadline: int = 5) -> list[RawItem]:
+    with (
+        patch.object(settings, "RSS_FEEDS", _FEEDS),
+        patch.object(settings, "PROJECT_ROOT", tmp_path),
+        patch.object(settings, "FEED_FETCH_CONCURRENCY", concurrency),
+        patch.object(settings, "FEED_FETCH_DEADLINE_SEC", deadline),
+        patch.object(ingestion, "fetch_feed", side_effect=fake_fetch),
+        patch.object(ingestion, "get_http_cache", return_value=None),
+        patch("core.sources.fetch_all_sources_with_stats", return_value=([], {})),
+        patch("utils.article_fetch.enrich_items_async", side_effect=lambda items, stats=None: items),
+        patch("utils.fulltext_hydrator.hydrate_items_batch", side_effect=lambda items: items),
+    ):
+        return ingestion.fetch_all_feeds()
+
+
+class TestConcurrentFeedFetch:
+    def test_feeds_run_in_parallel(self, tmp_path: Path):
+        """All four feeds are in flight at once (a barrier only opens for four)."""
+        barrier = threading.Barrier(len(_FEEDS), timeout=5)
+
+        def fake_fetch(cfg, deadline_s=None):
+            barrier.wait()
+            return [_item(cfg["name"])]
+
+        items = _run_fetch_all(tmp_path, fake_fetch)
+
+        assert len(items) == 4
+        assert not barrier.broken
+
+    def test_tier_a_first_order_preserved(self, tmp_path: Path):
+        """Results keep the Tier-A-first, name-sorted order regardless of finish order."""
+        delays = {"OpenAI": 0.15, "alpha": 0.0, "slow": 0.05, "zeta": 0.1}
+
+        def fake_fetch(cfg, deadline_s=None):
+            time.sleep(delays[cfg["name"]])
+            return [_item(cfg["name"])]
+
+        items = _run_fetch_all(tmp_path, fake_fetch)
+        assert [i.source_name for i in items] == ["OpenAI", "alpha", "slow", "zeta"]
+
+        meta = json.loads((tmp_path / "outputs" / "feed_stats.meta.json").read_text(encoding="utf-8"))
+        assert [f["name"] for f in meta["source_feeds"]] == ["OpenAI", "alpha", "slow", "zeta"]
+        assert meta["tier_a_feeds"] == 1
+        assert meta["total_from_rss"] == 4
+
+    def test_feed_past_deadline_counts_as_failed(self, tmp_path: Path):
+        """A hung feed is dropped once its deadline elapses; others still return."""
+        release = threading.Event()
+
+        def fake_fetch(cfg, deadline_s=None):
+            if cfg["name"] == "slow":
+                release.wait(10)
+                return [_item("slow")]
+            return [_item(cfg["name"])]
+
+        try:
+            with patch.object(ingestion, "_DEADLINE_GRACE_S", 0.0):
+                items = _run_fetch_all(tmp_path, fake_fetch, deadline=1)
+        finally:
+            release.set()
+
+        assert sorted(i.source_name for i in items) == ["OpenAI", "alpha", "zeta"]
+        meta = json.loads((tmp_path / "outputs" / "feed_stats.meta.json").read_text(encoding="utf-8"))
+        returned = {f["name"]: f["returned"] for f in meta["source_feeds"]}
+        assert returned["slow"] == 0
+
+    def test_deadline_counts_from_feed_start(self, tmp_path: Path):
+        """Feeds queued behind a busy worker get their own deadline, not a shared budget."""
+
+        def fake_fetch(cfg, deadline_s=None):
+            time.sleep(0.4)
+            return [_item(cfg["name"])]
+
+        with patch.object(ingestion, "_DEADLINE_GRACE_S", 0.0):
+            items = _run_fetch_all(tmp_path, fake_fetch, concurrency=1, deadline=1)
+
+        assert len(items) == 4
+
+    def test_slow_first_feed_does_not_hold_back_queue(self, tmp_path: Path):
+        """With two workers, the feeds queued behind a slow first feed run on the free worker."""
+        last_done = threading.Event()
+
+        def fake_fetch(cfg, deadline_s=None):
+            if cfg["name"] == "OpenAI":  # first in Tier-A-first order
+                return [_item("OpenAI")] if last_done.wait(5) else []
+            if cfg["name"] == "zeta":  # last in order
+                last_done.set()
+            return [_item(cfg["name"])]
+
+        items = _run_fetch_all(tmp_path, fake_fetch, concurrency=2)
+
+        assert [i.source_name for i in items] == ["OpenAI", "alpha", "slow", "zeta"]
+
+    def test_abandoned_feed_cannot_open_sessions(self, tmp_path: Path):
+        """A worker past its deadline cannot recreate sessions after they are closed."""
+        release = threading.Event()
+        outcome: list[BaseException | None] = []
+        finished = threading.Event()
+
+        def fake_fetch(cfg, deadline_s=None):
+            if cfg["name"] == "slow":
+                release.wait(10)
+                try:
+                    ingestion._session_for("https://late.example.com/rss")
+                    outcome.append(None)
+                except RuntimeError as exc:
+                    outcome.append(exc)
+                finished.set()
+                return []
+            return [_item(cfg["name"])]
+
+        try:
+            with patch.object(ingestion, "_DEADLINE_GRACE_S", 0.0):
+                _run_fetch_all(tmp_path, fake_fetch, deadline=1)
+        finally:
+            release.set()
+        assert finished.wait(5)
+
+        assert isinstance(outcome[0], RuntimeError)
+        assert "late.example.com" not in ingestion._SESSIONS
+
+    def test_sessions_closed_after_fetch(self, tmp_path: Path):
+        with patch.object(ingestion, "close_feed_sessions") as close:
+            _run_fetch_all(tmp_path, lambda cfg, deadline_s=None: [_item(cfg["name"])])
+        close.assert_called_once()
+
+
+class TestSessionPool:
+    def test_same_host_shares_session(self):
+        ingestion.close_feed_sessions()
+        try:
+            a = ingestion._session_for("https://example.com/a.xml")
+            b = ingestion._session_for("https://example.com/b.xml")
+            c = ingestion._session_for("https://other.example.org/feed")
+            assert a is b
+            assert a is not c
+        finally:
+            ingestion.close_feed_sessions()
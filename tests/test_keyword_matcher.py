@@ -0,0 +1,50 @@
+"""Tests for the compiled keyword matcher (utils/keyword_matcher.py)."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from utils.keyword_matcher import KeywordMatcher, keyword_matcher
+
+_TABLES = {
+    "ai": ["gpt", "chatgpt", "model", "foundation model", "ai", "大模型", "模型"],
+    "sec": ["sec", "security", "cybersecurity", "ab", "bc"],
+    "dup": ["gpt", "gpt", "nvidia"],
+}
+_ALPHABET = ["gpt", "chat", "security", "cyber", "model ", "foundation ", "大模型", "abc", "nvidia", " ", "x", "s", "e"]
+
+
+def _loop(tables: dict[str, list[str]], text: str) -> dict[str, int]:
+    return {name: sum(1 for kw in kws if kw in text) for name, kws in tables.items()}
+
+
+@pytest.mark.parametrize("regex_min", [0, 10**9], ids=["regex", "contains"])
+class TestKeywordMatcher:
+    def test_counts_match_substring_loops(self, regex_min: int):
+        matcher = KeywordMatcher(_TABLES, regex_min=regex_min)
+        rng = random.Random(7)
+        for _ in range(500):
+            text = "".join(rng.choice(_ALPHABET) for _ in range(rng.randint(0, 12)))
+            assert matcher.counts(text) == _loop(_TABLES, text), text
+            assert matcher.any(text) == any(_loop(_TABLES, text).values())
+
+    def test_nested_and_overlapping_keywords(self, regex_min: int):
+        matcher = KeywordMatcher(_TABLES, regex_min=regex_min)
+        assert matcher.counts("chatgpt on cybersecurity: abc") == {"ai": 2, "sec": 5, "dup": 2}
+        assert matcher.counts("開源大模型") == {"ai": 2, "sec": 0, "dup": 0}
+        assert matcher.count("") == 0
+
+    def test_single_list(self, regex_min: int):
+        matcher = KeywordMatcher({"sponsored", "promo", "click here"}, regex_min=regex_min)
+        assert matcher.count("sponsored post, click here") == 2
+        assert not matcher.any("plain news")
+
+
+def test_regex_used_only_for_large_tables():
+    assert KeywordMatcher(["a", "b"], regex_min=3)._regex is None
+    assert KeywordMatcher(["a", "b", "c"], regex_min=3)._regex is not None
+
+
+def test_shared_matcher_is_cached():
+    assert keyword_matcher(("openai", "nvidia")) is keyword_matcher(("openai", "nvidia"))
@@ -0,0 +1,219 @@
+"""Tests for utils/llm_cache.py and its use by the model call sites (no network)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from config import settings
+from utils import llm_cache
+from utils.llm_cache import LLMResponseCache, cache_key
+from utils.metrics import MetricsCollector
+
+_MSGS = [{"role": "user", "content": "Summarise: OpenAI ships a model"}]
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    c = LLMResponseCache(tmp_path / "llm_cache.db")
+    yield c
+    c.close()
+
+
+@pytest.fixture
+def shared_cache(tmp_path: Path, monkeypatch):
+    """Enable the process-wide cache on a temp file for call-site tests."""
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "1")
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "shared.db"))
+    llm_cache.reset_llm_cache()
+    yield llm_cache.get_llm_cache()
+    llm_cache.reset_llm_cache()
+
+
+class TestCacheKey:
+    def test_every_component_changes_the_key(self):
+        base = cache_key("http://h/v1/chat/completions", "m", 0.0, _MSGS, max_tokens=800)
+        assert base == cache_key("http://h/v1/chat/completions/", "m", 0, _MSGS, max_tokens=800)
+        assert base != cache_key("http://other/v1/chat/completions", "m", 0.0, _MSGS, max_tokens=800)
+        assert base != cache_key("http://h/v1/chat/completions", "m2", 0.0, _MSGS, max_tokens=800)
+        assert base != cache_key("http://h/v1/chat/completions", "m", 0.3, _MSGS, max_tokens=800)
+        assert base != cache_key("http://h/v1/chat/completions", "m", 0.0, _MSGS + _MSGS, max_tokens=800)
+        assert base != cache_key("http://h/v1/chat/completions", "m", 0.0, _MSGS, max_tokens=900)
+
+
+class TestLLMResponseCache:
+    def test_roundtrip_and_counters(self, cache: LLMResponseCache):
+        key = cache_key("e", "m", 0, _MSGS)
+        assert cache.get(key) is None
+        assert cache.put(key, "answer", "e", "m")
+        assert cache.get(key) == "answer"
+        assert cache.stats() == {"hits": 1, "misses": 1, "stores": 1, "evictions": 0}
+
+    def test_empty_response_not_stored(self, cache: LLMResponseCache):
+        assert not cache.put("k", "")
+        assert cache.get("k") is None
+
+    def test_expired_entries_miss_and_prune(self, tmp_path: Path):
+        c = LLMResponseCache(tmp_path / "ttl.db", ttl_s=-1)
+        c.put("k", "v")
+        assert c.get("k") is None
+        assert c.prune() == 1
+        c.close()
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path: Path):
+        c = LLMResponseCache(tmp_path / "lru.db", max_entries=2)
+        c.put("a", "1")
+        time.sleep(0.01)
+        c.put("b", "2")
+        time.sleep(0.01)
+        assert c.get("a") == "1"  # "b" is now least recently used
+        time.sleep(0.01)
+        c.put("c", "3")
+        assert c.get("b") is None
+        assert c.get("a") == "1"
+        assert c.get("c") == "3"
+        assert c.stats()["evictions"] == 1
+        c.close()
+
+    def test_get_or_call_calls_once(self, cache: LLMResponseCache):
+        calls = []
+
+        def call():
+            calls.append(1)
+            return "fresh"
+
+        for _ in range(3):
+            assert cache.get_or_call(call, "e", "m", 0.2, _MSGS, max_tokens=10) == "fresh"
+        assert len(calls) == 1
+
+    def test_get_or_call_skips_store_when_invalid(self, cache: LLMResponseCache):
+        replies = iter(["garbage", "usable", "unused"])
+
+        def call():
+            return next(replies)
+
+        for expected in ("garbage", "usable", "usable"):
+            assert cache.get_or_call(call, "e", "m", 0.2, _MSGS, validate=lambda r: r == "usable") == expected
+        assert cache.stats()["stores"] == 1
+
+    def test_persists_across_instances(self, tmp_path: Path):
+        path = tmp_path / "persist.db"
+        c1 = LLMResponseCache(path)
+        c1.put("k", "v")
+        c1.close()
+        c2 = LLMResponseCache(path)
+        assert c2.get("k") == "v"
+        c2.close()
+
+
+class TestCallSites:
+    def test_ai_core_chat_completion_cached(self, shared_cache):
+        from core import ai_core
+
+        with (
+            patch.object(settings, "LLM_BASE_URL", "https://llm.example.com/v1"),
+            patch.object(settings, "LLM_MODEL", "deepseek-chat"),
+            patch.object(ai_core, "_post_chat_completion", return_value='{"x": 1}') as post,
+        ):
+            assert ai_core._chat_completion(_MSGS) == '{"x": 1}'
+            assert ai_core._chat_completion(_MSGS) == '{"x": 1}'
+            ai_core._chat_completion(_MSGS, temperature=0.9)
+        assert post.call_count == 2
+        assert shared_cache.stats()["hits"] == 1
+
+    def test_ai_core_unparsable_chain_reply_not_cached(self, shared_cache):
+        from core import ai_core
+        from schemas.models import RawItem
+
+        item = RawItem("i1", "OpenAI ships a model", "https://e.com/a", "body", "", "src", "tech", "en")
+        good = '{"title_zh": "標題", "summary_zh": "摘要"}'
+        with patch.object(ai_core, "_post_chat_completion", side_effect=["not json", good, good]) as post:
+            assert ai_core.chain_a_llm(item).title_zh == ""
+            assert ai_core.chain_a_llm(item).title_zh == "標題"
+            assert ai_core.chain_a_llm(item).title_zh == "標題"
+        assert post.call_count == 2
+
+    def test_ai_core_partial_batch_reply_not_cached(self, shared_cache):
+        from core import ai_core
+        from schemas.models import RawItem, SchemaA
+
+        pairs = [
+            (RawItem(f"i{n}", f"t{n}", f"https://e.com/{n}", "body", "", "src", "tech", "en"), SchemaA(item_id=f"i{n}"))
+            for n in (1, 2)
+        ]
+        partial = '[{"item_id": "i1", "novelty": 7}]'
+        full = '[{"item_id": "i1", "novelty": 7}, {"item_id": "i2", "novelty": 6}]'
+        with patch.object(ai_core, "_post_chat_completion", side_effect=[partial, full, full]) as post:
+            assert set(ai_core.chain_b_llm_batch(pairs)) == {"i1"}
+            assert set(ai_core.chain_b_llm_batch(pairs)) == {"i1", "i2"}
+            assert set(ai_core.chain_b_llm_batch(pairs)) == {"i1", "i2"}
+        assert post.call_count == 2
+
+    def test_llama_openai_client_chat_cached(self, shared_cache):
+        from utils import llama_openai_client as client
+
+        reply = {"choices": [{"message": {"content": " hello "}}]}
+        with patch.object(client, "_post", return_value=reply) as post:
+            assert client.chat(_MSGS) == (True, "hello")
+            assert client.chat(_MSGS) == (True, "hello")
+        assert post.call_count == 1
+
+    def test_llama_openai_client_failure_not_cached(self, shared_cache):
+        from utils import llama_openai_client as client
+
+        with patch.object(client, "_post", return_value={"choices": []}) as post:
+            assert client.chat(_MSGS)[0] is False
+            assert client.chat(_MSGS)[0] is False
+        assert post.call_count == 2
+
+    def test_ollama_generate_cached(self, shared_cache):
+        from utils import ollama_client
+
+        with patch.object(ollama_client, "_post_json", return_value={"response": "ok"}) as post:
+            assert ollama_client.generate("prompt") == "ok"
+            assert ollama_client.generate("prompt") == "ok"
+            assert ollama_client.generate("prompt", num_predict=64) == "ok"
+        assert post.call_count == 2
+
+    def test_generate_bbc_news_rerun_skips_server(self, shared_cache):
+        import llm_engine
+
+        reply = {"choices": [{"message": {"content": "draft"}}]}
+        with (
+            patch.object(llm_engine, "_post_chat", new=AsyncMock(return_value=reply)) as post,
+            patch.object(llm_engine, "_validate_output", return_value=(True, [])),
+        ):
+            first = asyncio.run(llm_engine.generate_bbc_news("raw text", "BBC", "2026-01-01"))
+            second = asyncio.run(llm_engine.generate_bbc_news("raw text", "BBC", "2026-01-01"))
+        assert first == second == "draft"
+        assert post.call_count == 1
+
+    def test_generate_bbc_news_invalid_reply_not_cached(self, shared_cache):
+        import llm_engine
+
+        replies = [{"choices": [{"message": {"content": text}}]} for text in ("bad", "good", "bad", "good")]
+        with (
+            patch.object(llm_engine, "_post_chat", new=AsyncMock(side_effect=replies)) as post,
+            patch.object(llm_engine, "_validate_output", side_effect=lambda out, *a: (out == "good", ["x"])),
+            patch.object(llm_engine.asyncio, "sleep", new=AsyncMock()),
+        ):
+            assert asyncio.run(llm_engine.generate_bbc_news("raw text", "BBC", "2026-01-01")) == "good"
+            assert asyncio.run(llm_engine.generate_bbc_news("raw text", "BBC", "2026-01-01")) == "good"
+        # The rejected first draft is requested again; only the repaired reply is replayed.
+        assert post.call_count == 3
+        assert shared_cache.stats()["stores"] == 1
+
+
+class TestMetrics:
+    def test_hit_miss_counts_exported(self, shared_cache):
+        collector = MetricsCollector()
+        collector.start()
+        shared_cache.get_or_call(lambda: "v", "e", "m", 0, _MSGS)
+        shared_cache.get_or_call(lambda: "v", "e", "m", 0, _MSGS)
+        collector.stop()
+        d = collector.to_dict()
+        assert d["llm_cache_hits"] == 1
+        assert d["llm_cache_misses"] == 1
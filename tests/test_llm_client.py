@@ -0,0 +1,236 @@
+"""Tests for utils/llm_client.py — pooled sync/async/streaming LLM client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+from utils import llm_client
+from utils.llm_client import LLMClient, LLMClientError
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    ports: set[int] = set()  # noqa: RUF012
+    fail_first: dict[str, int] = {}  # noqa: RUF012
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, obj: dict) -> None:
+        body = json.dumps(obj).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        _Handler.ports.add(self.client_address[1])
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.path == "/flaky" and _Handler.fail_first.get(self.path, 0) > 0:
+            _Handler.fail_first[self.path] -= 1
+            self._reply(503, {"error": "busy"})
+            return
+        if self.path == "/bad":
+            self._reply(400, {"error": "bad request"})
+            return
+        if self.path == "/slow":
+            with _Handler.lock:
+                _Handler.active += 1
+                _Handler.peak = max(_Handler.peak, _Handler.active)
+            time.sleep(0.1)
+            with _Handler.lock:
+                _Handler.active -= 1
+        if payload.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            for word in ["Hello", " wor", "ld"] * (200 if self.path == "/long" else 1):
+                event = {"choices": [{"delta": {"content": word}}]}
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+                self.wfile.flush()
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.close_connection = True
+            return
+        text = payload["messages"][-1]["content"].upper()
+        self._reply(
+            200,
+            {
+                "choices": [{"message": {"content": text}}],
+                "usage": {"prompt_tokens": 7, "completion_tokens": 3},
+            },
+        )
+
+
+@pytest.fixture()
+def server():
+    _Handler.ports = set()
+    _Handler.fail_first = {"/flaky": 2}
+    _Handler.active = _Handler.peak = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture(params=[True, False], ids=["aiohttp", "urllib"])
+def client(request):
+    if request.param:
+        pytest.importorskip("aiohttp")
+    c = LLMClient(concurrency=2, timeout_s=5, retries=2, backoff_s=0.01, use_aiohttp=request.param)
+    try:
+        yield c
+    finally:
+        c.close()
+
+
+_MSGS = [{"role": "user", "content": "hi"}]
+
+
+class TestLLMClient:
+    def test_sync_chat_and_token_stats(self, server, client):
+        res = client.chat(f"{server}/v1/chat/completions", _MSGS, model="m", max_tokens=10)
+        assert res.text == "HI"
+        assert (res.prompt_tokens, res.completion_tokens) == (7, 3)
+        stats = client.stats()
+        assert stats["requests"] == 1
+        assert stats["prompt_tokens"] == 7
+        assert stats["completion_tokens"] == 3
+
+    def test_async_chat(self, server, client):
+        async def run():
+            return await asyncio.gather(
+                *(
+                    client.achat(f"{server}/v1/chat/completions", [{"role": "user", "content": f"q{i}"}], model="m")
+                    for i in range(4)
+                )
+            )
+
+        assert [r.text for r in asyncio.run(run())] == ["Q0", "Q1", "Q2", "Q3"]
+
+    def test_retries_transient_status(self, server, client):
+        assert client.post_json(f"{server}/flaky", {"messages": _MSGS})["choices"]
+        assert client.stats()["retries"] == 2
+
+    def test_client_error_not_retried(self, server, client):
+        with pytest.raises(LLMClientError) as info:
+            client.post_json(f"{server}/bad", {"messages": _MSGS})
+        assert info.value.status == 400
+        assert not info.value.retryable
+        assert client.stats()["retries"] == 0
+
+    def test_connection_error_after_retries(self, client):
+        with pytest.raises(LLMClientError) as info:
+            client.post_json("http://127.0.0.1:9/v1/chat/completions", {"messages": _MSGS}, retries=1)
+        assert info.value.retryable
+        assert client.stats() | {"latency_p50": 0, "latency_p95": 0} == {
+            "requests": 1,
+            "retries": 1,
+            "errors": 1,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "latency_p50": 0,
+            "latency_p95": 0,
+        }
+
+    def test_concurrency_limit(self, server, client):
+        def call(i):
+            client.post_json(f"{server}/slow", {"messages": [{"role": "user", "content": str(i)}]})
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert _Handler.peak <= 2
+
+    def test_stream_chat(self, server, client):
+        chunks = list(client.stream_chat(f"{server}/v1/chat/completions", {"model": "m", "messages": _MSGS}))
+        assert "".join(chunks) == "Hello world"
+
+    def test_stream_early_stop(self, server, client):
+        stream = client.stream_chat(f"{server}/long", {"model": "m", "messages": _MSGS})
+        first = [next(stream) for _ in range(3)]
+        stream.close()
+        assert "".join(first) == "Hello world"
+
+    def test_async_stream(self, server, client):
+        async def run():
+            return [c async for c in client.astream_chat(f"{server}/x", {"model": "m", "messages": _MSGS})]
+
+        assert "".join(asyncio.run(run())) == "Hello world"
+
+    def test_stream_error_raises(self, server, client):
+        with pytest.raises(LLMClientError):
+            list(client.stream_chat(f"{server}/bad", {"model": "m", "messages": _MSGS}))
+
+
+class TestPooling:
+    def test_sequential_requests_reuse_one_connection(self, server):
+        pytest.importorskip("aiohttp")
+        c = LLMClient(concurrency=2, timeout_s=5)
+        try:
+            for _ in range(5):
+                c.post_json(f"{server}/v1/chat/completions", {"messages": _MSGS})
+        finally:
+            c.close()
+        assert len(_Handler.ports) == 1
+
+
+class TestCallSites:
+    @pytest.fixture(autouse=True)
+    def _fresh_client(self):
+        llm_client.reset_llm_client()
+        yield
+        llm_client.reset_llm_client()
+
+    def test_llama_openai_client_uses_shared_client(self, server):
+        from utils import llama_openai_client
+
+        with patch.object(llama_openai_client, "LLAMA_HOST", server):
+            assert llama_openai_client.chat(_MSGS) == (True, "HI")
+        assert llm_client.llm_client_stats()["requests"] == 1
+
+    def test_llama_openai_client_never_raises(self):
+        from utils import llama_openai_client
+
+        with patch.object(llama_openai_client, "LLAMA_HOST", "http://127.0.0.1:9"):
+            ok, err = llama_openai_client.chat(_MSGS, max_retries=0)
+        assert not ok
+        assert "failed" in err
+
+    def test_ai_core_posts_through_shared_client(self, server):
+        from config import settings
+        from core import ai_core
+
+        with (
+            patch.object(settings, "LLM_BASE_URL", f"{server}/v1"),
+            patch.object(settings, "LLM_API_KEY", "k"),
+        ):
+            assert ai_core._chat_completion(_MSGS) == "HI"
+        assert llm_client.llm_client_stats()["requests"] == 1
+
+    def test_generate_bbc_news_native_async(self, server):
+        import llm_engine
+
+        with (
+            patch.object(llm_engine, "API_URL", f"{server}/v1/chat/completions"),
+            patch.object(llm_engine, "_validate_output", return_value=(True, [])),
+        ):
+            out = asyncio.run(llm_engine.generate_bbc_news("raw", "BBC", "2026-01-01"))
+        assert out  # upper-cased user prompt echoed back
+        assert llm_client.llm_client_stats()["requests"] == 1
@@ -0,0 +1,74 @@
+"""Tests for llm_engine prompt-prefix reuse across repair attempts (no server)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import llm_engine
+
+
+class _FakeClient:
+    def __init__(self, replies: list[str]) -> None:
+        self.replies = list(replies)
+        self.payloads: list[dict] = []
+
+    async def apost_json(self, url, payload, **kwargs):
+        self.payloads.append(payload)
+        n = len(self.payloads)
+        return {
+            "choices": [{"message": {"content": self.replies.pop(0)}}],
+            "usage": {"prompt_tokens": 1000 if n == 1 else 1050},
+            "timings": {"prompt_n": 1000 if n == 1 else 50},
+        }
+
+
+def _validate(text, raw_text, source, date):
+    return (text == "good"), ([] if text == "good" else ["ellipsis_forbidden"])
+
+
+def _generate(client: _FakeClient, **kwargs) -> str:
+    with (
+        patch.object(llm_engine, "get_llm_client", return_value=client),
+        patch.object(llm_engine, "_validate_output", side_effect=_validate),
+        patch.object(llm_engine.asyncio, "sleep", AsyncMock()),
+    ):
+        return asyncio.run(llm_engine.generate_bbc_news("raw article", "BBC", "2026-01-01", **kwargs))
+
+
+class TestPromptPrefixReuse:
+    def test_repairs_extend_the_first_prompt(self):
+        client = _FakeClient(["bad one", "bad two", "good"])
+        assert _generate(client) == "good"
+
+        first, second, third = (p["messages"] for p in client.payloads)
+        assert second[:2] == first
+        assert third[:2] == first
+        assert second[2] == {"role": "assistant", "content": "bad one"}
+        assert third[2] == {"role": "assistant", "content": "bad two"}
+        assert "raw article" not in second[3]["content"]
+        assert "ellipsis_forbidden" in second[3]["content"]
+
+    def test_payload_requests_cache_and_pins_slot(self):
+        client = _FakeClient(["bad", "good"])
+        _generate(client, slot=2)
+        assert all(p["cache_prompt"] is True for p in client.payloads)
+        assert [p["id_slot"] for p in client.payloads] == [2, 2]
+
+    def test_no_slot_means_any_slot(self):
+        client = _FakeClient(["good"])
+        _generate(client)
+        assert "id_slot" not in client.payloads[0]
+
+    def test_prompt_token_stats(self):
+        before = llm_engine.prompt_cache_stats()
+        _generate(_FakeClient(["bad", "good"]))
+        after = llm_engine.prompt_cache_stats()
+        assert after["prompt_tokens_evaluated"] - before["prompt_tokens_evaluated"] == 1050
+        # the repair re-sends 1050 prompt tokens but only its 50-token tail is evaluated
+        assert after["prompt_tokens_reused"] - before["prompt_tokens_reused"] == 1000
+
+    def test_cache_n_preferred_when_reported(self):
+        before = llm_engine.prompt_cache_stats()["prompt_tokens_reused"]
+        llm_engine._record_prompt_timings({"timings": {"prompt_n": 5, "cache_n": 700}, "usage": {"prompt_tokens": 9}})
+        assert llm_engine.prompt_cache_stats()["prompt_tokens_reused"] - before == 700
@@ -0,0 +1,86 @@
+"""Tests for streaming validation with early abort in llm_engine (no server)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import llm_engine
+import pytest
+from llm_engine import _early_violation
+
+
+class _StreamClient:
+    def __init__(self, replies: list[list[str]]) -> None:
+        self.replies = list(replies)
+        self.payloads: list[dict] = []
+        self.consumed: list[int] = []
+
+    async def astream_chat(self, url, payload, **kwargs):
+        self.payloads.append(payload)
+        chunks = self.replies.pop(0)
+        self.consumed.append(0)
+        for chunk in chunks:
+            self.consumed[-1] += 1
+            yield chunk
+
+
+def _validate(text, raw_text, source, date):
+    ok = text.startswith("Q1: good")
+    return ok, ([] if ok else ["q1_missing_quote_token"])
+
+
+def _generate(client: _StreamClient) -> tuple[str, int]:
+    """Run a streaming generate_bbc_news; returns (output, number of sleeps)."""
+    with (
+        patch.object(llm_engine, "get_llm_client", return_value=client),
+        patch.object(llm_engine, "_validate_output", side_effect=_validate),
+        patch.object(llm_engine.asyncio, "sleep", AsyncMock()) as sleep,
+    ):
+        out = asyncio.run(llm_engine.generate_bbc_news("raw article", "BBC", "2026-01-01", stream=True))
+    return out, sleep.await_count
+
+
+class TestEarlyViolation:
+    @pytest.mark.parametrize(
+        ("partial", "reason"),
+        [
+            ("Q1: 一句話...", "ellipsis_forbidden"),
+            ("Q1: 一句話…", "ellipsis_forbidden"),
+            ("Q1: {placeholder", "braces_forbidden"),
+            ("Q1: 此事具有重要意義", "generic_phrase_hit:具有重要意義"),
+            ("Sure! Q1:", "format_parse_failed"),
+            ("Q1: a\nQ3:\n- x", "format_parse_failed"),
+            ("Q1: a\nQ2: b\nQ2: c", "format_parse_failed"),
+        ],
+    )
+    def test_detects(self, partial, reason):
+        assert _early_violation(partial) == reason
+
+    @pytest.mark.parametrize("partial", ["", "Q", "Q1", "Q1: a..", "Q1: a\nQ2: b\nQ3:\n- x\n- y\nPro"])
+    def test_valid_prefixes_pass(self, partial):
+        assert _early_violation(partial) is None
+
+
+class TestStreamingGenerate:
+    def test_aborts_and_repairs_without_waiting(self):
+        long_bad = ["Q1: 開頭", "...", *["more"] * 50]
+        client = _StreamClient([long_bad, ["Q1: good", " ok"]])
+
+        out, sleeps = _generate(client)
+        assert out == "Q1: good ok"
+        assert client.consumed[0] == 2  # stopped right after the ellipsis
+        assert sleeps == 0
+        repair = client.payloads[1]["messages"]
+        assert repair[2] == {"role": "assistant", "content": "Q1: 開頭..."}
+        assert "ellipsis_forbidden" in repair[3]["content"]
+
+    def test_complete_but_invalid_output_still_validated(self):
+        client = _StreamClient([["Q1: bad"], ["Q1: good"]])
+        assert _generate(client)[0] == "Q1: good"
+        assert "q1_missing_quote_token" in client.payloads[1]["messages"][3]["content"]
+
+    def test_every_attempt_aborted_raises_with_reason(self):
+        client = _StreamClient([["Q1: {"], ["Q1: {"], ["Q1: {"]])
+        with pytest.raises(RuntimeError, match="braces_forbidden"):
+            _generate(client)
@@ -0,0 +1,155 @@
+"""Tests for main.py's slot-bounded concurrent llama.cpp generation (no server)."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import main
+from llm_engine import LlamaCppServer
+
+
+class _FakeServer:
+    def __init__(self, parallel: int) -> None:
+        self.parallel = parallel
+        self.stopped = False
+
+    async def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+def _items(n: int) -> list[dict]:
+    return [{"source": f"src{i}", "raw_text": "x" * 60, "published_at": "2026-01-01"} for i in range(n)]
+
+
+def _run(tmp_path: Path, items: list[dict], parallel: int, generate) -> _FakeServer:
+    server = _FakeServer(parallel)
+
+    async def scrape():
+        return items
+
+    with (
+        patch.object(main, "LlamaCppServer", return_value=server),
+        patch.object(main, "scrape_all", scrape),
+        patch.object(main, "generate_bbc_news", generate),
+        patch.object(main, "DB_PATH", tmp_path / "intel.db"),
+        patch.object(main, "OUTPUT_DIR", tmp_path / "out"),
+    ):
+        asyncio.run(main.main())
+    return server
+
+
+class TestConcurrentGeneration:
+    def test_in_flight_requests_bounded_by_slots(self, tmp_path: Path):
+        state = {"active": 0, "peak": 0}
+
+        async def generate(raw_text, source, date, slot=None):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return f"summary of {source}"
+
+        server = _run(tmp_path, _items(7), 3, generate)
+
+        assert state["peak"] == 3
+        assert server.stopped
+        with sqlite3.connect(tmp_path / "intel.db") as conn:
+            rows = conn.execute("SELECT source FROM intel").fetchall()
+        assert sorted(r[0] for r in rows) == sorted(f"src{i}" for i in range(7))
+        report = next((tmp_path / "out").glob("report_*.md")).read_text(encoding="utf-8")
+        assert report.count("## src") == 7
+
+    def test_single_slot_keeps_input_order(self, tmp_path: Path):
+        async def generate(raw_text, source, date, slot=None):
+            await asyncio.sleep(0)
+            return f"summary of {source}"
+
+        _run(tmp_path, _items(4), 1, generate)
+
+        report = next((tmp_path / "out").glob("report_*.md")).read_text(encoding="utf-8")
+        positions = [report.index(f"## src{i}") for i in range(4)]
+        assert positions == sorted(positions)
+
+    def test_failed_item_is_skipped(self, tmp_path: Path):
+        async def generate(raw_text, source, date, slot=None):
+            if source == "src1":
+                raise RuntimeError("boom")
+            return f"summary of {source}"
+
+        _run(tmp_path, _items(3), 2, generate)
+
+        with sqlite3.connect(tmp_path / "intel.db") as conn:
+            rows = conn.execute("SELECT source FROM intel").fetchall()
+        assert sorted(r[0] for r in rows) == ["src0", "src2"]
+
+    def test_report_layout_matches_serial_report(self, tmp_path: Path):
+        async def generate(raw_text, source, date, slot=None):
+            return f"summary of {source}"
+
+        _run(tmp_path, _items(2), 1, generate)
+
+        report_path = next((tmp_path / "out").glob("report_*.md"))
+        header = f"# AI Intel Report — {report_path.stem[len('report_') :]}\n"
+        # Same text the serial loop built with "\n".join(report_lines)
+        lines = [header]
+        for i in range(2):
+            lines += [f"## src{i}  (2026-01-01)\n", f"summary of src{i}\n", "---\n"]
+        expected = "\n".join(lines)
+        assert report_path.read_text(encoding="utf-8") == expected
+
+    def test_save_failure_skips_item_and_keeps_others(self, tmp_path: Path):
+        async def generate(raw_text, source, date, slot=None):
+            await asyncio.sleep(0.01)
+            return f"summary of {source}"
+
+        real_save = main._save_record
+
+        def save(conn, source, summary):
+            if source == "src0":
+                raise sqlite3.OperationalError("disk I/O error")
+            real_save(conn, source, summary)
+
+        with patch.object(main, "_save_record", save):
+            server = _run(tmp_path, _items(3), 2, generate)
+
+        assert server.stopped
+        with sqlite3.connect(tmp_path / "intel.db") as conn:
+            rows = conn.execute("SELECT source FROM intel").fetchall()
+        assert sorted(r[0] for r in rows) == ["src1", "src2"]
+        report = next((tmp_path / "out").glob("report_*.md")).read_text(encoding="utf-8")
+        assert "## src0" not in report
+
+    def test_concurrent_items_get_distinct_slots(self, tmp_path: Path):
+        in_use: set[int] = set()
+        seen: set[int] = set()
+
+        async def generate(raw_text, source, date, slot=None):
+            assert slot not in in_use
+            in_use.add(slot)
+            seen.add(slot)
+            await asyncio.sleep(0.01)
+            in_use.discard(slot)
+            return f"summary of {source}"
+
+        _run(tmp_path, _items(6), 3, generate)
+
+        assert seen == {0, 1, 2}
+
+
+class TestServerCommand:
+    def test_single_slot_command_unchanged(self):
+        cmd = LlamaCppServer(parallel=1).command()
+        assert cmd[cmd.index("-c") + 1] == "2048"
+        assert "-np" not in cmd
+
+    def test_parallel_slots_scale_context(self):
+        cmd = LlamaCppServer(parallel=4, ctx_per_slot=4096).command()
+        assert cmd[cmd.index("-np") + 1] == "4"
+        assert cmd[cmd.index("-c") + 1] == "16384"
+        assert "-cb" in cmd
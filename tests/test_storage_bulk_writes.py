@@ -0,0 +1,85 @@
+"""Tests for batched, pooled SQLite writes in core/storage."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from core import storage
+from schemas.models import MergedResult, RawItem, SchemaA, SchemaB, SchemaC
+
+
+def _item(i: int) -> RawItem:
+    return RawItem(
+        item_id=f"id-{i}",
+        title=f"Headline {i}",
+        url=f"https://example.com/{i}",
+        body="body",
+        published_at="2026-01-01T00:00:00+00:00",
+        source_name="src",
+        source_category="tech",
+        lang="en",
+    )
+
+
+def _result(item_id: str, passed: bool) -> MergedResult:
+    return MergedResult(
+        item_id=item_id,
+        schema_a=SchemaA(item_id=item_id),
+        schema_b=SchemaB(item_id=item_id),
+        schema_c=SchemaC(item_id=item_id),
+        passed_gate=passed,
+    )
+
+
+class TestSaveItems:
+    def test_inserted_counts_only_new_rows(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        storage.init_db(db)
+        assert storage.save_items(db, [_item(i) for i in range(5)]) == 5
+        # 3 already stored + 2 new + an in-batch duplicate
+        assert storage.save_items(db, [_item(i) for i in (0, 1, 2, 5, 6, 6)]) == 2
+        conn = storage.get_connection(db)
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 7
+        assert conn.execute("SELECT COUNT(*) FROM dedup_cache").fetchone()[0] == 7
+        assert conn.execute("SELECT COUNT(*) FROM title_index").fetchone()[0] == 7
+
+    def test_large_batch(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        storage.init_db(db)
+        assert storage.save_items(db, [_item(i) for i in range(20_000)]) == 20_000
+
+    def test_empty_batch(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        storage.init_db(db)
+        assert storage.save_items(db, []) == 0
+
+
+class TestPooledConnection:
+    def test_connection_reused_with_pragmas(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        storage.init_db(db)
+        conn = storage.get_connection(db)
+        assert storage.get_connection(db) is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    def test_close_connections_reopens(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        storage.init_db(db)
+        conn = storage.get_connection(db)
+        storage.close_connections()
+        assert storage.get_connection(db) is not conn
+
+
+class TestSaveResults:
+    def test_results_upserted_and_loadable(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        storage.init_db(db)
+        storage.save_items(db, [_item(1), _item(2)])
+        results = [_result("id-1", passed=True), _result("id-2", passed=False)]
+        assert storage.save_results(db, results) == 2
+        assert storage.save_results(db, results[:1]) == 1
+        loaded = storage.load_passed_results(db)
+        assert [r["item_id"] for r in loaded] == ["id-1"]
+        assert loaded[0]["title"] == "Headline 1"
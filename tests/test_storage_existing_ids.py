@@ -0,0 +1,44 @@
+"""Tests for the batched existence probe in core/storage.get_existing_item_ids."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from core import storage
+
+
+def _seed(db: Path, n: int) -> None:
+    storage.init_db(db)
+    conn = sqlite3.connect(str(db))
+    conn.executemany(
+        "INSERT INTO dedup_cache (item_id, title_hash, url, seen_at) VALUES (?, '', '', ?)",
+        [(f"id-{i}", storage._now_iso()) for i in range(n)],
+    )
+    conn.commit()
+    conn.close()
+
+
+class TestExistingIdProbe:
+    def test_probe_returns_only_known_candidates(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        _seed(db, 50)
+        found = storage.get_existing_item_ids(db, ["id-3", "id-49", "new-1", "id-3"])
+        assert found == {"id-3", "id-49"}
+
+    def test_probe_spans_multiple_chunks(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        _seed(db, storage._IN_CHUNK * 2 + 10)
+        candidates = [f"id-{i}" for i in range(0, storage._IN_CHUNK * 3, 2)]
+        found = storage.get_existing_item_ids(db, iter(candidates))
+        assert found == {c for c in candidates if int(c[3:]) < storage._IN_CHUNK * 2 + 10}
+
+    def test_without_candidates_returns_full_history(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        _seed(db, 20)
+        assert len(storage.get_existing_item_ids(db)) == 20
+
+    def test_empty_candidates(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        _seed(db, 5)
+        assert storage.get_existing_item_ids(db, []) == set()
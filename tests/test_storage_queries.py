@@ -0,0 +1,139 @@
+"""Tests for core/storage schema migrations and the history query API."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from core import storage
+from schemas.models import MergedResult, RawItem, SchemaA, SchemaB, SchemaC
+
+
+def _item(i: int, source: str, category: str, published: str) -> RawItem:
+    return RawItem(
+        item_id=f"id-{i}",
+        title=f"Headline {i}",
+        url=f"https://example.com/{i}",
+        body=f"body {i}",
+        published_at=published,
+        source_name=source,
+        source_category=category,
+        lang="en",
+    )
+
+
+def _seed(db: Path) -> datetime:
+    """Three results created 1h / 3d / 10d ago; id-2 failed the gate."""
+    storage.init_db(db)
+    storage.save_items(
+        db,
+        [
+            _item(1, "OpenAI", "ai", "2026-03-01T00:00:00+00:00"),
+            _item(2, "Reuters", "business", "2026-03-02T00:00:00+00:00"),
+            _item(3, "OpenAI", "ai", "2026-03-03T00:00:00+00:00"),
+        ],
+    )
+    now = datetime.now(UTC)
+    conn = storage.get_connection(db)
+    for item_id, passed, age in (
+        ("id-1", 1, timedelta(hours=1)),
+        ("id-2", 0, timedelta(days=3)),
+        ("id-3", 1, timedelta(days=10)),
+    ):
+        conn.execute(
+            "INSERT INTO ai_results (item_id, schema_a, schema_b, schema_c, passed_gate, created_at)"
+            " VALUES (?, '{}', '{}', '{}', ?, ?)",
+            (item_id, passed, (now - age).isoformat()),
+        )
+    conn.commit()
+    return now
+
+
+class TestMigrations:
+    def test_indexes_created_and_version_recorded(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        storage.init_db(db)
+        conn = storage.get_connection(db)
+        names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {
+            "idx_ai_results_gate_created",
+            "idx_items_source_published",
+            "idx_items_published",
+        } <= names
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == len(storage._MIGRATIONS)
+
+    def test_init_db_is_idempotent(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        storage.init_db(db)
+        storage.init_db(db)
+        conn = storage.get_connection(db)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == len(storage._MIGRATIONS)
+
+    def test_passed_results_query_uses_index(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        storage.init_db(db)
+        plan = " ".join(
+            str(tuple(r))
+            for r in storage.get_connection(db).execute(
+                "EXPLAIN QUERY PLAN SELECT r.item_id FROM ai_results r JOIN items i ON r.item_id = i.item_id"
+                " WHERE r.passed_gate = 1 ORDER BY r.created_at DESC LIMIT 50"
+            )
+        )
+        assert "idx_ai_results_gate_created" in plan
+
+
+class TestQueryApi:
+    def test_time_range(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        now = _seed(db)
+        rows = storage.query_results(db, since=now - timedelta(days=7), passed_only=False)
+        assert [r["item_id"] for r in rows] == ["id-1", "id-2"]
+        rows = storage.query_results(db, since=now - timedelta(days=14), until=now - timedelta(days=2))
+        assert [r["item_id"] for r in rows] == ["id-3"]
+
+    def test_source_and_category_filters(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        _seed(db)
+        assert [r["item_id"] for r in storage.query_results(db, source="OpenAI")] == ["id-1", "id-3"]
+        assert storage.query_results(db, category="business") == []
+        rows = storage.query_results(db, category="business", passed_only=False)
+        assert rows[0]["source_category"] == "business"
+        assert rows[0]["passed_gate"] is False
+
+    def test_count_by_source(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        _seed(db)
+        assert storage.count_results_by_source(db) == {"OpenAI": 2}
+        assert storage.count_results_by_source(db, passed_only=False) == {"OpenAI": 2, "Reuters": 1}
+
+    def test_query_items_by_published_range(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        _seed(db)
+        rows = storage.query_items(db, published_since="2026-03-02T00:00:00+00:00")
+        assert [r["item_id"] for r in rows] == ["id-3", "id-2"]
+
+    def test_load_item_bodies(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        _seed(db)
+        assert storage.load_item_bodies(db, ["id-1", "id-3", "missing", ""]) == {"id-1": "body 1", "id-3": "body 3"}
+
+    def test_load_passed_results_shape_unchanged(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        storage.init_db(db)
+        storage.save_items(db, [_item(1, "OpenAI", "ai", "2026-03-01T00:00:00+00:00")])
+        storage.save_results(
+            db,
+            [
+                MergedResult(
+                    item_id="id-1",
+                    schema_a=SchemaA(item_id="id-1"),
+                    schema_b=SchemaB(item_id="id-1"),
+                    schema_c=SchemaC(item_id="id-1"),
+                    passed_gate=True,
+                )
+            ],
+        )
+        row = storage.load_passed_results(db)[0]
+        for key in ("item_id", "schema_a", "schema_b", "schema_c", "created_at", "title", "url", "source_name"):
+            assert key in row
+        assert row["schema_a"]["item_id"] == "id-1"
@@ -0,0 +1,96 @@
+"""Tests for the shared per-text feature index (utils/text_features.py)."""
+
+from __future__ import annotations
+
+import re
+
+from core.content_gate import density_score
+from core.info_density import classify_density_tier, info_density_breakdown
+from utils import text_features as tf
+from utils.text_features import clear_text_features, text_features
+
+_BODY = (
+    "  OpenAI released GPT-5 on 2026-02-01 with 40% lower latency.  "
+    "NVIDIA H100 clusters cut inference cost to $2 per 1M tokens.\n"
+    "The model is available today.  "
+)
+
+
+class _CountingPattern:
+    """Wraps a compiled pattern and counts full scans."""
+
+    def __init__(self, pattern: str) -> None:
+        self._rx = re.compile(pattern)
+        self.scans = 0
+
+    def findall(self, text: str):
+        self.scans += 1
+        return self._rx.findall(text)
+
+    def search(self, text: str):
+        self.scans += 1
+        return self._rx.search(text)
+
+    def split(self, text: str):
+        self.scans += 1
+        return self._rx.split(text)
+
+
+class TestTextFeatures:
+    def setup_method(self):
+        clear_text_features()
+
+    def test_same_text_shares_one_entry(self):
+        assert text_features(_BODY) is text_features("".join(_BODY))
+        assert text_features(None).text == ""
+
+    def test_each_pattern_scanned_once(self):
+        rx = _CountingPattern(r"\d+")
+        feats = text_features(_BODY)
+        assert feats.count(rx) == feats.count(rx)
+        assert feats.has(rx)
+        assert rx.scans == 1
+
+    def test_parts_and_normalized_views(self):
+        feats = text_features(_BODY)
+        assert feats.stripped.text == _BODY.strip()
+        assert "  " not in feats.collapsed.text
+        assert feats.collapsed.collapsed is feats.collapsed
+        parts = feats.parts(re.compile(r"[.!?]+"))
+        assert parts[0].startswith("OpenAI released GPT-5 on 2026-02-01")
+        assert all(p == p.strip() and p for p in parts)
+
+    def test_keyword_hits_and_cjk_ratio(self):
+        assert text_features("OpenAI and NVIDIA").keyword_hits(("openai", "nvidia", "meta")) == 2
+        assert text_features("OpenAI and NVIDIA").keyword_hits({"openai"}) == 1
+        assert text_features("大模型 AI").cjk_ratio == 3 / 5
+        assert text_features("   ").cjk_ratio == 0.0
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(tf, "_CACHE_SIZE", 2)
+        first = text_features("a")
+        text_features("b")
+        text_features("c")
+        assert text_features("a") is not first
+
+    def test_disabled_cache_still_computes(self, monkeypatch):
+        monkeypatch.setattr(tf, "_CACHE_SIZE", 0)
+        assert text_features("x") is not text_features("x")
+        assert text_features("OpenAI").keyword_hits(("openai",)) == 1
+
+
+class TestGatesShareFeatures:
+    def setup_method(self):
+        clear_text_features()
+
+    def test_breakdown_computed_once_across_kinds(self):
+        first = info_density_breakdown(_BODY)
+        assert info_density_breakdown(" ".join(_BODY.split())) is first
+        tiers = {kind: classify_density_tier(_BODY, kind).breakdown for kind in ("event", "signal", "corp")}
+        assert all(b is first for b in tiers.values())
+
+    def test_density_score_stable_with_and_without_cache(self, monkeypatch):
+        cached = density_score(_BODY)
+        monkeypatch.setattr(tf, "_CACHE_SIZE", 0)
+        assert density_score(_BODY) == cached
+        assert density_score("") == 0
@@ -0,0 +1,160 @@
+"""Tests for indexed near-duplicate title detection (utils.dedupe.TitleIndex + dedup_items)."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from unittest.mock import patch
+
+from config import settings
+from core import storage
+from core.ingestion import dedup_items
+from rapidfuzz import fuzz
+from schemas.models import RawItem
+from utils.dedupe import TitleIndex, title_length_window
+
+
+def _item(i: int, title: str) -> RawItem:
+    return RawItem(
+        item_id=f"id-{i}",
+        title=title,
+        url=f"https://example.com/{i}",
+        body="body",
+        published_at="2026-01-01T00:00:00+00:00",
+        source_name="src",
+        source_category="tech",
+        lang="en",
+    )
+
+
+def _brute_force(items: list[RawItem]) -> list[str]:
+    """The original O(n^2) loop, used as the reference."""
+    seen_ids: set[str] = set()
+    seen_titles: list[str] = []
+    kept: list[str] = []
+    for item in items:
+        if item.item_id in seen_ids:
+            continue
+        if any(fuzz.ratio(item.title, prev) > 85 for prev in seen_titles):
+            continue
+        seen_ids.add(item.item_id)
+        seen_titles.append(item.title)
+        kept.append(item.item_id)
+    return kept
+
+
+def _corpus(n: int, seed: int = 7) -> list[RawItem]:
+    rng = random.Random(seed)
+    words = [
+        "OpenAI",
+        "Google",
+        "Nvidia",
+        "model",
+        "chip",
+        "launch",
+        "release",
+        "funding",
+        "agent",
+        "open",
+        "source",
+        "GPU",
+        "data",
+        "center",
+        "startup",
+        "raises",
+        "billion",
+        "benchmark",
+        "reasoning",
+        "robotics",
+        "policy",
+        "EU",
+        "AI",
+        "Act",
+    ]
+    base = [" ".join(rng.choice(words) for _ in range(rng.randint(3, 12))) for _ in range(n // 2)]
+    titles = []
+    for t in base:
+        titles.append(t)
+        # near-duplicate variants: typo, suffix, truncation
+        variant = list(t)
+        if variant:
+            variant[rng.randrange(len(variant))] = rng.choice("abcxyz")
+        titles.append(rng.choice(["".join(variant), t + " - Reuters", t[: max(1, len(t) - 6)]]))
+    rng.shuffle(titles)
+    return [_item(i, t) for i, t in enumerate(titles)]
+
+
+class TestTitleIndex:
+    def test_same_decisions_as_pairwise_loop(self):
+        items = _corpus(600)
+        expected = _brute_force(items)
+        assert [i.item_id for i in dedup_items(items)] == expected
+        assert len(expected) < len(items)  # corpus really contains near-duplicates
+
+    def test_boundary_ratio_not_duplicate(self):
+        # ratio of exactly 85 must NOT count as a duplicate (strict >)
+        a, b = "a" * 17 + "xxx", "a" * 17 + "yyy"
+        assert fuzz.ratio(a, b) == 85.0
+        index = TitleIndex()
+        index.add(a)
+        assert index.find(b) is None
+
+    def test_length_window_covers_all_matches(self):
+        for n in range(0, 120):
+            window = title_length_window(n)
+            for m in range(0, 160):
+                if abs(n - m) < 0.15 * (n + m):
+                    assert m in window
+
+    def test_empty_titles_match_each_other(self):
+        index = TitleIndex()
+        index.add("")
+        assert index.find("") == ""
+
+
+class TestCrossRunTitles:
+    def test_titles_from_earlier_run_are_matched(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        storage.init_db(db)
+        storage.save_items(db, [_item(1, "Nvidia unveils new Blackwell GPU for data centers")])
+
+        batch = [
+            _item(2, "Nvidia unveils new Blackwell GPUs for data centers"),
+            _item(3, "EU finalises AI Act enforcement timeline"),
+        ]
+        with patch.object(settings, "DEDUP_TITLE_WINDOW_DAYS", 7):
+            kept = dedup_items(batch, storage.get_existing_item_ids(db), db_path=db)
+        assert [i.item_id for i in kept] == ["id-3"]
+
+    def test_only_needed_lengths_loaded(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        storage.init_db(db)
+        storage.save_items(db, [_item(1, "short"), _item(2, "x" * 300)])
+        titles = storage.load_recent_titles(db, set(title_length_window(5)), 7)
+        assert titles == ["short"]
+
+    def test_window_zero_disables_history(self, tmp_path: Path):
+        db = tmp_path / "intel.db"
+        storage.init_db(db)
+        storage.save_items(db, [_item(1, "OpenAI ships a new reasoning model")])
+        with patch.object(settings, "DEDUP_TITLE_WINDOW_DAYS", 0):
+            kept = dedup_items([_item(2, "OpenAI ships a new reasoning models")], db_path=db)
+        assert len(kept) == 1
+
+    def test_backfill_from_items_table(self, tmp_path: Path):
+        import sqlite3
+
+        db = tmp_path / "intel.db"
+        conn = sqlite3.connect(str(db))
+        conn.execute(
+            "CREATE TABLE items (item_id TEXT PRIMARY KEY, title TEXT NOT NULL, url TEXT NOT NULL, body TEXT,"
+            " published_at TEXT, source_name TEXT, source_category TEXT, lang TEXT, created_at TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO items VALUES ('old', 'Legacy headline', 'u', '', '', '', '', 'en', ?)",
+            (storage._now_iso(),),
+        )
+        conn.commit()
+        conn.close()
+        storage.init_db(db)
+        assert storage.load_recent_titles(db, {len("Legacy headline")}, 7) == ["Legacy headline"]
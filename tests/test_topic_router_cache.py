@@ -0,0 +1,108 @@
+"""Tests for the per-run classify_channels / is_relevant_ai memo (utils/topic_router.py)."""
+
+from __future__ import annotations
+
+import pytest
+from core.content_strategy import select_executive_items
+from schemas.education_models import EduNewsCard
+from utils import topic_router as tr
+from utils.topic_router import (
+    channel_cache_stats,
+    classify_channels,
+    is_relevant_ai,
+    reset_channel_cache,
+)
+
+_TEXTS = [
+    ("OpenAI launches GPT-5 with new pricing tiers", "https://openai.com/blog/gpt-5"),
+    ("Startup raises $40M Series B to build inference chips", "https://techcrunch.com/x"),
+    ("New LoRA fine-tuning library released on GitHub", "https://github.com/org/repo"),
+    ("市政府公布新建案與房地產政策", "https://example.com/housing"),
+    ("", ""),
+]
+
+
+def _card(i: int, title: str) -> EduNewsCard:
+    return EduNewsCard(
+        item_id=f"trc-{i}",
+        is_valid_news=True,
+        title_plain=title,
+        what_happened=f"{title} — announced this week with benchmark results.",
+        why_important="Enterprise customers gain lower inference latency.",
+        source_name="TechCrunch",
+        source_url=f"https://techcrunch.com/story-{i}",
+        final_score=7.0,
+        category="AI",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reset_channel_cache()
+    yield
+    reset_channel_cache()
+
+
+def test_results_match_uncached(monkeypatch):
+    cached = [(classify_channels(t, u), is_relevant_ai(t, u)) for t, u in _TEXTS * 2]
+    monkeypatch.setattr(tr, "_CACHE_SIZE", 0)
+    uncached = [(classify_channels(t, u), is_relevant_ai(t, u)) for t, u in _TEXTS * 2]
+    assert cached == uncached
+    assert channel_cache_stats()["relevance_hits"] == len(_TEXTS)
+
+
+def test_repeat_lookup_hits_and_returns_a_copy():
+    text, url = _TEXTS[1]
+    first = classify_channels(text, url)
+    first["reasons"].append("mutated")
+    first["best_channel"] = "mutated"
+    again = classify_channels(text, url)
+    assert again["best_channel"] != "mutated"
+    assert "mutated" not in again["reasons"]
+    stats = channel_cache_stats()
+    assert (stats["channel_hits"], stats["channel_misses"]) == (1, 1)
+    assert stats["channel_hit_rate"] == 0.5
+
+
+def test_key_includes_url_and_platform():
+    text, _ = _TEXTS[2]
+    assert classify_channels(text, "https://github.com/a")["dev_score"] > 0
+    classify_channels(text, "https://example.com/a")
+    classify_channels(text, "https://example.com/a", source_platform="github")
+    assert channel_cache_stats()["channel_misses"] == 3
+
+
+def test_relevance_gate_shares_channel_result():
+    text, url = "Cloud vendor expands enterprise model inference deals", "https://x.com/a"
+    relevant, _ = is_relevant_ai(text, url)
+    assert relevant
+    classify_channels(text, url)
+    assert channel_cache_stats()["channel_hits"] == 1
+
+
+def test_executive_selection_classifies_each_text_once():
+    cards = [_card(i, t) for i, (t, _) in enumerate(_TEXTS[:3])]
+    select_executive_items(cards)
+    misses = channel_cache_stats()["channel_misses"]
+    select_executive_items(cards)
+    stats = channel_cache_stats()
+    assert stats["channel_misses"] == misses
+    assert stats["relevance_misses"] == len(cards)
+    assert stats["relevance_hits"] == len(cards)
+
+
+def test_reset_and_bounded(monkeypatch):
+    monkeypatch.setattr(tr, "_CACHE_SIZE", 2)
+    for text, url in _TEXTS:
+        classify_channels(text, url)
+    assert len(tr._memo["channel"]) == 2
+    reset_channel_cache()
+    assert not tr._memo["channel"]
+    assert channel_cache_stats() == {
+        "channel_hits": 0,
+        "channel_misses": 0,
+        "relevance_hits": 0,
+        "relevance_misses": 0,
+        "channel_hit_rate": 0.0,
+        "relevance_hit_rate": 0.0,
+    }
@@ -0,0 +1,168 @@
+"""Tests for utils/translation_memory.py and run_once._translate_md_to_zh (no network)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from utils import translation_memory
+from utils.translation_memory import TranslationMemory, normalize_source, tm_key
+
+
+@pytest.fixture
+def memory(tmp_path: Path):
+    m = TranslationMemory(tmp_path / "tm.db")
+    yield m
+    m.close()
+
+
+class TestTranslationMemory:
+    def test_whitespace_variants_share_a_key(self):
+        assert normalize_source("  a \t b\r\nc  ") == "a b\nc"
+        assert tm_key("a  b\r\n", "ns") == tm_key("a b", "ns")
+        assert tm_key("a b", "ns") != tm_key("a b", "other")
+
+    def test_roundtrip_and_stats(self, memory):
+        assert memory.get("Hello", "ns") is None
+        assert memory.put("Hello", "你好", "ns")
+        assert memory.get("Hello ", "ns") == "你好"
+        assert memory.get("Hello", "other") is None
+        assert memory.stats() == {"hits": 1, "misses": 2, "stores": 1}
+
+    def test_blank_values_not_stored(self, memory):
+        assert not memory.put("   ", "x")
+        assert not memory.put("Hello", "  ")
+
+    def test_lru_bound(self, tmp_path: Path):
+        m = TranslationMemory(tmp_path / "tm.db", max_entries=2)
+        try:
+            m.put("a", "A")
+            time.sleep(0.01)
+            m.put("b", "B")
+            time.sleep(0.01)
+            m.get("a")
+            time.sleep(0.01)
+            m.put("c", "C")
+            assert m.get("b") is None
+            assert m.get("a") == "A"
+            assert m.get("c") == "C"
+        finally:
+            m.close()
+
+    def test_persists_across_instances(self, tmp_path: Path):
+        m = TranslationMemory(tmp_path / "tm.db")
+        m.put("Hello", "你好")
+        m.close()
+        m = TranslationMemory(tmp_path / "tm.db")
+        try:
+            assert m.get("Hello") == "你好"
+        finally:
+            m.close()
+
+
+_MD = "# Title\n\npara one\n\n## Sec A\n\nalpha\n\n```\ncode\n```\n\n## Sec B\n\nbeta\n\n## Sec C\n\ngamma"
+
+
+class _FakeQwen:
+    """Paragraph-preserving fake translator that records requests and concurrency."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, messages, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        chunk = messages[-1]["content"]
+        with self.lock:
+            self.active -= 1
+            self.calls.append(chunk)
+        return True, "\n\n".join(f"ZH:{p}" for p in chunk.split("\n\n"))
+
+
+class TestTranslateMdToZh:
+    @pytest.fixture
+    def shared_memory(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv("TRANSLATION_MEMORY_ENABLED", "1")
+        monkeypatch.setenv("TRANSLATION_MEMORY_PATH", str(tmp_path / "shared_tm.db"))
+        translation_memory.reset_translation_memory()
+        yield translation_memory.get_translation_memory()
+        translation_memory.reset_translation_memory()
+
+    def _translate(self, md: str, qwen: _FakeQwen, slots: int = 3):
+        from scripts import run_once
+
+        with (
+            patch.object(run_once, "_is_translation_engine_ready", return_value=True),
+            patch("utils.llama_openai_client.chat", qwen),
+            patch("utils.llama_openai_client.server_slots", return_value=slots),
+        ):
+            return run_once._translate_md_to_zh(md)
+
+    def test_chunks_translated_concurrently_in_order(self, shared_memory):
+        qwen = _FakeQwen()
+        ok, out = self._translate(_MD, qwen)
+        assert ok
+        assert out.index("ZH:alpha") < out.index("```\ncode\n```") < out.index("ZH:gamma")
+        assert len(qwen.calls) == 4
+        assert qwen.peak == 3
+
+    def test_single_slot_is_sequential(self, shared_memory):
+        qwen = _FakeQwen()
+        self._translate(_MD, qwen, slots=1)
+        assert qwen.peak == 1
+
+    def test_unchanged_paragraphs_served_from_memory(self, shared_memory):
+        ok, first = self._translate(_MD, _FakeQwen())
+        qwen = _FakeQwen()
+        ok, second = self._translate(_MD.replace("gamma", "delta"), qwen)
+        assert ok
+        assert qwen.calls == ["## Sec C\n\ndelta"]
+        assert second == first.replace("ZH:gamma", "ZH:delta")
+
+    def test_multi_paragraph_reply_stored_per_chunk_only(self, shared_memory):
+        def regrouping(messages, **kwargs):
+            # Same paragraph count as the source, but the breaks moved.
+            chunk = messages[-1]["content"]
+            return True, "ZH:Title para\n\none" if "\n\n" in chunk else f"ZH:{chunk}"
+
+        from scripts import run_once
+
+        with (
+            patch.object(run_once, "_is_translation_engine_ready", return_value=True),
+            patch("utils.llama_openai_client.chat", regrouping),
+            patch("utils.llama_openai_client.server_slots", return_value=1),
+            patch.object(shared_memory, "put", wraps=shared_memory.put) as put,
+        ):
+            ok, out = run_once._translate_md_to_zh("# Title\n\npara one\n\n## Next")
+        assert ok
+        assert out == "ZH:Title para\n\none\n\nZH:## Next"
+        assert [c.args[:2] for c in put.call_args_list] == [
+            ("# Title\n\npara one", "ZH:Title para\n\none"),
+            ("## Next", "ZH:## Next"),
+        ]
+        namespace = put.call_args.args[2]
+        assert namespace.startswith("qwen2.5-7b-instruct\x00")
+
+    def test_failure_reports_chunk(self, shared_memory):
+        def failing(messages, **kwargs):
+            return False, "boom"
+
+        from scripts import run_once
+
+        with (
+            patch.object(run_once, "_is_translation_engine_ready", return_value=True),
+            patch("utils.llama_openai_client.chat", failing),
+            patch("utils.llama_openai_client.server_slots", return_value=2),
+        ):
+            ok, reason = run_once._translate_md_to_zh(_MD)
+        assert not ok
+        assert reason.startswith("TRANSLATION_FAILED: chunk 0")
+        assert shared_memory.stats()["stores"] == 0
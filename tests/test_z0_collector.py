@@ -806,3 +806,113 @@ class TestAuditMetaFields:
         assert "fallback_ratio" in meta_on_disk
         assert isinstance(meta_on_disk["published_at_source_counts"], dict)
         assert isinstance(meta_on_disk["fallback_ratio"], float)
+
+
+# ---------------------------------------------------------------------------
+# Concurrent collection + per-domain politeness
+# ---------------------------------------------------------------------------
+
+_CONCURRENT_CONFIG = {
+    "collector": {
+        "locale": {"hl": "en-US", "gl": "US", "ceid": "US:en"},
+        "http_timeout_sec": 1,
+        "polite_delay_ms": 0,
+        "max_items_per_feed": 5,
+        "user_agent": "test",
+    },
+    "official_feeds": [
+        {"name": "A", "url": "https://a.example.com/rss", "platform": "openai", "tag": "official"},
+        {"name": "B", "url": "https://b.example.com/rss", "platform": "nvidia", "tag": "official"},
+    ],
+    "community_feeds": [],
+    "github_watch": {
+        "feeds": ["releases"],
+        "repos": [{"owner": "huggingface", "repo": "transformers", "platform": "huggingface"}],
+    },
+    "google_news_queries": [],
+}
+
+
+class TestConcurrentCollect:
+    def _collect(self, tmp_path: Path, workers: int) -> tuple[list[dict], dict]:
+        import time as _time
+        from unittest.mock import patch
+
+        from core.z0_collector import collect_all
+
+        bodies = {
+            "https://a.example.com/rss": (0.15, RSS_SAMPLE),
+            "https://b.example.com/rss": (0.0, RSS_SAMPLE.replace("example.com/", "example.org/")),
+            "https://github.com/huggingface/transformers/releases.atom": (0.05, ATOM_SAMPLE),
+        }
+
+        def fake_fetch(url, timeout=15, user_agent=""):
+            delay, body = bodies[url]
+            _time.sleep(delay)
+            return body
+
+        cfg_path = tmp_path / f"cfg{workers}.json"
+        cfg_path.write_text(json.dumps(_CONCURRENT_CONFIG), encoding="utf-8")
+        out_dir = tmp_path / f"out{workers}"
+        with (
+            patch("core.z0_collector._fetch_url", side_effect=fake_fetch),
+            patch("core.z0_collector._http_cache", return_value=None),
+        ):
+            meta = collect_all(cfg_path, out_dir, max_workers=workers)
+        lines = (out_dir / "latest.jsonl").read_text(encoding="utf-8").splitlines()
+        return [json.loads(line) for line in lines], meta
+
+    def test_concurrent_output_matches_serial(self, tmp_path: Path):
+        serial_items, serial_meta = self._collect(tmp_path, workers=1)
+        conc_items, conc_meta = self._collect(tmp_path, workers=4)
+
+        def _strip(items: list[dict]) -> list[dict]:
+            return [{k: v for k, v in it.items() if k != "collected_at"} for it in items]
+
+        assert [it["id"] for it in conc_items] == [it["id"] for it in serial_items]
+        assert _strip(conc_items) == _strip(serial_items)
+        for key in ("total_items", "by_platform", "by_feed", "published_at_source_counts"):
+            assert conc_meta[key] == serial_meta[key]
+
+    def _record_fetches(self, jobs: list[str], workers: int, delay_ms: int) -> tuple[list, list]:
+        import threading
+        import time as _time
+        from unittest.mock import patch
+
+        from core.z0_collector import _fetch_jobs, _politeness_key
+
+        events: list[tuple[str, str, float]] = []
+        lock = threading.Lock()
+
+        def fake_fetch(url, timeout=15, user_agent=""):
+            with lock:
+                events.append(("start", _politeness_key(url), _time.monotonic()))
+            _time.sleep(0.02)
+            with lock:
+                events.append(("end", _politeness_key(url), _time.monotonic()))
+            return url
+
+        with patch("core.z0_collector._fetch_url", side_effect=fake_fetch):
+            bodies = _fetch_jobs([({}, url) for url in jobs], 1, "test", delay_ms, workers)
+        return bodies, events
+
+    def test_same_host_requests_never_overlap(self):
+        jobs = [f"https://{'www.' if i % 2 else ''}github.com/o/r{i}/releases.atom" for i in range(4)]
+        jobs += ["https://news.google.com/rss/search?q=x", "https://export.arxiv.org/rss/cs.AI"]
+        bodies, events = self._record_fetches(jobs, workers=4, delay_ms=50)
+
+        assert bodies == jobs
+        github = [(kind, ts) for kind, host, ts in events if host == "github.com"]
+        assert [kind for kind, _ in github] == ["start", "end"] * 4  # strictly serial
+        for (_, end), (_, start) in zip(github[1::2], github[2::2], strict=False):
+            assert start - end >= 0.045  # spaced from the previous request's end
+
+    def test_busy_host_does_not_block_other_hosts(self):
+        jobs = [f"https://github.com/o/r{i}/releases.atom" for i in range(5)]
+        jobs += ["https://news.google.com/rss/search?q=x", "https://export.arxiv.org/rss/cs.AI"]
+        _, events = self._record_fetches(jobs, workers=2, delay_ms=50)
+
+        last_github_end = max(ts for kind, host, ts in events if host == "github.com" and kind == "end")
+        other_ends = [ts for kind, host, ts in events if host != "github.com" and kind == "end"]
+        assert len(other_ends) == 2
+        assert max(other_ends) < last_github_end
@@ -0,0 +1,107 @@
+"""Offline tests for batch frontier scoring and JSONL re-scoring (core/z0_collector.py).
+
+Tests verify:
+  T1  score_frontier_batch() equals per-item compute_frontier_score() (scores + flags)
+  T2  Patterns never match across item boundaries in the joined buffer
+  T3  Benchmark score window stays inside its own item
+  T4  One reference time is applied to the whole batch
+  T5  rescore_file() rewrites scores, keeps collected_at, preserves odd lines
+      and writes the frontier audit next to the JSONL
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from core.z0_collector import compute_frontier_score, rescore_file, score_frontier_batch
+
+_NOW = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+def _item(title: str, summary: str = "", hours_ago: float | None = 12.0, **extra) -> dict:
+    pub = (_NOW - timedelta(hours=hours_ago)).isoformat() if hours_ago is not None else None
+    item = {
+        "title": title,
+        "summary": summary,
+        "url": "https://example.com/item",
+        "published_at": pub,
+        "published_at_parsed": pub,
+        "content_text": "",
+        "collected_at": _NOW.isoformat(),
+        "source": {"platform": "google_news", "feed_name": "test", "feed_url": "", "tag": "gnews"},
+    }
+    item.update(extra)
+    return item
+
+
+_ITEMS = [
+    _item("OpenAI releases v1.2.3 SDK", "70B MoE weights; MMLU 88.5%", hours_ago=2),
+    _item("Startup raises $40M Series B", "Pricing update rolls out in 2026.02", hours_ago=30),
+    _item("arXiv: 2402.10055 new agent paper", "open source checkpoint", hours_ago=100),
+    _item("Local weather report", "Rain expected", hours_ago=500),
+    _item("No date at all", "research", hours_ago=None, collected_at=None),
+    _item("Bad date", "model", published_at_parsed="not-a-date", published_at=None),
+    _item("", "", url=""),
+]
+
+
+def test_batch_matches_per_item_scoring():
+    singles = []
+    for it in _ITEMS:
+        copy = dict(it)
+        singles.append((compute_frontier_score(copy, now=_NOW), copy["_bonus_flags"]))
+    batch = [dict(it) for it in _ITEMS]
+    scores = score_frontier_batch(batch, now=_NOW)
+    assert list(zip(scores, [it["_bonus_flags"] for it in batch], strict=True)) == singles
+    assert score_frontier_batch([], now=_NOW) == []
+
+
+def test_no_match_across_item_boundaries():
+    # "v1.2" ends one item and ".3" starts the next; "open" / "source" are split too.
+    left = _item("x", "release v1.2", url="")
+    right = _item(".3 source", "", url="")
+    batch = score_frontier_batch([dict(left), dict(right)], now=_NOW)
+    assert batch == [compute_frontier_score(dict(left), now=_NOW), compute_frontier_score(dict(right), now=_NOW)]
+
+
+def test_benchmark_window_is_per_item():
+    bench_only = _item("MMLU results", "", url="")
+    number_next = _item("95", "", url="")
+    alone = compute_frontier_score(dict(bench_only), now=_NOW)
+    assert score_frontier_batch([dict(bench_only), dict(number_next)], now=_NOW)[0] == alone
+
+
+def test_single_reference_time():
+    items = [_item("a", hours_ago=5.9), _item("b", hours_ago=6.1)]
+    first, second = score_frontier_batch(items, now=_NOW)
+    assert first - second == 5  # 50 vs 45 recency points against the same now
+    later = score_frontier_batch(items, now=_NOW + timedelta(hours=1))
+    assert later[0] == second
+
+
+def test_rescore_file_in_place(tmp_path: Path):
+    jsonl = tmp_path / "latest.jsonl"
+    stale = [dict(it, frontier_score=0) for it in _ITEMS[:3]]
+    jsonl.write_text(
+        "\n".join(json.dumps(it) for it in stale) + "\nnot json\n\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "latest.meta.json").write_text(
+        json.dumps({"collected_at": "2026-03-01T00:00:00+00:00"}), encoding="utf-8"
+    )
+
+    meta = rescore_file(jsonl, now=_NOW)
+    audit = json.loads((tmp_path / "z0_frontier_audit.meta.json").read_text(encoding="utf-8"))
+    assert audit["computed_at"] == _NOW.isoformat()
+    assert sum(audit["frontier_histogram"].values()) == 3
+
+    lines = jsonl.read_text(encoding="utf-8").splitlines()
+    assert lines[-1] == "not json"
+    rescored = [json.loads(line) for line in lines[:-1]]
+    assert [it["frontier_score"] for it in rescored] == score_frontier_batch([dict(it) for it in _ITEMS[:3]], now=_NOW)
+    assert meta["total_items"] == 3
+    assert meta["collected_at"] == "2026-03-01T00:00:00+00:00"
+    assert meta["rescored_at"] == _NOW.isoformat()
+    assert json.loads((tmp_path / "latest.meta.json").read_text(encoding="utf-8")) == meta
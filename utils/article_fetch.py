@@ -14,13 +14,14 @@ import os
 import random
 import re
 import time
-from urllib.parse import urlparse
 
 import requests
 import trafilatura
 from bs4 import BeautifulSoup
 from schemas.models import RawItem
 
+from utils.http_fetch import ERR_TIMEOUT as FETCH_ERR_TIMEOUT
+from utils.http_fetch import FetchLayer, get_fetch_layer
 from utils.logger import get_logger
 from utils.metrics import EnrichStats
 
@@ -42,13 +43,16 @@ _JUNK_RATIO_MAX = float(os.getenv("ENRICH_JUNK_RATIO_MAX", "0.3"))
 ERR_TIMEOUT = "timeout"
 ERR_HTTP_ERROR = "http_error"
 ERR_BLOCKED = "blocked"
+ERR_RATE_LIMITED = "rate_limited"
 ERR_EXTRACT_EMPTY = "extract_empty"
 ERR_EXTRACT_LOW_QUALITY = "extract_low_quality"
 ERR_SKIPPED_POLICY = "skipped_policy"
 ERR_CONNECTION = "connection_error"
 
-# HTTP codes that indicate blocking / rate-limiting
-_BLOCKED_CODES = {401, 403, 429, 451}
+# HTTP codes that indicate blocking; 429 is reported (and not cached) as a
+# transient rate limit instead.
+_BLOCKED_CODES = {401, 403, 451}
+_RATE_LIMITED_CODE = 429
 
 
 # ---------------------------------------------------------------------------
@@ -157,6 +161,8 @@ def fetch_article_text(url: str) -> tuple[str, str]:
             )
             if resp.status_code in _BLOCKED_CODES:
                 return "", ERR_BLOCKED
+            if resp.status_code == _RATE_LIMITED_CODE:
+                return "", ERR_RATE_LIMITED
             resp.raise_for_status()
         except requests.Timeout:
             last_error = ERR_TIMEOUT
@@ -187,6 +193,40 @@ def fetch_article_text(url: str) -> tuple[str, str]:
     return "", last_error
 
 
+# ---------------------------------------------------------------------------
+# Persistent result cache (utils/fulltext_cache.py)
+# ---------------------------------------------------------------------------
+
+
+def _cache_lookup(url: str) -> tuple[str, str] | None:
+    """Return a cached ``(text, error_code)`` for *url*, or None on miss."""
+    from utils.fulltext_cache import get_fulltext_cache
+
+    cache = get_fulltext_cache()
+    cached = cache.get("enrich", url) if cache else None
+    if cached is None:
+        return None
+    return str(cached.get("text", "")), str(cached.get("error", ""))
+
+
+def _cache_store(url: str, text: str, err: str) -> None:
+    from utils.fulltext_cache import get_fulltext_cache
+
+    cache = get_fulltext_cache()
+    if cache:
+        cache.put("enrich", url, {"text": text, "error": err}, reason=err)
+
+
+def _apply_result(item: RawItem, text: str, err: str) -> bool:
+    """Replace ``item.body`` with *text* when it is an improvement."""
+    if err and err != ERR_EXTRACT_LOW_QUALITY:
+        return False
+    if text and len(text) > len(item.body):
+        item.body = text
+        return True
+    return False
+
+
 # ---------------------------------------------------------------------------
 # Synchronous enrich (backward compatible)
 # ---------------------------------------------------------------------------
@@ -206,21 +246,25 @@ def enrich_items(items: list[RawItem], stats: EnrichStats | None = None) -> list
         if not _needs_fulltext(item):
             continue
 
+        cached = _cache_lookup(item.url)
+        if cached is not None:
+            stats.cache_hits += 1
+            if _apply_result(item, *cached):
+                enriched_count += 1
+            continue
+
         t0 = time.time()
         text, err = fetch_article_text(item.url)
         latency = time.time() - t0
+        _cache_store(item.url, text, err)
 
         if err:
             stats.record_fail(err, latency)
-            # On low_quality, keep the extracted text if it's better than current
-            if err == ERR_EXTRACT_LOW_QUALITY and text and len(text) > len(item.body):
-                item.body = text
-                enriched_count += 1
         else:
             stats.record_success(latency)
-            if text and len(text) > len(item.body):
-                item.body = text
-                enriched_count += 1
+        # On low_quality, keep the extracted text if it's better than current
+        if _apply_result(item, text, err):
+            enriched_count += 1
 
         time.sleep(_POLITENESS_DELAY)
 
@@ -238,55 +282,36 @@ def enrich_items(items: list[RawItem], stats: EnrichStats | None = None) -> list
 async def _async_fetch_one(
     url: str,
     semaphore: asyncio.Semaphore,
-    domain_locks: dict[str, float],
-    domain_lock: asyncio.Lock,
+    layer: FetchLayer,
 ) -> tuple[str, str, float]:
-    """Fetch and extract one URL with concurrency + per-domain politeness.
+    """Fetch and extract one URL through the shared fetch layer.
+
+    Per-domain politeness (token buckets) and connection reuse live in
+    ``utils.http_fetch``; the body is memoized there so full-text hydration
+    later reuses it instead of downloading the page again.
 
     Returns ``(text, error_code, latency)``.
     """
-    import aiohttp
-
-    domain = urlparse(url).netloc
     t0 = time.time()
 
     async with semaphore:
-        # Per-domain politeness
-        async with domain_lock:
-            last_req = domain_locks.get(domain, 0.0)
-            wait = _POLITENESS_DELAY - (time.time() - last_req)
-            if wait > 0:
-                await asyncio.sleep(wait)
-            domain_locks[domain] = time.time()
-
         last_error = ERR_EXTRACT_EMPTY
 
         for attempt in range(1, _MAX_RETRIES + 1):
-            try:
-                async with (
-                    aiohttp.ClientSession() as session,
-                    session.get(
-                        url,
-                        timeout=aiohttp.ClientTimeout(total=_FETCH_TIMEOUT),
-                        headers={"User-Agent": "AI-Intel-Scraper/1.0"},
-                    ) as resp,
-                ):
-                    if resp.status in _BLOCKED_CODES:
-                        return "", ERR_BLOCKED, time.time() - t0
-                    resp.raise_for_status()
-                    html = await resp.text()
-            except TimeoutError:
-                last_error = ERR_TIMEOUT
-                if attempt < _MAX_RETRIES:
-                    await asyncio.sleep(1.0 * attempt + random.uniform(0, 0.5))
-                continue
-            except Exception:
-                last_error = ERR_CONNECTION
+            res = await layer.fetch(url, timeout_s=_FETCH_TIMEOUT, refresh=attempt > 1)
+            if res.error:
+                last_error = ERR_TIMEOUT if res.error == FETCH_ERR_TIMEOUT else ERR_CONNECTION
                 if attempt < _MAX_RETRIES:
                     await asyncio.sleep(1.0 * attempt + random.uniform(0, 0.5))
                 continue
-
-            text = _extract_text(html)
+            if res.status in _BLOCKED_CODES:
+                return "", ERR_BLOCKED, time.time() - t0
+            if res.status == _RATE_LIMITED_CODE:
+                return "", ERR_RATE_LIMITED, time.time() - t0
+            if not res.ok:
+                return "", ERR_HTTP_ERROR, time.time() - t0
+
+            text = _extract_text(res.text())
             quality_err = _check_quality(text)
             if quality_err is None:
                 return text, "", time.time() - t0
@@ -303,28 +328,27 @@ async def _enrich_items_async_impl(
     """Async implementation of item enrichment."""
     log = get_logger()
     semaphore = asyncio.Semaphore(_SEMAPHORE_LIMIT)
-    domain_locks: dict[str, float] = {}
-    domain_lock = asyncio.Lock()
 
     to_enrich = [(i, item) for i, item in enumerate(items) if _needs_fulltext(item)]
     if not to_enrich:
         return items
+    layer = get_fetch_layer()
+    if layer is None:
+        raise RuntimeError("shared fetch layer unavailable (aiohttp not installed)")
 
     async def _process(idx: int, item: RawItem) -> None:
-        text, err, latency = await _async_fetch_one(
-            item.url,
-            semaphore,
-            domain_locks,
-            domain_lock,
-        )
+        cached = _cache_lookup(item.url)
+        if cached is not None:
+            stats.cache_hits += 1
+            _apply_result(item, *cached)
+            return
+        text, err, latency = await _async_fetch_one(item.url, semaphore, layer)
+        _cache_store(item.url, text, err)
         if err:
             stats.record_fail(err, latency)
-            if err == ERR_EXTRACT_LOW_QUALITY and text and len(text) > len(item.body):
-                item.body = text
         else:
             stats.record_success(latency)
-            if text and len(text) > len(item.body):
-                item.body = text
+        _apply_result(item, text, err)
 
     tasks = [_process(idx, item) for idx, item in to_enrich]
     await asyncio.gather(*tasks)
@@ -332,6 +356,8 @@ async def _enrich_items_async_impl(
     enriched = stats.success
     if enriched:
         log.info("Async enriched %d/%d items with full article text", enriched, len(items))
+    if stats.cache_hits:
+        log.info("Enrichment served %d items from the full-text cache", stats.cache_hits)
     return items
 
 
@@ -351,5 +377,5 @@ def enrich_items_async(items: list[RawItem], stats: EnrichStats | None = None) -
         finally:
             loop.close()
     except RuntimeError:
-        # Event loop already running — fall back to sync
+        # Event loop already running or no aiohttp — fall back to sync
         return enrich_items(items, stats)
@@ -4,14 +4,17 @@
 - 移除 URL 尾端斜線差異
 - 移除常見追蹤參數（utm_*、ref、source 等）
 - 跨來源去重：同一 URL 僅保留一則，HackerNews 優先
+- 標題近似重複索引（TitleIndex）：依長度分桶，判定與 fuzz.ratio > 門檻一致
 """
 
 from __future__ import annotations
 
 import logging
+import math
 import re
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
+from rapidfuzz import fuzz, process
 from schemas.models import RawItem
 
 # 需要移除的追蹤參數前綴/完整名稱
@@ -109,3 +112,46 @@ def dedupe_items(items: list[RawItem], logger: logging.Logger | None = None) ->
         )
 
     return result
+
+
+def title_length_window(length: int, threshold: float = 85.0) -> range:
+    """回傳可能與長度 *length* 的標題達到 fuzz.ratio > threshold 的長度範圍。
+
+    fuzz.ratio = 100 * (1 - indel / (n + m))，且 indel >= |n - m|，
+    故相似度超過門檻的必要條件為 |n - m| < k * (n + m)，k = 1 - threshold / 100。
+    範圍取 floor / ceil（含端點），只會多不會漏。
+    """
+    k = 1.0 - threshold / 100.0
+    lo = math.floor(length * (1 - k) / (1 + k))
+    hi = math.ceil(length * (1 + k) / (1 - k)) if k < 1 else length * 2 + 1
+    return range(max(0, lo), hi + 1)
+
+
+class TitleIndex:
+    """標題近似重複索引，取代逐一比對的 O(n²) fuzz.ratio 迴圈。
+
+    標題依字元長度分桶；查詢時只在 title_length_window() 內的桶中以
+    rapidfuzz.process.extractOne（C 實作、帶 score_cutoff 提前剪枝）比對，
+    判定結果與「任一既有標題 fuzz.ratio > threshold」完全相同。
+    """
+
+    def __init__(self, threshold: float = 85.0) -> None:
+        self.threshold = threshold
+        self._buckets: dict[int, list[str]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(b) for b in self._buckets.values())
+
+    def add(self, title: str) -> None:
+        self._buckets.setdefault(len(title), []).append(title)
+
+    def find(self, title: str) -> str | None:
+        """回傳第一個相似度超過門檻的既有標題；無則回傳 None。"""
+        for length in title_length_window(len(title), self.threshold):
+            bucket = self._buckets.get(length)
+            if not bucket:
+                continue
+            hit = process.extractOne(title, bucket, scorer=fuzz.ratio, score_cutoff=self.threshold)
+            if hit is not None and hit[1] > self.threshold:
+                return hit[0]
+        return None
@@ -0,0 +1,171 @@
+"""Persistent full-text extraction cache shared by hydration and enrichment.
+
+Z0 items stay inside the 72h-7d window for many consecutive runs and their
+article text does not change, yet ``fulltext_hydrator.hydrate_items_batch``
+and ``article_fetch.enrich_items_async`` used to download and parse every URL
+again on each run.  This cache stores the extraction outcome per
+``(kind, normalize_url(url))`` — ``kind`` separates the two extractors, whose
+result shapes differ — and is also keyed by the final (post-redirect) URL.
+
+Successful extractions live for ``FULLTEXT_CACHE_TTL_HOURS``; permanent-looking
+failures (HTTP 401 / 403 / 451, JS-only or too-short pages) are negatively
+cached for the shorter ``FULLTEXT_CACHE_NEG_TTL_HOURS`` so they are not retried
+on every run.
+Transient failures (timeouts, connection errors) are never cached.
+
+Env overrides:
+  FULLTEXT_CACHE_ENABLED        1/0, default 1
+  FULLTEXT_CACHE_PATH           default <repo>/data/fulltext_cache.db
+  FULLTEXT_CACHE_TTL_HOURS      default 168 (7 days)
+  FULLTEXT_CACHE_NEG_TTL_HOURS  default 24
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from utils.dedupe import normalize_url
+
+_DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "fulltext_cache.db"
+_TTL_S = float(os.getenv("FULLTEXT_CACHE_TTL_HOURS", "168")) * 3600
+_NEG_TTL_S = float(os.getenv("FULLTEXT_CACHE_NEG_TTL_HOURS", "24")) * 3600
+
+# Failure reasons worth remembering: re-fetching within the negative TTL would
+# almost certainly produce the same outcome.
+NEGATIVE_REASONS = frozenset(
+    {
+        # fulltext_hydrator reasons
+        "http_401",
+        "http_403",
+        "http_451",
+        "extract_too_short",
+        "js_only",
+        # article_fetch error codes
+        "blocked",
+        "extract_empty",
+        "extract_low_quality",
+    }
+)
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS fulltext_cache (
+    kind        TEXT NOT NULL,
+    url_key     TEXT NOT NULL,
+    payload     TEXT NOT NULL,
+    negative    INTEGER NOT NULL DEFAULT 0,
+    expires_at  REAL NOT NULL,
+    PRIMARY KEY (kind, url_key)
+);
+"""
+
+
+def _key(url: str) -> str:
+    try:
+        return normalize_url(url)
+    except Exception:
+        return (url or "").strip()
+
+
+class FulltextCache:
+    """Thread-safe SQLite cache of extraction results with TTL + negative caching."""
+
+    def __init__(self, path: Path, ttl_s: float = _TTL_S, neg_ttl_s: float = _NEG_TTL_S) -> None:
+        self.path = path
+        self.ttl_s = ttl_s
+        self.neg_ttl_s = neg_ttl_s
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(_DDL)
+        self._conn.commit()
+
+    def get(self, kind: str, url: str) -> dict | None:
+        """Return the cached payload for *url*, or None when absent / expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM fulltext_cache WHERE kind = ? AND url_key = ? AND expires_at > ?",
+                (kind, _key(url), time.time()),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return None
+
+    def put(self, kind: str, url: str, payload: dict, reason: str = "", final_url: str = "") -> bool:
+        """Cache *payload* under *url* (and *final_url*).
+
+        ``reason`` is the outcome code: ``"ok"`` / ``""`` for success, a member of
+        ``NEGATIVE_REASONS`` for a negatively cached failure.  Anything else is a
+        transient failure and is not stored.  Returns True when stored.
+        """
+        negative = bool(reason) and reason != "ok"
+        if negative and reason not in NEGATIVE_REASONS:
+            return False
+        expires_at = time.time() + (self.neg_ttl_s if negative else self.ttl_s)
+        blob = json.dumps(payload, ensure_ascii=False)
+        keys = {_key(url)}
+        if final_url:
+            keys.add(_key(final_url))
+        with self._lock:
+            self._conn.executemany(
+                """INSERT OR REPLACE INTO fulltext_cache (kind, url_key, payload, negative, expires_at)
+                   VALUES (?, ?, ?, ?, ?)""",
+                [(kind, k, blob, 1 if negative else 0, expires_at) for k in keys if k],
+            )
+            self._conn.commit()
+        return True
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def prune(self) -> int:
+        """Delete expired rows. Returns rows removed."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM fulltext_cache WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+            return cur.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: FulltextCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_fulltext_cache() -> FulltextCache | None:
+    """Return the process-wide cache, or None when disabled / unavailable."""
+    global _cache
+    if os.getenv("FULLTEXT_CACHE_ENABLED", "1").strip().lower() in ("0", "false", "no"):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            raw = os.getenv("FULLTEXT_CACHE_PATH", "").strip()
+            try:
+                _cache = FulltextCache(Path(raw) if raw else _DEFAULT_PATH)
+                _cache.prune()
+            except (OSError, sqlite3.Error):
+                return None
+        return _cache
+
+
+def reset_fulltext_cache() -> None:
+    """Close and drop the process-wide cache (tests / path changes)."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
@@ -12,6 +12,8 @@ stdlib only: urllib.request, html.parser, re, concurrent.futures, json, pathlib
 from __future__ import annotations
 
 import base64
+import codecs
+import contextlib
 import json
 import re
 import time
@@ -24,6 +26,8 @@ from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
 from urllib.request import Request, urlopen
 
+from utils.http_fetch import ERR_TIMEOUT as FETCH_ERR_TIMEOUT
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -40,6 +44,9 @@ _HEADERS = {
 }
 
 MAX_HTML_READ = 300_000       # bytes
+MAX_PARAGRAPHS = 40           # paragraphs considered per page (extraction cap)
+_STREAM_CHUNK = 16 * 1024     # bytes per parser feed (urllib fallback)
+_JS_HEAD_CHARS = 4000         # chars scanned for JS-only signals
 MAX_BODY_CHARS = 12_000       # chars in full_text output
 _FULLTEXT_OK_MIN = 300        # chars: status="ok" only when >= this
 _ENRICH_MIN = 300             # chars: enrich item.body only when fulltext_len >= this
@@ -81,6 +88,7 @@ _UI_GARBAGE = (
 
 # Price-push CTA pattern — e.g. "$99/year", "$12 per month"
 _PRICE_CTA_RE = re.compile(r"\$\s*\d{2,}", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
 
 
 # ---------------------------------------------------------------------------
@@ -91,10 +99,18 @@ class _ArticleParser(HTMLParser):
     """
     Extract <p> text prioritising <article>/<main> regions.
     Also collects meta-refresh URL, canonical link, and external hrefs.
+
+    Paragraphs are whitespace-normalized once, when they close.  With
+    ``stop_early`` the parser sets ``done`` as soon as more input cannot change
+    the extraction result: MAX_PARAGRAPHS article paragraphs are collected, or
+    the outermost <article> closed after yielding paragraphs while no <main> is
+    still open (an enclosing <main> may hold more paragraphs after it).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, stop_early: bool = False) -> None:
         super().__init__(convert_charrefs=True)
+        self.stop_early = stop_early
+        self.done: bool = False
         self._in_article: int = 0
         self._in_main: int = 0
         self._in_skip: int = 0   # script / style / nav / footer / header / aside
@@ -103,11 +119,13 @@ class _ArticleParser(HTMLParser):
         self._article_ps: list[str] = []
         self._all_ps: list[str] = []
         self._buf: list[str] = []
+        self._data_open: bool = False
         self.meta_refresh: str | None = None
         self.canonical: str | None = None
         self.ext_links: list[str] = []
 
     def handle_starttag(self, tag: str, attrs: list[tuple]) -> None:
+        self._data_open = False
         ad = {k.lower(): (v or "") for k, v in attrs}
         tag = tag.lower()
         if tag == "article":
@@ -137,35 +155,43 @@ class _ArticleParser(HTMLParser):
                 self.ext_links.append(href)
 
     def handle_endtag(self, tag: str) -> None:
+        self._data_open = False
         tag = tag.lower()
         if tag == "article":
             self._in_article = max(0, self._in_article - 1)
+            if self.stop_early and self._in_article == 0 and self._in_main == 0 and self._article_ps:
+                self.done = True
         elif tag == "main":
             self._in_main = max(0, self._in_main - 1)
         elif tag in ("script", "style", "nav", "footer", "header", "aside", "form"):
             self._in_skip = max(0, self._in_skip - 1)
         elif tag == "p" and self._in_p:
             self._in_p = False
-            text = " ".join(self._buf).strip()
-            if text:
-                if self._in_article > 0 or self._in_main > 0:
-                    self._article_ps.append(text)
-                else:
-                    self._all_ps.append(text)
-            self._buf = []
+            self._close_paragraph()
         elif tag == "li" and self._in_li:
             self._in_li = False
-            text = " ".join(self._buf).strip()
-            if text:
-                if self._in_article > 0 or self._in_main > 0:
-                    self._article_ps.append(text)
-                else:
-                    self._all_ps.append(text)
-            self._buf = []
+            self._close_paragraph()
+
+    def _close_paragraph(self) -> None:
+        text = _WS_RE.sub(" ", " ".join(self._buf)).strip()
+        self._buf = []
+        if not text:
+            return
+        if self._in_article > 0 or self._in_main > 0:
+            self._article_ps.append(text)
+            if self.stop_early and len(self._article_ps) >= MAX_PARAGRAPHS:
+                self.done = True
+        else:
+            self._all_ps.append(text)
 
     def handle_data(self, data: str) -> None:
         if (self._in_p or self._in_li) and self._in_skip == 0:
-            self._buf.append(data)
+            if self._data_open and self._buf:
+                # Same text node split across feed() chunks: glue, don't space.
+                self._buf[-1] += data
+            else:
+                self._buf.append(data)
+        self._data_open = True
 
     def best_paragraphs(self) -> list[str]:
         return self._article_ps if self._article_ps else self._all_ps
@@ -191,23 +217,6 @@ def _is_external(url: str) -> bool:
         return False
 
 
-def _fetch_html(url: str, timeout_s: int) -> tuple[str, str]:
-    """Fetch URL (follows HTTP redirects), return (html_text, final_url)."""
-    req = Request(url, headers=_HEADERS)
-    with urlopen(req, timeout=timeout_s) as resp:
-        final_url = resp.geturl()
-        content_type = resp.headers.get("Content-Type", "")
-        charset = "utf-8"
-        m = re.search(r"charset\s*=\s*([^\s;\"']+)", content_type, re.IGNORECASE)
-        if m:
-            charset = m.group(1).strip().strip("\"'")
-        raw = resp.read(MAX_HTML_READ)
-        try:
-            return raw.decode(charset, errors="replace"), final_url
-        except (LookupError, UnicodeDecodeError):
-            return raw.decode("utf-8", errors="replace"), final_url
-
-
 def _extract_text(html: str) -> tuple[str, dict]:
     """Extract clean article text from HTML. Returns (text, fidelity_dict)."""
     parser = _ArticleParser()
@@ -215,22 +224,21 @@ def _extract_text(html: str) -> tuple[str, dict]:
         parser.feed(html)
     except Exception:
         pass
+    return _finish_extraction(parser)
 
-    paragraphs = parser.best_paragraphs()
+
+def _finish_extraction(parser: _ArticleParser) -> tuple[str, dict]:
+    """Filter a fed parser's paragraphs into (text, fidelity_dict)."""
+    paragraphs = parser.best_paragraphs()[:MAX_PARAGRAPHS]
     extract_method = "article_ps" if parser._article_ps else "all_ps"
-    raw_count = min(len(paragraphs), 40)
+    raw_count = len(paragraphs)
+    # Paragraphs arrive whitespace-normalized from the parser.
+    candidates = [p for p in paragraphs if len(p) >= 40]
     # Compute raw text length BEFORE CTA filtering (for fidelity comparison)
-    raw_paras_text = "\n\n".join(
-        re.sub(r"\s+", " ", p).strip()
-        for p in paragraphs[:40]
-        if len(re.sub(r"\s+", " ", p).strip()) >= 40
-    )
+    raw_text_len = len("\n\n".join(candidates))
     clean: list[str] = []
     cta_hits = 0
-    for p in paragraphs[:40]:
-        p = re.sub(r"\s+", " ", p).strip()
-        if len(p) < 40:
-            continue
+    for p in candidates:
         p_low = p.lower()
         if any(tok in p_low for tok in _UI_GARBAGE):
             cta_hits += 1
@@ -247,11 +255,93 @@ def _extract_text(html: str) -> tuple[str, dict]:
         "removed_paragraphs_count": raw_count - len(clean),
         "cta_hits_count": cta_hits,
         "extract_method": extract_method,
-        "raw_text_len": len(raw_paras_text),  # length BEFORE CTA removal
+        "raw_text_len": raw_text_len,  # length BEFORE CTA removal
     }
     return text[:MAX_BODY_CHARS], fidelity
 
 
+def _incremental_decoder(charset: str):
+    try:
+        return codecs.getincrementaldecoder(charset or "utf-8")(errors="replace")
+    except LookupError:
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+def _open_html_stream(url: str, timeout_s: int):
+    """Open *url*; return (final_url, charset, chunk_iterator, close_fn).
+
+    Failures surface as the urllib exceptions ``hydrate_fulltext`` classifies.
+    """
+    layer = _get_fetch_layer()
+    if layer is not None:
+        stream = layer.open_stream(url, timeout_s=timeout_s, max_bytes=MAX_HTML_READ)
+        head = stream.head
+        if head.error == FETCH_ERR_TIMEOUT:
+            raise TimeoutError(f"timed out fetching {url}")
+        if head.error:
+            raise URLError(head.error)
+        if not head.ok:
+            raise HTTPError(head.final_url or url, head.status, f"HTTP {head.status}", None, None)  # type: ignore[arg-type]
+        return head.final_url or url, head.charset, iter(stream), stream.close
+
+    resp = urlopen(Request(url, headers=_HEADERS), timeout=timeout_s)
+    charset = ""
+    m = re.search(r"charset\s*=\s*([^\s;\"']+)", resp.headers.get("Content-Type", ""), re.IGNORECASE)
+    if m:
+        charset = m.group(1).strip().strip("\"'")
+
+    def _chunks():
+        left = MAX_HTML_READ
+        while left > 0:
+            chunk = resp.read(min(_STREAM_CHUNK, left))
+            if not chunk:
+                return
+            left -= len(chunk)
+            yield chunk
+
+    return resp.geturl(), charset, _chunks(), resp.close
+
+
+def _stream_page(url: str, timeout_s: int) -> tuple[_ArticleParser, str, str, str]:
+    """Fetch *url* (follows HTTP redirects), feeding decoded chunks to a parser.
+
+    Stops downloading once the parser reports ``done``.  Returns
+    ``(parser, final_url, head, html)`` where ``head`` is the first
+    _JS_HEAD_CHARS characters and ``html`` the full document — kept only for
+    Google News pages, whose HTML is needed to resolve the publisher URL.
+    """
+    final_url, charset, chunks, close = _open_html_stream(url, timeout_s)
+    keep_html = _is_google_domain(final_url)
+    parser = _ArticleParser(stop_early=not keep_html)
+    decoder = _incremental_decoder(charset)
+    head_parts: list[str] = []
+    head_len = 0
+    kept: list[str] = []
+    try:
+        for chunk in chunks:
+            text = decoder.decode(chunk)
+            if head_len < _JS_HEAD_CHARS:
+                head_parts.append(text[:_JS_HEAD_CHARS - head_len])
+                head_len += len(head_parts[-1])
+            if keep_html:
+                kept.append(text)
+            try:
+                parser.feed(text)
+            except Exception:
+                break
+            if parser.done:
+                break
+        else:
+            tail = decoder.decode(b"", final=True)
+            if tail and not parser.done:
+                with contextlib.suppress(Exception):
+                    parser.feed(tail)
+                kept.append(tail)
+    finally:
+        close()
+    return parser, final_url, "".join(head_parts), "".join(kept)
+
+
 def _decode_gnews_rss_url(url: str) -> str:
     """Decode actual publisher URL from a GNews RSS base64-encoded article URL.
 
@@ -323,6 +413,22 @@ def _get_logger():
         return logging.getLogger(__name__)
 
 
+def _get_fetch_layer():
+    try:
+        from utils.http_fetch import get_fetch_layer
+        return get_fetch_layer()
+    except Exception:
+        return None
+
+
+def _get_fulltext_cache():
+    try:
+        from utils.fulltext_cache import get_fulltext_cache
+        return get_fulltext_cache()
+    except Exception:
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Public: single-URL hydration
 # ---------------------------------------------------------------------------
@@ -357,8 +463,8 @@ def hydrate_fulltext(url: str, timeout_s: int = 8) -> dict:
     t0 = time.monotonic()
 
     try:
-        # Phase 1: fetch URL (urllib follows HTTP 301/302 redirects)
-        html, final_url = _fetch_html(url, timeout_s=max(3, timeout_s))
+        # Phase 1: fetch URL (follows HTTP 301/302 redirects), parsing as it streams
+        parser, final_url, html_head, html = _stream_page(url, timeout_s=max(3, timeout_s))
         result["final_url"] = final_url
         elapsed = time.monotonic() - t0
 
@@ -370,22 +476,20 @@ def hydrate_fulltext(url: str, timeout_s: int = 8) -> dict:
             remaining = max(1.0, timeout_s - elapsed - 0.5)
             if publisher_url and remaining > 1:
                 try:
-                    html2, final_url2 = _fetch_html(publisher_url, timeout_s=int(remaining))
-                    html = html2
+                    parser, final_url2, html_head, _ = _stream_page(publisher_url, timeout_s=int(remaining))
                     result["final_url"] = final_url2
                 except Exception:
                     result["final_url"] = publisher_url  # best guess
-            # fallthrough: extract from whatever html we have
+            # fallthrough: extract from whatever page we have
 
         # Phase 3: JS-only detection (check first 4 KB)
-        html_head = html[:4000].lower()
-        if any(sig in html_head for sig in _JS_SIGNALS):
+        if any(sig in html_head.lower() for sig in _JS_SIGNALS):
             result["status"] = "skip"
             result["reason"] = "js_only"
             return result
 
-        # Phase 4: text extraction
-        text, fidelity = _extract_text(html)
+        # Phase 4: text extraction (paragraphs were collected while streaming)
+        text, fidelity = _finish_extraction(parser)
         fidelity["final_url"] = result.get("final_url", "")
         try:
             fidelity["domain"] = urlparse(result.get("final_url", "")).netloc.lower().lstrip("www.")
@@ -496,14 +600,28 @@ def hydrate_items_batch(
     unique_urls = sorted(url_to_items.keys(), key=_url_priority)
     done: dict[str, dict] = {}
 
+    # Persistent cache: URLs hydrated (or permanently failed) in an earlier run
+    # skip both the network and the HTML parse.
+    cache = _get_fulltext_cache()
+    cache_hits = 0
+    if cache is not None:
+        for u in unique_urls:
+            cached = cache.get("hydrate", u)
+            if cached is not None:
+                done[u] = cached
+                cache_hits += 1
+    to_fetch = [u for u in unique_urls if u not in done]
+
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_map = {executor.submit(hydrate_fulltext, u, timeout_s): u for u in unique_urls}
+        future_map = {executor.submit(hydrate_fulltext, u, timeout_s): u for u in to_fetch}
         remaining = max(5.0, batch_timeout - (time.monotonic() - t0))
         try:
             for future in as_completed(future_map, timeout=remaining):
                 u = future_map[future]
                 try:
                     done[u] = future.result()
+                    if cache is not None:
+                        cache.put("hydrate", u, done[u], done[u].get("reason", ""), done[u].get("final_url", ""))
                 except Exception as exc:
                     done[u] = {
                         "final_url": u, "status": "fail",
@@ -553,11 +671,11 @@ def hydrate_items_batch(
 
     elapsed = time.monotonic() - t0
     log.info(
-        "hydrate_items_batch: total=%d unique_urls=%d ok=%d elapsed=%.2fs",
-        len(items), len(unique_urls), ok_count, elapsed,
+        "hydrate_items_batch: total=%d unique_urls=%d cache_hits=%d ok=%d elapsed=%.2fs",
+        len(items), len(unique_urls), cache_hits, ok_count, elapsed,
     )
 
-    _write_hydrator_meta(items)
+    _write_hydrator_meta(items, cache_hits=cache_hits)
     _write_fidelity_meta(items)
     return items
 
@@ -566,7 +684,7 @@ def hydrate_items_batch(
 # Meta writer
 # ---------------------------------------------------------------------------
 
-def _write_hydrator_meta(items: list, outdir: str | None = None) -> None:
+def _write_hydrator_meta(items: list, outdir: str | None = None, cache_hits: int = 0) -> None:
     """Write outputs/fulltext_hydrator.meta.json."""
     try:
         root = Path(outdir) if outdir else Path(__file__).resolve().parent.parent / "outputs"
@@ -620,6 +738,7 @@ def _write_hydrator_meta(items: list, outdir: str | None = None) -> None:
             "avg_fulltext_len": avg_fulltext_len,
             "samples": sample_dicts,
             "fail_reasons_top": dict(fail_reasons.most_common(10)),
+            "cache_hits": cache_hits,
             "notes": " / ".join(notes_parts),
         }
 
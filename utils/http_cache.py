@@ -0,0 +1,172 @@
+"""Persistent HTTP validator cache for conditional GET (ETag / Last-Modified).
+
+Feeds rarely change between scheduled runs.  This cache remembers the
+validators and the last body for each URL so the next request can send
+``If-None-Match`` / ``If-Modified-Since``; a ``304 Not Modified`` reply is then
+answered from the stored body and re-parsed exactly as a fresh download.
+
+Stored in SQLite next to ``data/intel.db`` (stdlib only, so the standalone
+Z0 collector and ``scraper.py`` can use it too).
+
+Env overrides:
+  HTTP_CACHE_ENABLED   1/0, default 1
+  HTTP_CACHE_PATH      default <repo>/data/http_cache.db
+  HTTP_CACHE_MAX_AGE_DAYS  entries unused for longer are pruned, default 30
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+_DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "http_cache.db"
+_MAX_AGE_DAYS = int(os.getenv("HTTP_CACHE_MAX_AGE_DAYS", "30"))
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS http_validators (
+    url           TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    charset       TEXT,
+    body          BLOB NOT NULL,
+    stored_at     REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class CachedResponse:
+    """Validators and body remembered from the last 200 response."""
+
+    etag: str
+    last_modified: str
+    charset: str
+    body: bytes
+
+    def text(self) -> str:
+        try:
+            return self.body.decode(self.charset or "utf-8", errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+
+class HttpValidatorCache:
+    """Thread-safe SQLite store of per-URL validators plus last body."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(_DDL)
+        self._conn.commit()
+
+    def lookup(self, url: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, charset, body FROM http_validators WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(etag=row[0] or "", last_modified=row[1] or "", charset=row[2] or "", body=row[3])
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Return ``If-None-Match`` / ``If-Modified-Since`` headers for *url* (may be empty)."""
+        cached = self.lookup(url)
+        if cached is None:
+            return {}
+        headers: dict[str, str] = {}
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def store(self, url: str, etag: str | None, last_modified: str | None, body: bytes, charset: str = "") -> None:
+        """Remember a 200 response; skipped when the server sent no validators."""
+        if not (etag or last_modified):
+            return
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO http_validators
+                   (url, etag, last_modified, charset, body, stored_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (url, etag or "", last_modified or "", charset or "", body, time.time()),
+            )
+            self._conn.commit()
+
+    def not_modified(self, url: str) -> CachedResponse | None:
+        """Handle a 304 reply: bump the entry's timestamp and return the stored body."""
+        cached = self.lookup(url)
+        if cached is None:
+            return None
+        with self._lock:
+            self._conn.execute("UPDATE http_validators SET stored_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+        self.record_hit()
+        return cached
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def prune(self, max_age_days: int = _MAX_AGE_DAYS) -> int:
+        """Delete entries not refreshed within *max_age_days*. Returns rows removed."""
+        cutoff = time.time() - max_age_days * 86400
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM http_validators WHERE stored_at < ?", (cutoff,))
+            self._conn.commit()
+            return cur.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: HttpValidatorCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> HttpValidatorCache | None:
+    """Return the process-wide cache, or None when disabled / unavailable."""
+    global _cache
+    if os.getenv("HTTP_CACHE_ENABLED", "1").strip().lower() in ("0", "false", "no"):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            raw = os.getenv("HTTP_CACHE_PATH", "").strip()
+            try:
+                _cache = HttpValidatorCache(Path(raw) if raw else _DEFAULT_PATH)
+                _cache.prune()
+            except (OSError, sqlite3.Error):
+                return None
+        return _cache
+
+
+def reset_http_cache() -> None:
+    """Close and drop the process-wide cache (tests / path changes)."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
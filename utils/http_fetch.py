@@ -0,0 +1,426 @@
+"""Shared article fetch layer used by enrichment and full-text hydration.
+
+Before this module, every article URL was downloaded twice per run: once by
+``article_fetch.enrich_items_async`` (aiohttp, a new ``ClientSession`` per
+request, one global lock around the politeness check) and again by
+``fulltext_hydrator.hydrate_items_batch`` (urllib in a thread pool).
+
+``FetchLayer`` owns ONE long-lived aiohttp session running on a background
+event-loop thread, so both async callers (any loop) and sync callers (any
+thread) share its connection pool:
+
+- per-domain token buckets instead of a global lock (other hosts never wait)
+- redirect / final-URL tracking and a response byte cap
+- a per-run response memo: each URL is downloaded at most once; later callers
+  get the same body.  Timeouts / connection errors are not memoized so a later
+  stage may retry.  The memo holds at most ``HTTP_FETCH_MEMO_MAX_BYTES`` of
+  bodies; the oldest responses are dropped first.
+- ``open_stream()`` for callers that parse incrementally and may stop reading
+  early (full-text hydration); streamed bodies are not memoized.
+
+Use ``get_fetch_layer()`` to obtain the run's layer (None when aiohttp is not
+installed — callers keep their legacy fallback) and ``release_fetch_layer()``
+at the end of the fetch stage to close the session and drop the memo.
+
+Env overrides:
+  HTTP_FETCH_CONCURRENCY   total in-flight requests, default 8
+  HTTP_FETCH_PER_HOST      connections per host, default 4
+  HTTP_FETCH_DOMAIN_RATE   requests per second per domain, default
+                           1 / ENRICH_POLITENESS_DELAY (0.5 s -> 2.0)
+  HTTP_FETCH_DOMAIN_BURST  token-bucket burst per domain, default 1
+  HTTP_FETCH_MAX_BYTES     response body cap, default 1_000_000
+  HTTP_FETCH_MEMO_MAX_BYTES  total bodies kept in the per-run memo, default 64 MiB
+  HTTP_FETCH_TIMEOUT       per-request total timeout (s), default 15
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+_CONCURRENCY = int(os.getenv("HTTP_FETCH_CONCURRENCY", "8"))
+_PER_HOST = int(os.getenv("HTTP_FETCH_PER_HOST", "4"))
+# Default spacing matches the per-domain ENRICH_POLITENESS_DELAY of the old
+# enrichment path (0 disables spacing).
+_POLITENESS_DELAY = float(os.getenv("ENRICH_POLITENESS_DELAY", "0.5"))
+_DOMAIN_RATE = float(os.getenv("HTTP_FETCH_DOMAIN_RATE") or (1 / _POLITENESS_DELAY if _POLITENESS_DELAY > 0 else 0))
+_DOMAIN_BURST = int(os.getenv("HTTP_FETCH_DOMAIN_BURST", "1"))
+MAX_BYTES = int(os.getenv("HTTP_FETCH_MAX_BYTES", "1000000"))
+_MEMO_MAX_BYTES = int(os.getenv("HTTP_FETCH_MEMO_MAX_BYTES", str(64 * 1024 * 1024)))
+_TIMEOUT = float(os.getenv("HTTP_FETCH_TIMEOUT", "15"))
+
+_READ_CHUNK = 64 * 1024
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9,zh-TW;q=0.8",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+# Error codes (FetchResult.error)
+ERR_TIMEOUT = "timeout"
+ERR_CONNECTION = "connection_error"
+
+
+@dataclass
+class FetchResult:
+    """Outcome of one GET.  ``error`` is "" on any HTTP response (check ``status``)."""
+
+    url: str
+    final_url: str = ""
+    status: int = 0
+    body: bytes = b""
+    charset: str = ""
+    error: str = ""
+    truncated: bool = False
+    redirects: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.error and 200 <= self.status < 300
+
+    def text(self, limit: int | None = None) -> str:
+        raw = self.body if limit is None else self.body[:limit]
+        try:
+            return raw.decode(self.charset or "utf-8", errors="replace")
+        except LookupError:
+            return raw.decode("utf-8", errors="replace")
+
+
+class FetchStream:
+    """Body chunks of one streamed GET, consumed from the caller's thread.
+
+    ``head`` carries status / final URL / charset.  Iterate for ``bytes``
+    chunks; ``close()`` (or leaving the ``with`` block) stops the download
+    after the chunk in flight.  A transport error mid-body is raised from the
+    iterator as ``TimeoutError`` / ``ConnectionError``.
+    """
+
+    def __init__(self, head: FetchResult, chunks: queue.Queue | None, stop: threading.Event, wait_s: float) -> None:
+        self.head = head
+        self._chunks = chunks
+        self._stop = stop
+        self._wait_s = wait_s
+
+    def __iter__(self):
+        if self._chunks is None:
+            return
+        while True:
+            try:
+                item = self._chunks.get(timeout=self._wait_s)
+            except queue.Empty:
+                self.close()
+                raise TimeoutError(f"timed out reading {self.head.url}") from None
+            if item is None:
+                return
+            if item == ERR_TIMEOUT:
+                raise TimeoutError(f"timed out reading {self.head.url}")
+            if isinstance(item, str):
+                raise ConnectionError(item)
+            yield item
+
+    def close(self) -> None:
+        self._stop.set()
+
+    def __enter__(self) -> FetchStream:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _TokenBucket:
+    """Per-domain token bucket; its lock only serializes callers for that domain."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def _domain(url: str) -> str:
+    try:
+        host = urlparse(url).netloc.lower()
+    except Exception:
+        return ""
+    return host[4:] if host.startswith("www.") else host
+
+
+class FetchLayer:
+    """One aiohttp session on a private event-loop thread, shared by all callers."""
+
+    def __init__(
+        self,
+        concurrency: int = _CONCURRENCY,
+        per_host: int = _PER_HOST,
+        domain_rate: float = _DOMAIN_RATE,
+        domain_burst: int = _DOMAIN_BURST,
+        max_bytes: int = MAX_BYTES,
+        timeout_s: float = _TIMEOUT,
+        headers: dict[str, str] | None = None,
+        memo_max_bytes: int = _MEMO_MAX_BYTES,
+    ) -> None:
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.domain_rate = domain_rate
+        self.domain_burst = domain_burst
+        self.max_bytes = max_bytes
+        self.memo_max_bytes = memo_max_bytes
+        self.timeout_s = timeout_s
+        self.headers = dict(headers or DEFAULT_HEADERS)
+        self.downloads = 0
+        self.memo_hits = 0
+        self._memo: OrderedDict[str, FetchResult] = OrderedDict()
+        self._memo_bytes = 0
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="http-fetch", daemon=True)
+        self._thread.start()
+        self._session = self._submit(self._open()).result()
+
+    # -- loop plumbing -----------------------------------------------------
+
+    def _submit(self, coro) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def _open(self):
+        import aiohttp
+
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host, ttl_dns_cache=300)
+        return aiohttp.ClientSession(connector=connector, headers=self.headers)
+
+    def close(self) -> None:
+        if not self._loop.is_running():
+            return
+        with contextlib.suppress(Exception):
+            self._submit(self._session.close()).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+        self._memo.clear()
+        self._memo_bytes = 0
+
+    # -- public API --------------------------------------------------------
+
+    def fetch_sync(self, url: str, timeout_s: float | None = None, refresh: bool = False) -> FetchResult:
+        """Blocking fetch, safe to call from any thread."""
+        return self._submit(self._fetch(url, timeout_s, refresh)).result()
+
+    async def fetch(self, url: str, timeout_s: float | None = None, refresh: bool = False) -> FetchResult:
+        """Awaitable fetch, usable from any event loop."""
+        return await asyncio.wrap_future(self._submit(self._fetch(url, timeout_s, refresh)))
+
+    def fetch_many_sync(self, urls: list[str], timeout_s: float | None = None) -> dict[str, FetchResult]:
+        """Fetch *urls* concurrently (bounded by the layer's limits); blocking."""
+
+        async def _all() -> list[FetchResult]:
+            return await asyncio.gather(*(self._fetch(u, timeout_s, False) for u in urls))
+
+        results = self._submit(_all()).result()
+        return dict(zip(urls, results, strict=True))
+
+    def open_stream(self, url: str, timeout_s: float | None = None, max_bytes: int | None = None) -> FetchStream:
+        """Start a GET and return once headers arrive; blocking, any thread.
+
+        A memoized response is replayed from memory without downloading.
+        """
+        timeout_s = timeout_s or self.timeout_s
+        cap = min(max_bytes or self.max_bytes, self.max_bytes)
+        stop = threading.Event()
+        memo = self._memo.get(url)
+        if memo is not None:
+            self.memo_hits += 1
+            chunks: queue.Queue = queue.Queue()
+            if memo.ok:
+                body = memo.body[:cap]
+                for i in range(0, len(body), _READ_CHUNK):
+                    chunks.put(body[i : i + _READ_CHUNK])
+            chunks.put(None)
+            return FetchStream(memo, chunks, stop, timeout_s)
+        chunks = queue.Queue()
+        self._submit(self._stream(url, timeout_s, cap, chunks, stop))
+        try:
+            head = chunks.get(timeout=timeout_s + 5)
+        except queue.Empty:
+            stop.set()
+            return FetchStream(FetchResult(url=url, final_url=url, error=ERR_TIMEOUT), None, stop, timeout_s)
+        return FetchStream(head, chunks if head.ok else None, stop, timeout_s + 5)
+
+    def cached(self, url: str) -> FetchResult | None:
+        """Return the memoized response for *url* without fetching."""
+        return self._memo.get(url)
+
+    def stats(self) -> dict[str, int]:
+        return {"downloads": self.downloads, "memo_hits": self.memo_hits}
+
+    # -- internals (run on the layer's loop) -------------------------------
+
+    async def _fetch(self, url: str, timeout_s: float | None, refresh: bool) -> FetchResult:
+        if not refresh:
+            memo = self._memo.get(url)
+            if memo is not None:
+                self.memo_hits += 1
+                return memo
+            task = self._inflight.get(url)
+            if task is not None:
+                self.memo_hits += 1
+                return await asyncio.shield(task)
+        task = asyncio.ensure_future(self._download(url, timeout_s or self.timeout_s))
+        self._inflight[url] = task
+        try:
+            result = await task
+        finally:
+            self._inflight.pop(url, None)
+        # Transport failures are not memoized so a later stage can retry.
+        if not result.error:
+            self._remember(url, result)
+        return result
+
+    def _remember(self, url: str, result: FetchResult) -> None:
+        """Memoize *result*, dropping the oldest bodies beyond ``memo_max_bytes``."""
+        old = self._memo.pop(url, None)
+        if old is not None:
+            self._memo_bytes -= len(old.body)
+        if len(result.body) > self.memo_max_bytes:
+            return
+        self._memo[url] = result
+        self._memo_bytes += len(result.body)
+        while self._memo_bytes > self.memo_max_bytes:
+            _, dropped = self._memo.popitem(last=False)
+            self._memo_bytes -= len(dropped.body)
+
+    async def _download(self, url: str, timeout_s: float) -> FetchResult:
+        import aiohttp
+
+        domain = _domain(url)
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = self._buckets[domain] = _TokenBucket(self.domain_rate, self.domain_burst)
+
+        result = FetchResult(url=url, final_url=url)
+        t0 = time.monotonic()
+        async with self._semaphore:
+            await bucket.acquire()
+            self.downloads += 1
+            try:
+                async with self._session.get(
+                    url, timeout=aiohttp.ClientTimeout(total=timeout_s), allow_redirects=True
+                ) as resp:
+                    result.status = resp.status
+                    result.final_url = str(resp.url)
+                    result.redirects = len(resp.history)
+                    result.charset = resp.charset or ""
+                    chunks: list[bytes] = []
+                    size = 0
+                    while size < self.max_bytes:
+                        chunk = await resp.content.read(min(_READ_CHUNK, self.max_bytes - size))
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                        size += len(chunk)
+                    result.truncated = size >= self.max_bytes and not resp.content.at_eof()
+                    result.body = b"".join(chunks)
+            except TimeoutError:
+                result.error = ERR_TIMEOUT
+            except Exception:
+                result.error = ERR_CONNECTION
+        result.elapsed = time.monotonic() - t0
+        return result
+
+    async def _stream(self, url: str, timeout_s: float, cap: int, chunks: queue.Queue, stop: threading.Event) -> None:
+        """Feed *chunks* with: head FetchResult, body chunks, [error code], None."""
+        import aiohttp
+
+        domain = _domain(url)
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = self._buckets[domain] = _TokenBucket(self.domain_rate, self.domain_burst)
+
+        head = FetchResult(url=url, final_url=url)
+        sent_head = False
+        t0 = time.monotonic()
+        async with self._semaphore:
+            await bucket.acquire()
+            self.downloads += 1
+            try:
+                async with self._session.get(
+                    url, timeout=aiohttp.ClientTimeout(total=timeout_s), allow_redirects=True
+                ) as resp:
+                    head.status = resp.status
+                    head.final_url = str(resp.url)
+                    head.redirects = len(resp.history)
+                    head.charset = resp.charset or ""
+                    head.elapsed = time.monotonic() - t0
+                    chunks.put(head)
+                    sent_head = True
+                    size = 0
+                    while head.ok and size < cap and not stop.is_set():
+                        chunk = await resp.content.read(min(_READ_CHUNK, cap - size))
+                        if not chunk:
+                            break
+                        chunks.put(chunk)
+                        size += len(chunk)
+            except TimeoutError:
+                head.error = ERR_TIMEOUT
+            except Exception:
+                head.error = ERR_CONNECTION
+        if not sent_head:
+            chunks.put(head)
+        elif head.error:
+            chunks.put(head.error)
+        chunks.put(None)
+
+
+_layer: FetchLayer | None = None
+_layer_lock = threading.Lock()
+
+
+def get_fetch_layer() -> FetchLayer | None:
+    """Return the run's shared fetch layer, or None when aiohttp is unavailable."""
+    global _layer
+    with _layer_lock:
+        if _layer is None:
+            try:
+                import aiohttp  # noqa: F401
+            except ImportError:
+                return None
+            _layer = FetchLayer()
+        return _layer
+
+
+def release_fetch_layer() -> None:
+    """Close the shared session and drop the per-run response memo."""
+    global _layer
+    with _layer_lock:
+        if _layer is not None:
+            _layer.close()
+        _layer = None
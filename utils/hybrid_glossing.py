@@ -12,6 +12,7 @@ Public API
 load_glossary()          — load / cache config/proper_noun_glossary.json
 extract_proper_nouns()   — regex-based capitalised-token extractor
 apply_glossary()         — first-occurrence ZH annotation
+compile_glossary()       — glossary prepared once for single-scan annotation
 ensure_not_all_english() — prepend ZH skeleton when ASCII ratio > 60% + ZH < 12
 normalize_exec_text()    — combined pipeline (apply_glossary → ensure_not_all_english)
 reset_gloss_stats()      — zero the per-run counters
@@ -20,7 +21,9 @@ get_gloss_stats()        — return a snapshot of the current counters
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 # ---------------------------------------------------------------------------
 # Module-level stats counters — zeroed by reset_gloss_stats() each pipeline run
@@ -127,6 +130,181 @@ def extract_proper_nouns(text: str) -> list[str]:
     return result
 
 
+class CompiledGlossary:
+    """A glossary prepared once for repeated first-occurrence annotation.
+
+    ``apply()`` finds every term occurrence in one scan of the text (one
+    case-insensitive trie-shaped pattern, longest terms first) and splices all
+    annotations in one rebuild.  It produces exactly what annotating term by
+    term would: terms are still decided longest-first, an occurrence already
+    followed by 「（」 — in the input or right after an annotation inserted
+    for a longer term — marks the term as seen, and an annotation that breaks
+    up a shorter term's occurrence removes that occurrence.
+
+    Annotations can contain later terms (``GPT-4o`` → ``GPT-4 全模態版``);
+    such terms are also looked up inside the annotations inserted so far, and
+    one that first occurs there is annotated inside it, as the term-by-term
+    pass would.  When a term does not start and end with a word character (or
+    is not ASCII), the result depends on Unicode case folding and boundary
+    details; those glossaries take the term-by-term path, still with
+    precompiled patterns.
+    """
+
+    def __init__(self, items: tuple[tuple[str, Any], ...]) -> None:
+        # Longest terms first; stable, so equal lengths keep glossary order.
+        ordered = sorted(items, key=lambda kv: -len(kv[0]))
+        self.terms: tuple[str, ...] = tuple(t for t, _ in ordered if t.lower() not in _NO_GLOSS_LOWER)
+        annotations = dict(ordered)
+        self._suffix = {t: f"（{annotations[t]}）" for t in self.terms}
+        self._term_res = {
+            t: re.compile(r"\b" + re.escape(t) + r"\b", re.IGNORECASE) for t in self.terms
+        }
+        self._annotated_res = {
+            t: re.compile(r"\b" + re.escape(t) + r"（", re.IGNORECASE) for t in self.terms
+        }
+
+        self._scan: re.Pattern[str] | None = None
+        if not self.terms or not all(t.isascii() and _word_bounded(t) for t in self.terms):
+            return
+        self._scan = re.compile(r"(?=\b(" + _trie_pattern(self.terms) + "))", re.IGNORECASE)
+        self._by_lower: dict[str, int] = {}
+        for i, t in enumerate(self.terms):
+            self._by_lower.setdefault(t.lower(), i)
+        # Later (never longer) terms that can match where term i matches.
+        self._same_start: tuple[tuple[int, ...], ...] = tuple(
+            tuple(
+                j for j in range(i + 1, len(self.terms))
+                if self.terms[i].lower().startswith(self.terms[j].lower())
+            )
+            for i in range(len(self.terms))
+        )
+        # Terms that can occur inside an annotation (terms never span 「（」/「）」,
+        # so nesting annotations cannot create new occurrences).
+        self._inner: frozenset[str] = frozenset(
+            t for t in self.terms if any(self._term_res[t].search(suf) for suf in self._suffix.values())
+        )
+
+    def apply(self, text: str, seen: set) -> str:
+        if self._scan is None:
+            return self._apply_sequential(text, seen)
+
+        # term index -> [(start, end), ...] of every \bterm\b occurrence
+        occurrences: dict[int, list[tuple[int, int]]] = {}
+        for m in self._scan.finditer(text):
+            pos = m.start()
+            i = self._by_lower.get(m.group(1).lower())
+            if i is None:  # matched through Unicode case folding (e.g. "ſ" ~ "s")
+                i = next(k for k, t in enumerate(self.terms) if self._term_res[t].match(text, pos))
+            occurrences.setdefault(i, []).append(m.span(1))
+            for j in self._same_start[i]:
+                jm = self._term_res[self.terms[j]].match(text, pos)
+                if jm:
+                    occurrences.setdefault(j, []).append(jm.span())
+
+        inserts: dict[int, str] = {}   # insertion offset -> annotation text inserted there
+        applied = 0
+        for i, term in enumerate(self.terms):
+            term_key = term.lower()
+            if term_key in seen:
+                continue
+            occs = [
+                (s, e) for s, e in occurrences.get(i, ())
+                if not any(s < p < e for p in inserts)
+            ]
+            if any(text.startswith("（", e) or e in inserts for _, e in occs):
+                seen.add(term_key)
+                continue
+            # (offset, 1, end) in the text; (offset, 0, end) inside the
+            # annotation inserted at offset, which precedes text[offset:].
+            firsts = [(s, 1, e) for s, e in occs]
+            if term in self._inner:
+                if any(self._annotated_res[term].search(inner) for inner in inserts.values()):
+                    seen.add(term_key)
+                    continue
+                for offset, inner in inserts.items():
+                    im = self._term_res[term].search(inner)
+                    if im:
+                        firsts.append((offset, 0, im.end()))
+            if firsts:
+                offset, in_text, end = min(firsts)
+                if in_text:
+                    inserts[end] = self._suffix[term]
+                else:
+                    inner = inserts[offset]
+                    inserts[offset] = inner[:end] + self._suffix[term] + inner[end:]
+                applied += 1
+                seen.add(term_key)
+
+        if not inserts:
+            return text
+        _stats["proper_noun_gloss_applied_count"] += applied
+        parts: list[str] = []
+        last = 0
+        for offset in sorted(inserts):
+            parts.append(text[last:offset])
+            parts.append(inserts[offset])
+            last = offset
+        parts.append(text[last:])
+        return "".join(parts)
+
+    def _apply_sequential(self, text: str, seen: set) -> str:
+        result = text
+        for term in self.terms:
+            term_key = term.lower()
+            if term_key in seen:
+                continue
+            # Skip if already annotated (previous pass inserted 「term（」)
+            if self._annotated_res[term].search(result):
+                seen.add(term_key)
+                continue
+            match = self._term_res[term].search(result)
+            if match:
+                result = result[: match.end()] + self._suffix[term] + result[match.end() :]
+                seen.add(term_key)
+                _stats["proper_noun_gloss_applied_count"] += 1
+        return result
+
+
+def _trie_pattern(terms: tuple[str, ...]) -> str:
+    """Alternation of *terms* shaped as a lower-case character trie.
+
+    Each term ends in ``\\b``; children are tried before a term ends, so the
+    longest term with a word boundary after it wins at each position.
+    """
+    trie: dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for ch in term.lower():
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def _build(node: dict[str, dict]) -> str:
+        branches = [re.escape(ch) + _build(child) for ch, child in sorted(node.items()) if ch]
+        if "" in node:
+            branches.append(r"\b")
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return _build(trie)
+
+
+def _word_bounded(term: str) -> bool:
+    return bool(re.fullmatch(r"\w(?:[^（）]*\w)?", term))
+
+
+@lru_cache(maxsize=16)
+def _compile_cached(items: tuple[tuple[str, Any], ...]) -> CompiledGlossary:
+    return CompiledGlossary(items)
+
+
+def compile_glossary(glossary: dict) -> CompiledGlossary:
+    """Return the compiled form of *glossary* (cached per glossary content)."""
+    items = tuple(glossary.items())
+    try:
+        return _compile_cached(items)
+    except TypeError:  # unhashable annotation values
+        return CompiledGlossary(items)
+
+
 def apply_glossary(text: str, glossary: dict, seen: "set | None" = None) -> str:
     """Annotate the first occurrence of each glossary term with its ZH explanation.
 
@@ -146,35 +324,14 @@ def apply_glossary(text: str, glossary: dict, seen: "set | None" = None) -> str:
           (e.g. "Google DeepMind" before "Google").
         * If the term is already followed by a 「（」 in the text it is assumed
           to have been annotated in a previous pass and is skipped.
+        * The glossary is compiled once (``compile_glossary``) and the text is
+          scanned once for all terms.
     """
     if seen is None:
         seen = set()
     if not glossary or not text:
         return text
-
-    result = text
-    # Process longest terms first to prevent partial-match clobbering
-    for term, zh_annotation in sorted(glossary.items(), key=lambda kv: -len(kv[0])):
-        term_key = term.lower()
-        if term_key in seen:
-            continue
-        # Big Tech / AI Lab companies: never annotate, regardless of glossary entry
-        if term_key in _NO_GLOSS_LOWER:
-            continue
-        # Skip if already annotated (previous pass inserted 「term（」)
-        if re.search(r'\b' + re.escape(term) + r'（', result, re.IGNORECASE):
-            seen.add(term_key)
-            continue
-        pattern = re.compile(r'\b' + re.escape(term) + r'\b', re.IGNORECASE)
-        match = pattern.search(result)
-        if match:
-            original = match.group(0)
-            replacement = f"{original}（{zh_annotation}）"
-            result = result[: match.start()] + replacement + result[match.end() :]
-            seen.add(term_key)
-            _stats["proper_noun_gloss_applied_count"] += 1
-
-    return result
+    return compile_glossary(glossary).apply(text, seen)
 
 
 def zh_skeletonize_if_english_heavy(
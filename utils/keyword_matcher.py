@@ -0,0 +1,115 @@
+"""Compiled keyword tables: per-list substring hit counts from one matcher.
+
+Several gates score text with ``sum(1 for kw in KEYWORDS if kw in text)``:
+``ai_core.classify_content`` (one list per category), ``chain_b_fallback``
+(ad keywords), ``info_density`` (entity / boilerplate keywords) and
+``ingestion.filter_items`` (``KEYWORD_FILTER``).  Z0 frontier scoring keeps
+its own loop so ``core/z0_collector.py`` stays stdlib-only.
+``KeywordMatcher`` compiles such a table once:
+
+  - keywords shared by several lists are tested once per text;
+  - tables of ``KEYWORD_MATCHER_REGEX_MIN`` or more distinct keywords are
+    scanned in a single pass by one trie-shaped regex (an overlapping
+    lookahead scan, so nested / overlapping keywords are all found);
+  - smaller tables keep CPython's ``str.__contains__``, which is faster than
+    any automaton written in Python below that size (see
+    ``scripts/bench_keyword_matcher.py``).
+
+Counts are exactly what the loops returned: a keyword counts once per list
+entry when it occurs anywhere in the text (duplicates in a list count twice).
+Matching is case-sensitive; callers lower-case both sides as before.
+
+Env overrides:
+  KEYWORD_MATCHER_REGEX_MIN  distinct keywords before the regex scan is used,
+                             default 256
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+
+REGEX_MIN_KEYWORDS = int(os.getenv("KEYWORD_MATCHER_REGEX_MIN", "256"))
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Regex for *keywords* shaped as a character trie (longest match wins)."""
+    trie: dict[str, dict] = {}
+    for kw in keywords:
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def _build(node: dict[str, dict]) -> str:
+        branches = [re.escape(ch) + _build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return _build(trie)
+
+
+class KeywordMatcher:
+    """One or more named keyword lists compiled for repeated scans."""
+
+    def __init__(
+        self,
+        tables: Mapping[str, Iterable[str]] | Iterable[str],
+        *,
+        regex_min: int | None = None,
+    ) -> None:
+        if not isinstance(tables, Mapping):
+            tables = {"": tables}
+        index: dict[str, int] = {}
+        lists: list[tuple[int, ...]] = []
+        for keywords in tables.values():
+            lists.append(tuple(index.setdefault(kw, len(index)) for kw in keywords))
+        self.names: tuple[str, ...] = tuple(tables)
+        self.keywords: tuple[str, ...] = tuple(index)
+        self._lists = tuple(lists)
+        self._index = index
+
+        threshold = REGEX_MIN_KEYWORDS if regex_min is None else regex_min
+        self._regex: re.Pattern[str] | None = None
+        self._prefixes: dict[str, tuple[str, ...]] = {}
+        if self.keywords and len(self.keywords) >= threshold:
+            self._regex = re.compile(f"(?=({_trie_pattern(self.keywords)}))")
+            # The scan reports the longest keyword starting at each position;
+            # keywords that are prefixes of it start there too.
+            self._prefixes = {kw: tuple(p for p in self.keywords if kw.startswith(p)) for kw in self.keywords}
+
+    def present(self, text: str) -> list[bool]:
+        """Per distinct keyword (``self.keywords`` order): does it occur in *text*?"""
+        if self._regex is None:
+            return [kw in text for kw in self.keywords]
+        hits = [False] * len(self.keywords)
+        index = self._index
+        for longest in set(self._regex.findall(text)):
+            for kw in self._prefixes[longest]:
+                hits[index[kw]] = True
+        return hits
+
+    def counts(self, text: str) -> dict[str, int]:
+        """Hit count per list name."""
+        hits = self.present(text)
+        return {name: sum(1 for i in idx if hits[i]) for name, idx in zip(self.names, self._lists, strict=True)}
+
+    def count(self, text: str) -> int:
+        """Hit count summed over every list."""
+        return sum(self.counts(text).values())
+
+    def any(self, text: str) -> bool:
+        """True when at least one keyword occurs in *text*."""
+        if self._regex is None:
+            return any(kw in text for kw in self.keywords)
+        return self._regex.search(text) is not None
+
+
+@lru_cache(maxsize=256)
+def keyword_matcher(keywords: tuple[str, ...] | frozenset[str]) -> KeywordMatcher:
+    """Shared single-list matcher for an ad-hoc keyword collection."""
+    return KeywordMatcher(keywords)
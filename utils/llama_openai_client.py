@@ -1,10 +1,12 @@
-"""utils/llama_openai_client.py — Stdlib-only client for llama-server.exe OpenAI API.
+"""utils/llama_openai_client.py — Client for llama-server.exe OpenAI API.
 
-No pip dependencies.  Uses urllib only.
+Requests go through the shared pooled client (utils/llm_client), which uses
+aiohttp keep-alive connections when installed and urllib otherwise.
 
 Environment variables:
     LLAMA_HOST             : base URL   (default http://127.0.0.1:8080)
     LLAMA_TIMEOUT_SECONDS  : HTTP timeout in seconds (default 120)
+    LLAMA_PARALLEL         : slot count assumed when /props is unavailable (default 1)
 
 Public API
 ----------
@@ -13,18 +15,25 @@ Public API
         POST /v1/chat/completions.
         Returns (True, text) on success, (False, error_message) on failure.
         Never raises — caller always gets a (bool, str) tuple.
+        Successful replies are kept in the persistent LLM response cache
+        (utils/llm_cache), so identical requests skip the server.
 
     is_available(timeout=5) -> bool
         GET /v1/models; returns True if llama-server is reachable.
+
+    server_slots(timeout=5) -> int
+        GET /props; the server's parallel slot count (``total_slots``),
+        LLAMA_PARALLEL when the server does not report it.
 """
 from __future__ import annotations
 
 import json
 import os
-import time
-import urllib.error
 import urllib.request
 
+from utils.llm_cache import get_llm_cache
+from utils.llm_client import get_llm_client
+
 # ---------------------------------------------------------------------------
 # Config from environment
 # ---------------------------------------------------------------------------
@@ -34,6 +43,7 @@ _DEFAULT_TIMEOUT = 120
 
 LLAMA_HOST    = os.environ.get("LLAMA_HOST",            _DEFAULT_HOST).strip().rstrip("/")
 LLAMA_TIMEOUT = int(os.environ.get("LLAMA_TIMEOUT_SECONDS", str(_DEFAULT_TIMEOUT)))
+LLAMA_PARALLEL = max(1, int(os.environ.get("LLAMA_PARALLEL", "1")))
 
 # Ensure protocol prefix
 if not LLAMA_HOST.startswith(("http://", "https://")):
@@ -44,18 +54,12 @@ if not LLAMA_HOST.startswith(("http://", "https://")):
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _post(path: str, payload: dict, timeout: int) -> dict:
-    url  = f"{LLAMA_HOST}{path}"
-    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-    req  = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json", "Accept": "application/json"},
-        method="POST",
-    )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        raw = resp.read()
-    return json.loads(raw)
+class _EmptyChoices(Exception):
+    """Reply without choices; reported to the caller and never cached."""
+
+
+def _post(path: str, payload: dict, timeout: int, retries: int = 0) -> dict:
+    return get_llm_client().post_json(f"{LLAMA_HOST}{path}", payload, timeout_s=timeout, retries=retries)
 
 
 def _get(path: str, timeout: int = 10) -> dict:
@@ -78,6 +82,15 @@ def is_available(timeout: int = 5) -> bool:
         return False
 
 
+def server_slots(timeout: int = 5) -> int:
+    """Return llama-server's parallel slot count (LLAMA_PARALLEL if unknown)."""
+    try:
+        slots = int(_get("/props", timeout=timeout).get("total_slots") or 0)
+    except Exception:
+        slots = 0
+    return slots if slots > 0 else LLAMA_PARALLEL
+
+
 def chat(
     messages: list[dict],
     model: str = "qwen2.5-7b-instruct",
@@ -116,24 +129,24 @@ def chat(
         "stream":      False,
     }
 
-    last_err = ""
-    for attempt in range(max_retries + 1):
-        try:
-            resp = _post("/v1/chat/completions", payload, _timeout)
-            # OpenAI response format
-            choices = resp.get("choices") or []
-            if not choices:
-                return (False, f"empty choices in response: {resp!r}")
-            text = (choices[0].get("message") or {}).get("content", "") or ""
-            return (True, text.strip())
-        except (urllib.error.URLError, OSError, TimeoutError) as exc:
-            last_err = str(exc)
-            if attempt < max_retries:
-                time.sleep(2 ** attempt)
-        except json.JSONDecodeError as exc:
-            return (False, f"JSON parse error: {exc}")
-        except Exception as exc:
-            last_err = str(exc)
-            break
-
-    return (False, f"llama_openai_client.chat failed after {max_retries + 1} attempt(s): {last_err}")
+    def _request() -> str:
+        resp = _post("/v1/chat/completions", payload, _timeout, max_retries)
+        # OpenAI response format
+        choices = resp.get("choices") or []
+        if not choices:
+            raise _EmptyChoices(f"empty choices in response: {resp!r}")
+        return ((choices[0].get("message") or {}).get("content", "") or "").strip()
+
+    endpoint = f"{LLAMA_HOST}/v1/chat/completions"
+    cache = get_llm_cache()
+    try:
+        if cache is None:
+            return (True, _request())
+        return (
+            True,
+            cache.get_or_call(_request, endpoint, model, temperature, messages, top_p=top_p, max_tokens=max_tokens),
+        )
+    except _EmptyChoices as exc:
+        return (False, str(exc))
+    except Exception as exc:
+        return (False, f"llama_openai_client.chat failed: {exc}")
@@ -0,0 +1,208 @@
+"""Persistent LLM response cache shared by every model call site.
+
+Z0 items stay in the candidate window for several consecutive runs, and a
+rerun after a crash replays the same prompts, so the same chat completion used
+to be recomputed again and again.  This cache stores the response text per
+``sha256(endpoint, model, temperature, messages, extra params)``; an identical
+request is answered from disk without touching the model.
+
+Entries live for ``LLM_CACHE_TTL_HOURS``.  The table is bounded to
+``LLM_CACHE_MAX_ENTRIES`` rows: beyond that the least recently used rows are
+evicted.  Only successful, non-empty responses are stored; callers that
+parse the reply pass ``validate`` so unusable replies are not stored either.
+
+Stored in SQLite next to ``data/intel.db`` (stdlib only, so ``llm_engine`` and
+the urllib clients can use it too).
+
+Env overrides:
+  LLM_CACHE_ENABLED      1/0, default 1
+  LLM_CACHE_PATH         default <repo>/data/llm_cache.db
+  LLM_CACHE_TTL_HOURS    default 168 (7 days)
+  LLM_CACHE_MAX_ENTRIES  default 20000
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+_DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "llm_cache.db"
+_TTL_S = float(os.getenv("LLM_CACHE_TTL_HOURS", "168")) * 3600
+_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "20000"))
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key         TEXT PRIMARY KEY,
+    endpoint    TEXT NOT NULL,
+    model       TEXT NOT NULL,
+    response    TEXT NOT NULL,
+    expires_at  REAL NOT NULL,
+    last_used   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache(last_used);
+"""
+
+
+def cache_key(endpoint: str, model: str, temperature: float, messages: object, **params: object) -> str:
+    """Stable hash of one model request.
+
+    *messages* is the chat message list (or the raw prompt for completion-style
+    APIs); *params* are any other generation settings that change the output
+    (``max_tokens``, ``top_p``, ``num_ctx`` …).
+    """
+    blob = json.dumps(
+        {
+            "endpoint": endpoint.rstrip("/"),
+            "model": model,
+            "temperature": float(temperature),
+            "messages": messages,
+            "params": params,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Thread-safe SQLite cache of model responses with TTL + LRU bound."""
+
+    def __init__(self, path: Path, ttl_s: float = _TTL_S, max_entries: int = _MAX_ENTRIES) -> None:
+        self.path = path
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(_DDL)
+        self._conn.commit()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for *key*, or None when absent / expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return row[0]
+
+    def put(self, key: str, response: str, endpoint: str = "", model: str = "") -> bool:
+        """Store *response* under *key*; empty responses are skipped. Returns True when stored."""
+        if not response:
+            return False
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO llm_cache (key, endpoint, model, response, expires_at, last_used)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (key, endpoint, model, response, now + self.ttl_s, now),
+            )
+            self.stores += 1
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            if self.max_entries > 0 and count > self.max_entries:
+                cur = self._conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+                self.evictions += cur.rowcount
+            self._conn.commit()
+        return True
+
+    def get_or_call(
+        self,
+        call: Callable[[], str],
+        endpoint: str,
+        model: str,
+        temperature: float,
+        messages: object,
+        validate: Callable[[str], bool] | None = None,
+        **params: object,
+    ) -> str:
+        """Return the cached response for this request, else ``call()`` and cache its result.
+
+        With *validate*, a fresh response is stored only when ``validate(response)``
+        is true, so a reply the caller cannot use is requested again next time.
+        """
+        key = cache_key(endpoint, model, temperature, messages, **params)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        response = call()
+        if validate is None or validate(response):
+            self.put(key, response, endpoint, model)
+        return response
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "stores": self.stores, "evictions": self.evictions}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.stores = self.evictions = 0
+
+    def prune(self) -> int:
+        """Delete expired rows. Returns rows removed."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+            return cur.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: LLMResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache | None:
+    """Return the process-wide cache, or None when disabled / unavailable."""
+    global _cache
+    if os.getenv("LLM_CACHE_ENABLED", "1").strip().lower() in ("0", "false", "no"):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            raw = os.getenv("LLM_CACHE_PATH", "").strip()
+            try:
+                _cache = LLMResponseCache(Path(raw) if raw else _DEFAULT_PATH)
+                _cache.prune()
+            except (OSError, sqlite3.Error):
+                return None
+        return _cache
+
+
+def llm_cache_stats() -> dict[str, int]:
+    """Counters of the process-wide cache without opening it (zeros when unused)."""
+    with _cache_lock:
+        cache = _cache
+    if cache is None:
+        return {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+    return cache.stats()
+
+
+def reset_llm_cache() -> None:
+    """Close and drop the process-wide cache (tests / path changes)."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
@@ -0,0 +1,537 @@
+"""Shared OpenAI-compatible LLM HTTP client used by every model call site.
+
+Before this module there were four hand-rolled clients — ``requests.post`` in
+``core/ai_core``, urllib in ``utils/llama_openai_client`` and
+``utils/ollama_client``, and urllib via ``asyncio.to_thread`` in
+``llm_engine`` — none reusing connections, each with its own retry/timeout
+rules.
+
+``LLMClient`` follows the ``utils/http_fetch.FetchLayer`` design: ONE
+long-lived aiohttp session running on a background event-loop thread, so sync
+callers (any thread) and async callers (any loop) share its keep-alive
+connection pool.  On top of it:
+
+- one retry policy: connection errors, timeouts, 408/409/429 and 5xx are
+  retried with exponential backoff; other 4xx and malformed JSON are not
+- a global in-flight limit (``LLM_CLIENT_CONCURRENCY``)
+- ``stream_chat()`` / ``astream_chat()`` yield SSE content deltas and stop
+  reading as soon as the consumer stops iterating
+- request / retry / error counters, latency percentiles and token usage
+  (``stats()``), exported to ``metrics.json`` by ``utils/metrics``
+
+Without aiohttp the same client sends requests with urllib on worker threads
+(no pooling), so the stdlib-only callers keep working.
+
+Env overrides:
+  LLM_CLIENT_CONCURRENCY  in-flight requests across all endpoints, default 8
+  LLM_CLIENT_PER_HOST     pooled connections per host, default 8
+  LLM_CLIENT_TIMEOUT      default per-request timeout (s), default 120
+  LLM_CLIENT_RETRIES      extra attempts on retryable failures, default 2
+  LLM_CLIENT_BACKOFF      first retry delay (s), doubled per attempt up to 30, default 1.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import queue
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import AsyncGenerator, Callable, Iterator
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import aiohttp
+
+_CONCURRENCY = int(os.getenv("LLM_CLIENT_CONCURRENCY", "8"))
+_PER_HOST = int(os.getenv("LLM_CLIENT_PER_HOST", "8"))
+_TIMEOUT = float(os.getenv("LLM_CLIENT_TIMEOUT", "120"))
+_RETRIES = int(os.getenv("LLM_CLIENT_RETRIES", "2"))
+_BACKOFF = float(os.getenv("LLM_CLIENT_BACKOFF", "1.0"))
+_MAX_BACKOFF = 30.0
+
+RETRY_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+_JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8", "Accept": "application/json"}
+
+
+class LLMClientError(RuntimeError):
+    """A request failed after all retries (or with a non-retryable error)."""
+
+    def __init__(self, message: str, status: int | None = None, retryable: bool = False) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retryable = retryable
+
+
+@dataclass
+class ChatResult:
+    """Text and usage of one chat completion."""
+
+    text: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_s: float = 0.0
+    raw: dict = field(default_factory=dict)
+
+
+def chat_text(obj: dict) -> str:
+    """``choices[0].message.content`` of a chat completion; LLMClientError if absent."""
+    try:
+        content = obj["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError) as exc:
+        raise LLMClientError(f"unexpected chat completion structure: {exc!r}") from exc
+    if content is None:
+        return ""
+    if not isinstance(content, str):
+        raise LLMClientError(f"chat completion content is not a string: {type(content)}")
+    return content
+
+
+def _usage(obj: dict) -> tuple[int, int]:
+    usage = obj.get("usage") if isinstance(obj, dict) else None
+    if isinstance(usage, dict):
+        return int(usage.get("prompt_tokens") or 0), int(usage.get("completion_tokens") or 0)
+    # Ollama /api/generate
+    if isinstance(obj, dict) and "eval_count" in obj:
+        return int(obj.get("prompt_eval_count") or 0), int(obj.get("eval_count") or 0)
+    return 0, 0
+
+
+def _sse_delta(line: bytes) -> tuple[str, dict | None, bool]:
+    """Parse one SSE line -> (content delta, event object, done)."""
+    line = line.strip()
+    if not line.startswith(b"data:"):
+        return "", None, False
+    data = line[5:].strip()
+    if data == b"[DONE]":
+        return "", None, True
+    try:
+        obj = json.loads(data)
+    except ValueError:
+        return "", None, False
+    choices = obj.get("choices") or []
+    # OpenAI chat chunks carry choices[0].delta; llama.cpp native /completion a top-level "content"
+    delta = ((choices[0].get("delta") or {}).get("content") if choices else obj.get("content")) or ""
+    return delta, obj, obj.get("stop") is True
+
+
+def _backoff(attempt: int, base: float) -> float:
+    return min(_MAX_BACKOFF, base * (2**attempt))
+
+
+def _urllib_send(url: str, body: bytes, headers: dict[str, str], timeout_s: float) -> tuple[int, bytes]:
+    req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+    try:
+        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.read() or b""
+
+
+class _Stats:
+    """Thread-safe request counters and latency samples."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+            self.errors = 0
+            self.prompt_tokens = 0
+            self.completion_tokens = 0
+            self.latencies: list[float] = []
+
+    def ok(self, latency: float, obj: dict | None) -> None:
+        prompt, completion = _usage(obj) if obj else (0, 0)
+        with self._lock:
+            self.requests += 1
+            self.prompt_tokens += prompt
+            self.completion_tokens += completion
+            self.latencies.append(latency)
+
+    def retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def error(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self.errors += 1
+
+    def snapshot(self) -> dict[str, float | int]:
+        with self._lock:
+            lat = sorted(self.latencies)
+            p50 = round(statistics.median(lat), 3) if lat else 0.0
+            p95 = round(lat[min(int(len(lat) * 0.95), len(lat) - 1)], 3) if lat else 0.0
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "errors": self.errors,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "latency_p50": p50,
+                "latency_p95": p95,
+            }
+
+
+class LLMClient:
+    """Pooled JSON-over-HTTP client with sync + async + streaming interfaces."""
+
+    def __init__(
+        self,
+        concurrency: int = _CONCURRENCY,
+        per_host: int = _PER_HOST,
+        timeout_s: float = _TIMEOUT,
+        retries: int = _RETRIES,
+        backoff_s: float = _BACKOFF,
+        use_aiohttp: bool = True,
+    ) -> None:
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.timeout_s = timeout_s
+        self.retries = max(0, retries)
+        self.backoff_s = backoff_s
+        self._stats = _Stats()
+        self._session: aiohttp.ClientSession | None = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="llm-client", daemon=True)
+        self._thread.start()
+        self._submit(self._open(use_aiohttp)).result()
+
+    # -- loop plumbing -----------------------------------------------------
+
+    def _submit(self, coro) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def _open(self, use_aiohttp: bool) -> None:
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        if not use_aiohttp:
+            return
+        try:
+            import aiohttp
+        except ImportError:
+            return
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host, ttl_dns_cache=300)
+        self._session = aiohttp.ClientSession(connector=connector, headers=_JSON_HEADERS)
+
+    @property
+    def pooled(self) -> bool:
+        """True when requests share the aiohttp keep-alive pool."""
+        return self._session is not None
+
+    def close(self) -> None:
+        if not self._loop.is_running():
+            return
+        session = self._session
+        if session is not None:
+            with contextlib.suppress(Exception):
+                self._submit(session.close()).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+
+    # -- public API --------------------------------------------------------
+
+    def post_json(
+        self,
+        url: str,
+        payload: dict,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout_s: float | None = None,
+        retries: int | None = None,
+    ) -> dict:
+        """POST *payload* as JSON and return the decoded reply; blocking, any thread."""
+        return self._submit(self._post(url, payload, headers, timeout_s, retries)).result()
+
+    async def apost_json(
+        self,
+        url: str,
+        payload: dict,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout_s: float | None = None,
+        retries: int | None = None,
+    ) -> dict:
+        """Awaitable post_json, usable from any event loop."""
+        return await asyncio.wrap_future(self._submit(self._post(url, payload, headers, timeout_s, retries)))
+
+    def chat(
+        self,
+        url: str,
+        messages: list[dict],
+        *,
+        model: str,
+        temperature: float = 0.0,
+        headers: dict[str, str] | None = None,
+        timeout_s: float | None = None,
+        retries: int | None = None,
+        **params: object,
+    ) -> ChatResult:
+        """Non-streaming chat completion against an OpenAI-compatible *url*."""
+        payload = {"model": model, "messages": messages, "temperature": temperature, **params}
+        t0 = time.monotonic()
+        obj = self.post_json(url, payload, headers=headers, timeout_s=timeout_s, retries=retries)
+        return self._chat_result(obj, time.monotonic() - t0)
+
+    async def achat(
+        self,
+        url: str,
+        messages: list[dict],
+        *,
+        model: str,
+        temperature: float = 0.0,
+        headers: dict[str, str] | None = None,
+        timeout_s: float | None = None,
+        retries: int | None = None,
+        **params: object,
+    ) -> ChatResult:
+        """Awaitable chat()."""
+        payload = {"model": model, "messages": messages, "temperature": temperature, **params}
+        t0 = time.monotonic()
+        obj = await self.apost_json(url, payload, headers=headers, timeout_s=timeout_s, retries=retries)
+        return self._chat_result(obj, time.monotonic() - t0)
+
+    def stream_chat(
+        self,
+        url: str,
+        payload: dict,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout_s: float | None = None,
+    ) -> Iterator[str]:
+        """POST *payload* with ``stream: true`` and yield content deltas; any thread.
+
+        Leaving the loop early (``break`` / ``close()``) stops reading and
+        releases the connection.  Failures raise LLMClientError; streams are
+        not retried.
+        """
+        chunks: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        self._submit(self._stream(url, payload, headers, timeout_s, chunks.put, stop))
+        try:
+            while True:
+                item = chunks.get()
+                if item is None:
+                    return
+                if isinstance(item, LLMClientError):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
+    async def astream_chat(
+        self,
+        url: str,
+        payload: dict,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout_s: float | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Async stream_chat(), usable from any event loop."""
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+
+        def _put(item: object) -> None:
+            loop.call_soon_threadsafe(chunks.put_nowait, item)
+
+        self._submit(self._stream(url, payload, headers, timeout_s, _put, stop))
+        try:
+            while True:
+                item = await chunks.get()
+                if item is None:
+                    return
+                if isinstance(item, LLMClientError):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
+    def stats(self) -> dict[str, float | int]:
+        return self._stats.snapshot()
+
+    def reset_stats(self) -> None:
+        self._stats.reset()
+
+    # -- internals (run on the client's loop) ------------------------------
+
+    def _chat_result(self, obj: dict, latency: float) -> ChatResult:
+        prompt, completion = _usage(obj)
+        return ChatResult(
+            text=chat_text(obj),
+            prompt_tokens=prompt,
+            completion_tokens=completion,
+            latency_s=latency,
+            raw=obj,
+        )
+
+    async def _send(self, url: str, body: bytes, headers: dict[str, str], timeout_s: float) -> tuple[int, bytes]:
+        session = self._session
+        if session is None:
+            return await asyncio.to_thread(_urllib_send, url, body, {**_JSON_HEADERS, **headers}, timeout_s)
+        import aiohttp
+
+        async with session.post(
+            url, data=body, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout_s)
+        ) as resp:
+            return resp.status, await resp.read()
+
+    async def _post(
+        self,
+        url: str,
+        payload: dict,
+        headers: dict[str, str] | None,
+        timeout_s: float | None,
+        retries: int | None,
+    ) -> dict:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        attempts = (self.retries if retries is None else max(0, retries)) + 1
+        for attempt in range(attempts):
+            t0 = time.monotonic()
+            try:
+                async with self._semaphore:
+                    status, raw = await self._send(url, body, headers or {}, timeout_s or self.timeout_s)
+            except TimeoutError:
+                err = LLMClientError(f"timeout after {timeout_s or self.timeout_s}s: {url}", retryable=True)
+            except Exception as exc:
+                err = LLMClientError(f"connection error: {exc}", retryable=True)
+            else:
+                if status < 400:
+                    try:
+                        obj = json.loads(raw)
+                    except ValueError as exc:
+                        self._stats.error()
+                        raise LLMClientError(f"invalid JSON in response: {exc}", status=status) from exc
+                    self._stats.ok(time.monotonic() - t0, obj)
+                    return obj
+                snippet = raw[:200].decode("utf-8", errors="replace")
+                err = LLMClientError(f"HTTP {status}: {snippet}", status=status, retryable=status in RETRY_STATUSES)
+            if not err.retryable or attempt == attempts - 1:
+                self._stats.error()
+                raise err
+            self._stats.retry()
+            await asyncio.sleep(_backoff(attempt, self.backoff_s))
+        raise AssertionError("unreachable")
+
+    async def _stream(
+        self,
+        url: str,
+        payload: dict,
+        headers: dict[str, str] | None,
+        timeout_s: float | None,
+        put: Callable[[object], None],
+        stop: threading.Event,
+    ) -> None:
+        """Feed *put* with: content deltas, then [LLMClientError], then None."""
+        body = json.dumps({**payload, "stream": True}, ensure_ascii=False).encode("utf-8")
+        timeout_s = timeout_s or self.timeout_s
+        headers = {**(headers or {}), "Accept": "text/event-stream"}
+        t0 = time.monotonic()
+        last: dict | None = None
+        try:
+            session = self._session
+            async with self._semaphore:
+                if session is None:
+                    last = await asyncio.to_thread(self._urllib_stream, url, body, headers, timeout_s, put, stop)
+                else:
+                    last = await self._aiohttp_stream(session, url, body, headers, timeout_s, put, stop)
+        except LLMClientError as exc:
+            self._stats.error()
+            put(exc)
+        except TimeoutError:
+            self._stats.error()
+            put(LLMClientError(f"timeout after {timeout_s}s: {url}", retryable=True))
+        except Exception as exc:
+            self._stats.error()
+            put(LLMClientError(f"connection error: {exc}", retryable=True))
+        else:
+            self._stats.ok(time.monotonic() - t0, last)
+        put(None)
+
+    @staticmethod
+    async def _aiohttp_stream(session: aiohttp.ClientSession, url, body, headers, timeout_s, put, stop) -> dict | None:
+        import aiohttp
+
+        last = None
+        async with session.post(
+            url, data=body, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout_s)
+        ) as resp:
+            if resp.status >= 400:
+                snippet = (await resp.read())[:200].decode("utf-8", errors="replace")
+                raise LLMClientError(f"HTTP {resp.status}: {snippet}", resp.status, resp.status in RETRY_STATUSES)
+            async for line in resp.content:
+                if stop.is_set():
+                    break
+                delta, obj, done = _sse_delta(line)
+                if obj is not None:
+                    last = obj
+                if delta:
+                    put(delta)
+                if done:
+                    break
+        return last
+
+    @staticmethod
+    def _urllib_stream(url, body, headers, timeout_s, put, stop) -> dict | None:
+        req = urllib.request.Request(url, data=body, headers={**_JSON_HEADERS, **headers}, method="POST")
+        last = None
+        try:
+            resp = urllib.request.urlopen(req, timeout=timeout_s)
+        except urllib.error.HTTPError as exc:
+            snippet = (exc.read() or b"")[:200].decode("utf-8", errors="replace")
+            raise LLMClientError(f"HTTP {exc.code}: {snippet}", exc.code, exc.code in RETRY_STATUSES) from exc
+        with resp:
+            for line in resp:
+                if stop.is_set():
+                    break
+                delta, obj, done = _sse_delta(line)
+                if obj is not None:
+                    last = obj
+                if delta:
+                    put(delta)
+                if done:
+                    break
+        return last
+
+
+_client: LLMClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_llm_client() -> LLMClient:
+    """Return the process-wide client (created on first use)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = LLMClient()
+        return _client
+
+
+def llm_client_stats() -> dict[str, float | int]:
+    """Counters of the process-wide client without creating it (zeros when unused)."""
+    with _client_lock:
+        client = _client
+    if client is None:
+        return _Stats().snapshot()
+    return client.stats()
+
+
+def reset_llm_client() -> None:
+    """Close and drop the process-wide client (tests / settings changes)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
@@ -24,6 +24,7 @@ class EnrichStats:
     fail: int = 0
     fail_reasons: dict[str, int] = field(default_factory=dict)
     latencies: list[float] = field(default_factory=list)
+    cache_hits: int = 0  # served from utils/fulltext_cache (not counted in attempted)
 
     def record_success(self, latency: float) -> None:
         self.attempted += 1
@@ -99,14 +100,49 @@ class MetricsCollector:
         self.entity_after_count: int = 0
         self.entity_noise_removed: int = 0
 
+        # LLM response cache (utils/llm_cache), counted from start() to stop()
+        self.llm_cache_hits: int = 0
+        self.llm_cache_misses: int = 0
+        self._llm_cache_base: dict[str, int] = {}
+
+        # Shared LLM HTTP client (utils/llm_client), counted from start() to stop()
+        self.llm_requests: int = 0
+        self.llm_retries: int = 0
+        self.llm_errors: int = 0
+        self.llm_prompt_tokens: int = 0
+        self.llm_completion_tokens: int = 0
+        self.llm_latency_p50: float = 0.0
+        self.llm_latency_p95: float = 0.0
+        self._llm_client_base: dict[str, float | int] = {}
+
     def start(self) -> None:
         from datetime import UTC, datetime
 
+        from utils.llm_cache import llm_cache_stats
+        from utils.llm_client import llm_client_stats
+
         self._t_start = time.time()
         self.timestamp = datetime.now(UTC).isoformat()
+        self._llm_cache_base = llm_cache_stats()
+        self._llm_client_base = llm_client_stats()
 
     def stop(self) -> None:
+        from utils.llm_cache import llm_cache_stats
+        from utils.llm_client import llm_client_stats
+
         self.total_runtime_seconds = round(time.time() - self._t_start, 2)
+        stats = llm_cache_stats()
+        self.llm_cache_hits = max(0, stats["hits"] - self._llm_cache_base.get("hits", 0))
+        self.llm_cache_misses = max(0, stats["misses"] - self._llm_cache_base.get("misses", 0))
+        client = llm_client_stats()
+        base = self._llm_client_base
+        self.llm_requests = int(max(0, client["requests"] - base.get("requests", 0)))
+        self.llm_retries = int(max(0, client["retries"] - base.get("retries", 0)))
+        self.llm_errors = int(max(0, client["errors"] - base.get("errors", 0)))
+        self.llm_prompt_tokens = int(max(0, client["prompt_tokens"] - base.get("prompt_tokens", 0)))
+        self.llm_completion_tokens = int(max(0, client["completion_tokens"] - base.get("completion_tokens", 0)))
+        self.llm_latency_p50 = float(client["latency_p50"])
+        self.llm_latency_p95 = float(client["latency_p95"])
 
     def record_entity_cleaning(self, before: int, after: int) -> None:
         self.entity_before_count += before
@@ -152,9 +188,19 @@ class MetricsCollector:
             "enrich_fail_reasons": self.enrich_stats.fail_reasons,
             "enrich_latency_p50": self.enrich_stats.latency_p50,
             "enrich_latency_p95": self.enrich_stats.latency_p95,
+            "enrich_cache_hits": self.enrich_stats.cache_hits,
             "entity_before_count": self.entity_before_count,
             "entity_after_count": self.entity_after_count,
             "entity_noise_removed": self.entity_noise_removed,
+            "llm_cache_hits": self.llm_cache_hits,
+            "llm_cache_misses": self.llm_cache_misses,
+            "llm_requests": self.llm_requests,
+            "llm_retries": self.llm_retries,
+            "llm_errors": self.llm_errors,
+            "llm_prompt_tokens": self.llm_prompt_tokens,
+            "llm_completion_tokens": self.llm_completion_tokens,
+            "llm_latency_p50": self.llm_latency_p50,
+            "llm_latency_p95": self.llm_latency_p95,
         }
 
     def write_json(self, output_dir: str | Path | None = None) -> Path:
@@ -1,6 +1,7 @@
-"""utils/ollama_client.py — Stdlib-only Ollama HTTP client.
+"""utils/ollama_client.py — Ollama HTTP client.
 
-No pip dependencies. Uses urllib only.
+Requests go through the shared pooled client (utils/llm_client), which uses
+aiohttp keep-alive connections when installed and urllib otherwise.
 
 Environment variables (read at import time):
     OLLAMA_HOST   : host:port  (default 127.0.0.1:11434)
@@ -12,6 +13,8 @@ Public API
     generate(prompt, model=None, temperature=0, num_ctx=1536, num_predict=512) -> str
         Call /api/generate and return response text.
         Retries up to 2 times on transient failure.
+        Responses are kept in the persistent LLM response cache
+        (utils/llm_cache), so identical requests skip the daemon.
 
     is_available() -> bool
         Quick liveness check against /api/tags.
@@ -20,11 +23,12 @@ from __future__ import annotations
 
 import json
 import os
-import time
-import urllib.error
 import urllib.request
 from typing import Any
 
+from utils.llm_cache import get_llm_cache
+from utils.llm_client import LLMClientError, get_llm_client
+
 # ---------------------------------------------------------------------------
 # Configuration from environment
 # ---------------------------------------------------------------------------
@@ -48,19 +52,9 @@ BASE_URL = f"http://{OLLAMA_HOST}"
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _post_json(path: str, payload: dict, timeout: int) -> dict:
+def _post_json(path: str, payload: dict, timeout: int, retries: int = 0) -> dict:
     """POST JSON to Ollama and return parsed response dict."""
-    url  = f"{BASE_URL}{path}"
-    data = json.dumps(payload).encode("utf-8")
-    req  = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        raw = resp.read()
-    return json.loads(raw)
+    return get_llm_client().post_json(f"{BASE_URL}{path}", payload, timeout_s=timeout, retries=retries)
 
 
 def _get_json(path: str, timeout: int = 10) -> dict:
@@ -136,21 +130,25 @@ def generate(
         },
     }
 
-    last_err: Exception | None = None
-    for attempt in range(max_retries + 1):
+    def _request() -> str:
         try:
-            resp = _post_json("/api/generate", payload, _timeout)
-            text = resp.get("response", "").strip()
-            return text
-        except (urllib.error.URLError, OSError, TimeoutError) as exc:
-            last_err = exc
-            if attempt < max_retries:
-                time.sleep(2 ** attempt)  # 1s, 2s back-off
-        except json.JSONDecodeError as exc:
-            last_err = exc
-            break  # malformed JSON — no point retrying
-
-    raise RuntimeError(
-        f"ollama_client.generate failed after {max_retries + 1} attempts "
-        f"(model={_model!r}, host={BASE_URL!r}): {last_err}"
+            resp = _post_json("/api/generate", payload, _timeout, max_retries)
+        except LLMClientError as exc:
+            raise RuntimeError(
+                f"ollama_client.generate failed (model={_model!r}, host={BASE_URL!r}): {exc}"
+            ) from exc
+        return resp.get("response", "").strip()
+
+    cache = get_llm_cache()
+    if cache is None:
+        return _request()
+    return cache.get_or_call(
+        _request,
+        f"{BASE_URL}/api/generate",
+        _model,
+        temperature,
+        prompt,
+        top_p=top_p,
+        num_ctx=num_ctx,
+        num_predict=num_predict,
     )
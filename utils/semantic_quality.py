@@ -13,6 +13,8 @@ from __future__ import annotations
 
 import re
 
+from utils.text_features import text_features
+
 # ---------------------------------------------------------------------------
 # Sentence boundary
 # ---------------------------------------------------------------------------
@@ -117,16 +119,9 @@ def count_evidence_terms(text: str) -> int:
     """
     if not text:
         return 0
-    seen: set[str] = set()
-
-    for m in _DOMAIN_TERM_RE.finditer(text):
-        seen.add(m.group().lower())
-
-    for m in _PROPER_NOUN_RE.finditer(text):
-        token = m.group()
-        if token not in _STOPWORDS_EN:
-            seen.add(token.lower())
-
+    feats = text_features(text)
+    seen: set[str] = {term.lower() for term in feats.findall(_DOMAIN_TERM_RE)}
+    seen.update(tok.lower() for tok in feats.findall(_PROPER_NOUN_RE) if tok not in _STOPWORDS_EN)
     return len(seen)
 
 
@@ -134,14 +129,14 @@ def count_evidence_numbers(text: str) -> int:
     """Count numeric evidence markers ($X, N%, vN.M, ratios, years, units)."""
     if not text:
         return 0
-    return len(_EVIDENCE_NUM_RE.findall(text))
+    return len(text_features(text).findall(_EVIDENCE_NUM_RE))
 
 
 def count_sentences(text: str) -> int:
     """Count sentences by sentence-ending punctuation. Minimum 1 if non-empty."""
     if not text or not text.strip():
         return 0
-    count = len(_SENTENCE_END_RE.findall(text))
+    count = text_features(text).count(_SENTENCE_END_RE)
     return max(count, 1)
 
 
@@ -0,0 +1,158 @@
+"""Shared per-text feature index read by every content / density gate.
+
+The same item body is scanned by several independent gates in one run —
+``core/content_gate`` (density score, hard-reject keywords, sentence count;
+up to three times per item in the adaptive gate), ``core/info_density``
+(once per density kind), ``utils/semantic_quality``, ``utils/text_quality``,
+``utils/topic_router.classify_channels`` and
+``core/ai_core.classify_content``.  Each of them used to lower-case,
+split and regex-scan the full text again.
+
+``text_features(text)`` returns one ``TextFeatures`` object per distinct text
+(bounded LRU keyed by a digest of the text).  Features are computed lazily and
+memoized on that object:
+
+  - ``lower`` / ``stripped`` / ``collapsed``   normalized views
+  - ``findall(rx)`` / ``count(rx)`` / ``has(rx)``  per-pattern hit tables
+  - ``parts(rx)``                               sentence spans for a splitter
+  - ``keyword_hits(keywords)``                  substring hits in ``lower``
+  - ``keyword_counts(matcher)``                 per-list hits of a compiled table
+  - ``cjk_ratio``                               share of CJK ideographs
+  - ``memo(key, fn)``                           any gate-specific derived value
+
+Gates keep their own patterns, so results are identical to scanning the text
+directly; only repeated work is removed.  The cache is keyed by content, not
+object identity, so a changed body simply gets a new entry.  Most gates build
+their own string (title + summary, title + body, a stripped body ...), so
+sharing is mostly between repeated calls of the same gate on one item (the
+adaptive content gate, the per-kind density gates); gates that do pass the
+same string share its entry too.
+
+Each entry keeps the text and its hit tables alive, so the LRU is kept small.
+
+Env overrides:
+  TEXT_FEATURES_CACHE_SIZE  distinct texts kept, default 512 (0 disables)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from utils.keyword_matcher import KeywordMatcher, keyword_matcher
+
+_CACHE_SIZE = int(os.getenv("TEXT_FEATURES_CACHE_SIZE", "512"))
+
+_WS_RE = re.compile(r"\s+")
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+
+
+class TextFeatures:
+    """Lazily computed, memoized features of one text."""
+
+    __slots__ = ("_memo", "text")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._memo: dict[Any, Any] = {}
+
+    def memo(self, key: Any, fn: Callable[[str], Any]) -> Any:
+        """Return ``fn(text)``, computed at most once per *key*."""
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = fn(self.text)
+            return value
+
+    @property
+    def lower(self) -> str:
+        return self.memo("lower", str.lower)
+
+    @property
+    def stripped(self) -> TextFeatures:
+        """Features of ``text.strip()`` (``self`` when nothing is stripped)."""
+        return self.memo("stripped", lambda t: _derived(self, t.strip()))
+
+    @property
+    def collapsed(self) -> TextFeatures:
+        """Features of the text with whitespace runs collapsed to one space."""
+        return self.memo("collapsed", lambda t: _derived(self, _WS_RE.sub(" ", t).strip()))
+
+    @property
+    def cjk_ratio(self) -> float:
+        """Share of CJK ideographs among non-whitespace characters."""
+
+        def _ratio(t: str) -> float:
+            visible = len(t) - sum(1 for ch in t if ch.isspace())
+            return self.count(_CJK_RE) / visible if visible else 0.0
+
+        return self.memo("cjk_ratio", _ratio)
+
+    def findall(self, pattern: re.Pattern[str]) -> list[Any]:
+        """``pattern.findall(text)``, scanned once per pattern."""
+        return self.memo(("findall", pattern), pattern.findall)
+
+    def count(self, pattern: re.Pattern[str]) -> int:
+        return len(self.findall(pattern))
+
+    def has(self, pattern: re.Pattern[str]) -> bool:
+        """``pattern.search(text) is not None``; reuses a cached findall."""
+        cached = self._memo.get(("findall", pattern))
+        if cached is not None:
+            return bool(cached)
+        return self.memo(("has", pattern), lambda t: pattern.search(t) is not None)
+
+    def parts(self, pattern: re.Pattern[str]) -> list[str]:
+        """Non-empty stripped pieces of ``pattern.split(text)`` (sentence spans)."""
+        return self.memo(
+            ("parts", pattern),
+            lambda t: [p.strip() for p in pattern.split(t) if p.strip()],
+        )
+
+    def keyword_hits(self, keywords: Iterable[str]) -> int:
+        """Number of *keywords* that occur as substrings of ``lower``."""
+        if isinstance(keywords, (set, frozenset)):
+            keywords = frozenset(keywords)
+        elif not isinstance(keywords, tuple):
+            keywords = tuple(keywords)
+        return self.memo(("keywords", keywords), lambda _t: keyword_matcher(keywords).count(self.lower))
+
+    def keyword_counts(self, matcher: KeywordMatcher) -> dict[str, int]:
+        """``matcher.counts(lower)``: per-list keyword hits of a compiled table."""
+        return self.memo(("keyword_counts", matcher), lambda _t: matcher.counts(self.lower))
+
+
+def _derived(parent: TextFeatures, text: str) -> TextFeatures:
+    return parent if text == parent.text else text_features(text)
+
+
+_cache: OrderedDict[bytes, TextFeatures] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def text_features(text: str | None) -> TextFeatures:
+    """Return the shared ``TextFeatures`` for *text* (``None`` is treated as "")."""
+    text = text or ""
+    if _CACHE_SIZE <= 0:
+        return TextFeatures(text)
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _cache_lock:
+        feats = _cache.get(key)
+        if feats is not None:
+            _cache.move_to_end(key)
+            return feats
+        feats = _cache[key] = TextFeatures(text)
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+        return feats
+
+
+def clear_text_features() -> None:
+    """Drop every cached entry (tests / long-running processes)."""
+    with _cache_lock:
+        _cache.clear()
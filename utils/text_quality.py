@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import re
 
+from utils.text_features import text_features
+
 # High-risk trailing words that indicate a sentence was cut mid-thought.
 _TRAILING_ZH = ("的", "了", "而", "與", "來", "記", "是", "在", "和", "或", "及", "對", "從", "向", "把", "被", "讓", "給")
 _TRAILING_EN_RE = re.compile(
@@ -122,12 +124,12 @@ def is_fragment(text: str) -> bool:
 
 def count_evidence_terms(text: str) -> int:
     """Count AI-domain evidence terms in text."""
-    return len(_EVIDENCE_TERM_RE.findall(text))
+    return text_features(text).count(_EVIDENCE_TERM_RE)
 
 
 def count_evidence_numbers(text: str) -> int:
     """Count numeric evidence markers ($X, N%, vN.M, etc.)."""
-    return len(_EVIDENCE_NUM_RE.findall(text))
+    return text_features(text).count(_EVIDENCE_NUM_RE)
 
 
 def count_sentences(text: str) -> int:
@@ -135,5 +137,5 @@ def count_sentences(text: str) -> int:
     if not text or not text.strip():
         return 0
     # Count sentence boundaries; minimum 1 if text is non-empty.
-    count = len(_SENTENCE_END_RE.findall(text))
+    count = text_features(text).count(_SENTENCE_END_RE)
     return max(count, 1) if text.strip() else 0
@@ -2,10 +2,30 @@
 and gate irrelevant non-AI content (e.g. building/real-estate noise).
 
 All logic is regex + keyword only — stdlib only, no network calls, no API keys.
+
+One run asks about the same text several times: the Z0 injection block
+classifies deduped items for Tracks B/C and again in its channel gate, and
+``select_executive_items`` calls ``is_relevant_ai`` (which classifies) and then
+``classify_channels`` on every card.  Both public functions therefore answer
+from a per-run memo keyed by (SHA-256 of the text, url, source_platform);
+callers get their own copy of each result.  ``reset_channel_cache()`` starts a
+new run and ``channel_cache_stats()`` reports hits / misses / hit rate.
+
+Env overrides:
+  TOPIC_ROUTER_CACHE_SIZE  memoized results per function, default 8192
+                           (0 disables)
 """
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import threading
+from collections import OrderedDict
+
+from utils.text_features import TextFeatures, text_features
+
+_CACHE_SIZE = int(os.getenv("TOPIC_ROUTER_CACHE_SIZE", "8192"))
 
 # ---------------------------------------------------------------------------
 # Company / model whitelist — fast-pass relevance
@@ -166,17 +186,71 @@ _NUMBER_BOOST_RE = re.compile(
 )
 
 
-def _count_hits(text: str, en_re: re.Pattern, zh_re: re.Pattern) -> int:
+def _count_hits(feats: TextFeatures, en_re: re.Pattern, zh_re: re.Pattern) -> int:
     """Count total keyword hits across English and Chinese patterns."""
-    return len(en_re.findall(text)) + len(zh_re.findall(text))
+    return feats.count(en_re) + feats.count(zh_re)
 
 
-def _has_ai_core(text: str) -> bool:
-    return bool(_AI_CORE_EN_RE.search(text)) or bool(_AI_CORE_ZH_RE.search(text))
+def _has_ai_core(feats: TextFeatures) -> bool:
+    return feats.has(_AI_CORE_EN_RE) or feats.has(_AI_CORE_ZH_RE)
 
 
-def _has_building(text: str) -> bool:
-    return bool(_BUILDING_EN_RE.search(text)) or bool(_BUILDING_ZH_RE.search(text))
+def _has_building(feats: TextFeatures) -> bool:
+    return feats.has(_BUILDING_EN_RE) or feats.has(_BUILDING_ZH_RE)
+
+
+# ---------------------------------------------------------------------------
+# Per-run memo
+# ---------------------------------------------------------------------------
+
+_memo: dict[str, OrderedDict[tuple, object]] = {"channel": OrderedDict(), "relevance": OrderedDict()}
+_memo_stats: dict[str, int] = {
+    "channel_hits": 0, "channel_misses": 0, "relevance_hits": 0, "relevance_misses": 0,
+}
+_memo_lock = threading.Lock()
+
+
+def _memo_key(text: str, *parts: str) -> tuple:
+    return (hashlib.sha256(text.encode("utf-8", "surrogatepass")).digest(), *parts)
+
+
+def _memo_get(kind: str, key: tuple):
+    with _memo_lock:
+        table = _memo[kind]
+        value = table.get(key)
+        if value is None:
+            _memo_stats[f"{kind}_misses"] += 1
+            return None
+        table.move_to_end(key)
+        _memo_stats[f"{kind}_hits"] += 1
+        return value
+
+
+def _memo_put(kind: str, key: tuple, value) -> None:
+    with _memo_lock:
+        table = _memo[kind]
+        table[key] = value
+        if len(table) > _CACHE_SIZE:
+            table.popitem(last=False)
+
+
+def reset_channel_cache() -> None:
+    """Drop memoized results and zero the counters.  Call at the start of each run."""
+    with _memo_lock:
+        for table in _memo.values():
+            table.clear()
+        for k in _memo_stats:
+            _memo_stats[k] = 0
+
+
+def channel_cache_stats() -> dict:
+    """Hits / misses / hit rate of the ``classify_channels`` and ``is_relevant_ai`` memo."""
+    with _memo_lock:
+        stats: dict = dict(_memo_stats)
+    for kind in ("channel", "relevance"):
+        total = stats[f"{kind}_hits"] + stats[f"{kind}_misses"]
+        stats[f"{kind}_hit_rate"] = round(stats[f"{kind}_hits"] / total, 3) if total else 0.0
+    return stats
 
 
 # ---------------------------------------------------------------------------
@@ -199,8 +273,20 @@ def classify_channels(
 
     best_channel is determined by raw hit count (before capping) so that
     domain-specific content isn't over-shadowed by generic product keywords.
+    Results are memoized per run (see module docstring).
     """
-    full = f"{text} {url} {source_platform}"
+    if _CACHE_SIZE <= 0:
+        return _classify_channels(text, url, source_platform)
+    key = _memo_key(text, url, source_platform)
+    result = _memo_get("channel", key)
+    if result is None:
+        result = _classify_channels(text, url, source_platform)
+        _memo_put("channel", key, result)
+    return {**result, "reasons": list(result["reasons"])}
+
+
+def _classify_channels(text: str, url: str, source_platform: str) -> dict:
+    full = text_features(f"{text} {url} {source_platform}")
 
     # Raw hit counts (used for best_channel tiebreaking)
     raw: dict[str, int] = {
@@ -227,11 +313,11 @@ def classify_channels(
     # hits of the leader, prefer tech — but ONLY when the leader is "business"
     # or "dev" (never steal from "product" which has its own KPI quota gate).
     if best_channel in ("business", "dev") and raw["tech"] >= raw[best_channel] - 2:
-        if _STRONG_TECH_RE.search(full):
+        if full.has(_STRONG_TECH_RE):
             best_channel = "tech"
 
     # Convert to 0-100 scores with number boost
-    num_boost = 20 if _NUMBER_BOOST_RE.search(full) else 0
+    num_boost = 20 if full.has(_NUMBER_BOOST_RE) else 0
 
     def _score(hits: int) -> int:
         if hits == 0:
@@ -273,8 +359,21 @@ def is_relevant_ai(
 
     REJECT if:
       - Building / real-estate hit AND no AI core keyword  (hard negative)
+
+    Results are memoized per run (see module docstring).
     """
-    full_text = f"{text} {url}"
+    if _CACHE_SIZE <= 0:
+        return _is_relevant_ai(text, url, domain)
+    key = _memo_key(text, url)
+    result = _memo_get("relevance", key)
+    if result is None:
+        result = _is_relevant_ai(text, url, domain)
+        _memo_put("relevance", key, result)
+    return result[0], list(result[1])
+
+
+def _is_relevant_ai(text: str, url: str, domain: str) -> tuple[bool, list[str]]:
+    full_text = text_features(f"{text} {url}")
 
     ai_core_hit = _has_ai_core(full_text)
     building_hit = _has_building(full_text)
@@ -284,7 +383,7 @@ def is_relevant_ai(
         return False, ["hard_neg:building_real_estate_no_ai_core"]
 
     # Whitelist fast-pass
-    if _COMPANY_WHITELIST_RE.search(full_text) or _MODEL_WHITELIST_RE.search(full_text):
+    if full_text.has(_COMPANY_WHITELIST_RE) or full_text.has(_MODEL_WHITELIST_RE):
         return True, ["whitelist:company_or_model"]
 
     # Channel score check
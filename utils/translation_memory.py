@@ -0,0 +1,144 @@
+"""Persistent translation memory for the Markdown → Traditional Chinese step.
+
+``scripts/run_once._translate_md_to_zh`` translates ``latest_brief.md`` every
+run, although most of it — section headers, boilerplate table rows, repeated
+labels, paragraphs of items still in the window — is identical to the
+previous run.  This store maps ``sha256(namespace, normalized source)`` to the
+translation, so those paragraphs are served from disk instead of the model.
+
+Normalization (``normalize_source``) unifies line endings and collapses runs
+of spaces / tabs, so whitespace-only differences still hit.  The namespace is
+chosen by the caller (system prompt + model) so a prompt change starts a new
+memory instead of mixing styles.
+
+Unlike ``utils/llm_cache`` entries do not expire; the table is bounded to
+``TRANSLATION_MEMORY_MAX_ENTRIES`` rows with least-recently-used eviction.
+
+Env overrides:
+  TRANSLATION_MEMORY_ENABLED      1/0, default 1
+  TRANSLATION_MEMORY_PATH         default <repo>/data/translation_memory.db
+  TRANSLATION_MEMORY_MAX_ENTRIES  default 50000
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+_DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "translation_memory.db"
+_MAX_ENTRIES = int(os.getenv("TRANSLATION_MEMORY_MAX_ENTRIES", "50000"))
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS translation_memory (
+    key          TEXT PRIMARY KEY,
+    source       TEXT NOT NULL,
+    translation  TEXT NOT NULL,
+    last_used    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_translation_memory_last_used ON translation_memory(last_used);
+"""
+
+_RE_HSPACE = re.compile(r"[ \t]+")
+
+
+def normalize_source(text: str) -> str:
+    """CRLF/CR → LF, collapse spaces/tabs, strip each line and the whole text."""
+    text = (text or "").replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(_RE_HSPACE.sub(" ", line).strip() for line in text.split("\n")).strip()
+
+
+def tm_key(source: str, namespace: str = "") -> str:
+    """Stable hash of one normalized source segment within *namespace*."""
+    blob = f"{namespace}\x00{normalize_source(source)}"
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class TranslationMemory:
+    """Thread-safe SQLite source → translation store with an LRU bound."""
+
+    def __init__(self, path: Path, max_entries: int = _MAX_ENTRIES) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(_DDL)
+        self._conn.commit()
+
+    def get(self, source: str, namespace: str = "") -> str | None:
+        """Return the stored translation of *source*, or None."""
+        key = tm_key(source, namespace)
+        with self._lock:
+            row = self._conn.execute("SELECT translation FROM translation_memory WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE translation_memory SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return row[0]
+
+    def put(self, source: str, translation: str, namespace: str = "") -> bool:
+        """Store *translation* of *source*; blank values are skipped. Returns True when stored."""
+        if not normalize_source(source) or not translation.strip():
+            return False
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO translation_memory (key, source, translation, last_used)
+                   VALUES (?, ?, ?, ?)""",
+                (tm_key(source, namespace), normalize_source(source), translation, time.time()),
+            )
+            self.stores += 1
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM translation_memory").fetchone()
+            if self.max_entries > 0 and count > self.max_entries:
+                self._conn.execute(
+                    """DELETE FROM translation_memory WHERE key IN
+                       (SELECT key FROM translation_memory ORDER BY last_used LIMIT ?)""",
+                    (count - self.max_entries,),
+                )
+            self._conn.commit()
+        return True
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "stores": self.stores}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_memory: TranslationMemory | None = None
+_memory_lock = threading.Lock()
+
+
+def get_translation_memory() -> TranslationMemory | None:
+    """Return the process-wide memory, or None when disabled / unavailable."""
+    global _memory
+    if os.getenv("TRANSLATION_MEMORY_ENABLED", "1").strip().lower() in ("0", "false", "no"):
+        return None
+    with _memory_lock:
+        if _memory is None:
+            raw = os.getenv("TRANSLATION_MEMORY_PATH", "").strip()
+            try:
+                _memory = TranslationMemory(Path(raw) if raw else _DEFAULT_PATH)
+            except (OSError, sqlite3.Error):
+                return None
+        return _memory
+
+
+def reset_translation_memory() -> None:
+    """Close and drop the process-wide memory (tests / path changes)."""
+    global _memory
+    with _memory_lock:
+        if _memory is not None:
+            _memory.close()
+        _memory = None